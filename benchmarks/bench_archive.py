@@ -0,0 +1,94 @@
+"""
+    Backfilling a range of archive data one window after another against several windows in flight.
+
+    The fake Datamanager makes up a sample every 5 minutes for each channel and takes `responseDelay` seconds over
+    each response,  as a real one does while it reads its log.   The series returned are checked against the values
+    the fake made up,  and the memory they hold is compared with the decoded responses they were parsed from.
+
+    python benchmarks/bench_archive.py [days] [responseDelay] [parallel]
+"""
+
+import datetime
+import json
+import sys
+import time
+import tracemalloc
+
+from fakedatamanager import FakeDatamanager, archiveValue, projectPath
+
+projectPath()
+from frosolar import Fronius
+from archive import ArchiveClient, archiveWindows
+
+days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+parallel = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+CHANNELS = ['EnergyReal_WAC_Sum_Produced', 'PowerReal_PAC_Sum']
+ENDDATE = datetime.date(2018, 6, 30)
+
+
+def backfill(fronius, maxParallelRequests):
+    client = ArchiveClient(fronius, maxParallelRequests=maxParallelRequests)
+    start = time.perf_counter()
+    series = client.fetch(CHANNELS, ENDDATE - datetime.timedelta(days=days - 1), ENDDATE)
+    return series, time.perf_counter() - start
+
+
+def checked(series):
+    """
+    :return:    Number of samples,  after checking every one against the value the fake made up
+    """
+    count = 0
+    for (channel, _), channelseries in series.items():
+        for timestamp, value in zip(channelseries.timestamps, channelseries.values):
+            if value != archiveValue(channel, timestamp):
+                raise ValueError('{0} at {1}: {2}'.format(channel, timestamp, value))
+        if any(later <= earlier for earlier, later in zip(channelseries.timestamps, channelseries.timestamps[1:])):
+            raise ValueError('{0} is not in time order'.format(channel))
+        count += len(channelseries.timestamps)
+    return count
+
+
+def memoryHeld(build):
+    tracemalloc.start()
+    held = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+
+def decodedResponses(fronius):
+    """
+    :return:    The decoded responses of the whole range,  as holding them without parsing would
+    """
+    responses = []
+    for start, end in archiveWindows(ENDDATE - datetime.timedelta(days=days - 1), ENDDATE):
+        for channel in CHANNELS:
+            url = ("http://{0}/solar_api/v1/GetArchiveData.cgi?Scope=System&SeriesType=Detail&StartDate={1}"
+                   "&EndDate={2}&Channel={3}".format(fronius.host, start, end, channel))
+            responses.append(json.loads(fronius.session.get(url).content))
+    return responses
+
+
+if __name__ == "__main__":
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        fronius = Fronius(server.host, lazy=True, poolSize=parallel)
+        server.archiveRequests = 0
+        serial, serialTime = backfill(fronius, 1)
+        requests = server.archiveRequests
+        concurrent, concurrentTime = backfill(fronius, parallel)
+        _, arraysize = memoryHeld(lambda: backfill(fronius, parallel)[0])
+        _, jsonsize = memoryHeld(lambda: decodedResponses(fronius))
+        fronius.close()
+
+    samples = checked(concurrent)
+    if checked(serial) != samples:
+        raise ValueError('The serial and parallel backfills differ')
+    print("days                        {0:8d}   {1} channels,  {2} requests,  {3} samples".format(days, len(CHANNELS),
+                                                                                              requests, samples))
+    print("one window at a time        {0:8.2f} s".format(serialTime))
+    print("{0} windows in flight         {1:8.2f} s".format(parallel, concurrentTime))
+    print("speedup                     {0:8.1f} x".format(serialTime / concurrentTime))
+    print("typed arrays                {0:8.1f} MiB   decoded responses {1:8.1f} MiB".format(arraysize / 2 ** 20,
+                                                                                          jsonsize / 2 ** 20))
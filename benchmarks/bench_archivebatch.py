@@ -0,0 +1,58 @@
+"""
+    Backfilling several archive channels with one channel per request against several channels packed into each.
+
+    The fake Datamanager takes `responseDelay` seconds over each response whatever it holds,  as a real one spends
+    most of a request finding its place in the log.   Both backfills must return exactly the same series.
+
+    python benchmarks/bench_archivebatch.py [days] [responseDelay] [parallel]
+"""
+
+import datetime
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from archive import ArchiveClient, ARCHIVEMAXCHANNELS
+
+days = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+parallel = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+CHANNELS = ['EnergyReal_WAC_Sum_Produced', 'PowerReal_PAC_Sum', 'Voltage_AC_Phase_1', 'Voltage_AC_Phase_2',
+            'Voltage_AC_Phase_3', 'Current_AC_Phase_1']
+ENDDATE = datetime.date(2018, 6, 30)
+
+
+def backfill(server, fronius, maxChannels):
+    """
+    :return:    (series, seconds, requests)
+    """
+    client = ArchiveClient(fronius, maxParallelRequests=parallel, maxChannels=maxChannels)
+    server.archiveRequests = 0
+    start = time.perf_counter()
+    series = client.fetch(CHANNELS, ENDDATE - datetime.timedelta(days=days - 1), ENDDATE)
+    return series, time.perf_counter() - start, server.archiveRequests
+
+
+if __name__ == "__main__":
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        fronius = Fronius(server.host, lazy=True, poolSize=parallel)
+        single, singleTime, singleRequests = backfill(server, fronius, 1)
+        batched, batchedTime, batchedRequests = backfill(server, fronius, ARCHIVEMAXCHANNELS)
+        fronius.close()
+
+    if sorted(single) != sorted(batched) or len(single) != len(CHANNELS):
+        raise ValueError('The backfills returned different series')
+    for key, series in single.items():
+        if series.timestamps != batched[key].timestamps or series.values != batched[key].values:
+            raise ValueError('{0} differs between the backfills'.format(key))
+
+    samples = sum(len(series.timestamps) for series in batched.values())
+    print("days                        {0:8d}   {1} channels,  {2} samples".format(days, len(CHANNELS), samples))
+    print("one channel per request     {0:8.2f} s   {1:4d} requests".format(singleTime, singleRequests))
+    print("{0} channels per request      {1:8.2f} s   {2:4d} requests".format(ARCHIVEMAXCHANNELS, batchedTime,
+                                                                              batchedRequests))
+    print("speedup                     {0:8.1f} x".format(singleTime / batchedTime))
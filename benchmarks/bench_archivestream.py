@@ -0,0 +1,79 @@
+"""
+    Streaming a long archive range window by window against fetching all of it first.
+
+    The consumer sums each channel and spends `consumeDelay` seconds on every window,  as writing it somewhere would.
+    Reports the wall clock time and the peak memory (tracemalloc) of:
+        fetch()             the whole range held at once
+        iterWindows(0)      one window at a time,  nothing fetched ahead
+        iterWindows(1)      the next window fetched while the current one is used
+
+    python benchmarks/bench_archivestream.py [days] [responseDelay] [consumeDelay]
+"""
+
+import datetime
+import math
+import sys
+import time
+import tracemalloc
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from archive import ArchiveClient
+
+days = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+consumeDelay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+
+CHANNELS = ['EnergyReal_WAC_Sum_Produced', 'PowerReal_PAC_Sum']
+ENDDATE = datetime.date(2018, 6, 30)
+STARTDATE = ENDDATE - datetime.timedelta(days=days - 1)
+
+
+def consume(totals, series):
+    totals[series.channel] = totals.get(series.channel, 0.0) + sum(series.values)
+    time.sleep(consumeDelay)
+
+
+def fetchAll(client):
+    totals = {}
+    for series in client.fetch(CHANNELS, STARTDATE, ENDDATE).values():
+        #   The same work,  spread over the same number of windows
+        totals[series.channel] = totals.get(series.channel, 0.0) + sum(series.values)
+    time.sleep(consumeDelay * client.requests)
+    return totals
+
+
+def stream(client, prefetch):
+    totals = {}
+    for series in client.iterWindows(CHANNELS, STARTDATE, ENDDATE, prefetch=prefetch):
+        consume(totals, series)
+    return totals
+
+
+def measured(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+if __name__ == "__main__":
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        fronius = Fronius(server.host, lazy=True)
+        client = ArchiveClient(fronius, maxParallelRequests=2)
+        client.requests = len(client._requests(CHANNELS, STARTDATE, ENDDATE, 'System', 'Detail', None, None))
+        runs = [('fetch()', measured(lambda: fetchAll(client))),
+                ('iterWindows(prefetch=0)', measured(lambda: stream(client, 0))),
+                ('iterWindows(prefetch=1)', measured(lambda: stream(client, 1)))]
+        fronius.close()
+
+    print("days                        {0:8d}   {1} channels,  {2} requests".format(days, len(CHANNELS), client.requests))
+    for name, (totals, elapsed, peak) in runs:
+        if any(not math.isclose(total, runs[0][1][0][channel]) for channel, total in totals.items()):
+            raise ValueError('{0} gave different totals'.format(name))
+        print("{0:27s} {1:8.2f} s   peak {2:8.1f} MiB".format(name, elapsed, peak / 2 ** 20))
@@ -0,0 +1,71 @@
+"""
+    A nightly archive job:  fetching the last 15 days every night against an incremental ArchiveSync.
+
+    Runs `nights` nights,  each ending on the next day.   Reports the requests,  the channel days downloaded and the
+    time taken by each approach,  then checks that the samples the syncs handed over add up to exactly the whole range
+    fetched in one go,  with no sample missing or taken twice.
+
+    python benchmarks/bench_archivesync.py [nights] [responseDelay]
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from archive import ArchiveClient, ArchiveSync, ARCHIVESYNCDAYS
+
+nights = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+
+CHANNELS = ['EnergyReal_WAC_Sum_Produced', 'PowerReal_PAC_Sum']
+FIRSTNIGHT = datetime.date(2018, 6, 1)
+
+
+def nightly(server, run):
+    """
+    :return:    (requests,  channel days,  seconds) over every night
+    """
+    server.archiveRequests = 0
+    server.archiveChannelDays = 0
+    start = time.perf_counter()
+    for night in range(nights):
+        run(FIRSTNIGHT + datetime.timedelta(days=night))
+    return server.archiveRequests, server.archiveChannelDays, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with FakeDatamanager(responseDelay=responseDelay) as server, tempfile.TemporaryDirectory() as directory:
+        fronius = Fronius(server.host, lazy=True)
+        client = ArchiveClient(fronius)
+        sync = ArchiveSync(client, os.path.join(directory, 'archivesync.json'))
+
+        refetch = nightly(server, lambda end: client.fetch(CHANNELS, end - datetime.timedelta(days=ARCHIVESYNCDAYS),
+                                                           end))
+        taken = {}
+
+        def syncNight(end):
+            for series in sync.sync(CHANNELS, EndDate=end):
+                timestamps, values = taken.setdefault((series.channel, series.device), ([], []))
+                timestamps.extend(series.timestamps)
+                values.extend(series.values)
+
+        incremental = nightly(server, syncNight)
+        whole = client.fetch(CHANNELS, FIRSTNIGHT - datetime.timedelta(days=ARCHIVESYNCDAYS),
+                             FIRSTNIGHT + datetime.timedelta(days=nights - 1))
+        fronius.close()
+
+    for key, series in whole.items():
+        if taken[key] != (list(series.timestamps), list(series.values)):
+            raise ValueError('{0} synced {1} samples,  the whole range has {2}'.format(key, len(taken[key][0]),
+                                                                                     len(series.timestamps)))
+    print("nights                      {0:8d}   {1} channels".format(nights, len(CHANNELS)))
+    for name, (requests, channeldays, elapsed) in (('last 15 days every night', refetch),
+                                                   ('incremental sync', incremental)):
+        print("{0:27s} {1:8d} requests {2:6d} channel days {3:8.2f} s".format(name, requests, channeldays, elapsed))
+    print("synced samples match the whole range,  none missing or repeated")
@@ -0,0 +1,56 @@
+"""
+    Refresh of the realtime collections with AsyncFronius against the same refresh done one at a time by Fronius.
+
+    The fake Datamanager takes responseDelay seconds over every response,  so the concurrent refresh should
+    take roughly one delay rather than one delay per collection.
+
+    python benchmarks/bench_async.py [rounds] [responseDelay]
+"""
+
+import asyncio
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from asyncfrosolar import AsyncFronius, REALTIMECOLLECTIONS
+
+
+def timeSync(host, rounds):
+    fronius = Fronius(host, lazy=True)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for collection in REALTIMECOLLECTIONS:
+            fronius._refreshCollection(collection)
+    elapsed = time.perf_counter() - start
+    fronius.close()
+    return elapsed / rounds, fronius.ACPower, fronius.PowerReal_P_Sum
+
+
+async def timeAsync(host, rounds):
+    async with AsyncFronius(host, maxParallelRequests=len(REALTIMECOLLECTIONS)) as fronius:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await fronius.refresh()
+        elapsed = time.perf_counter() - start
+        return elapsed / rounds, fronius.ACPower, fronius.PowerReal_P_Sum
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        sync = timeSync(server.host, rounds)
+        concurrent = asyncio.run(timeAsync(server.host, rounds))
+
+    #   Both clients must have stored the same values
+    assert sync[1:] == concurrent[1:], (sync, concurrent)
+
+    print("response delay            {0:8.1f} ms".format(responseDelay * 1000))
+    print("collections per refresh   {0:8d}".format(len(REALTIMECOLLECTIONS)))
+    print("Fronius, one at a time    {0:8.2f} ms per refresh".format(sync[0] * 1000))
+    print("AsyncFronius.refresh()    {0:8.2f} ms per refresh".format(concurrent[0] * 1000))
+    print("speedup                   {0:8.1f} x".format(sync[0] / concurrent[0]))
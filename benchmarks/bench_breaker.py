@@ -0,0 +1,41 @@
+"""
+    Collector loop against a Datamanager that has stopped answering.
+
+    The fake Datamanager takes longer than the read timeout over every response.   Each stale property read waits out
+    the timeout until the circuit breaker opens,  after which reads return the last known value straight away.
+
+    python benchmarks/bench_breaker.py [reads] [readTimeout]
+"""
+
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+
+
+if __name__ == "__main__":
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    readTimeout = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    with FakeDatamanager() as server:
+        fronius = Fronius(server.host, readTimeout=readTimeout, breakerCooldown=60)
+        lastvalue = fronius.ACPower
+
+        #   Unit stops answering and every value is now stale
+        server.responseDelay = readTimeout * 5
+        fronius.cache.ttls['CommonInverterData'] = 0
+
+        start = time.perf_counter()
+        values = [fronius.ACPower for _ in range(reads)]
+        elapsed = time.perf_counter() - start
+        fronius.close()
+
+    assert values == [lastvalue] * reads
+    print("stale reads               {0:8d}".format(reads))
+    print("read timeout              {0:8.1f} ms".format(readTimeout * 1000))
+    print("without a breaker         {0:8.2f} ms  (every read times out)".format(reads * readTimeout * 1000))
+    print("with the breaker          {0:8.2f} ms  ({1} timeouts, {2} reads failed fast)".format(
+        elapsed * 1000, fronius.breaker.failureThreshold, fronius.breaker.rejected))
@@ -0,0 +1,86 @@
+"""
+    Range queries over months of per-minute values:  the mapped column store against a CSV file of the same samples.
+
+    Writes `months` months of one sample a minute in day sized appends,  as a sync would,  then reads back one month
+    and one day.   The CSV has to be read and parsed up to the end of the range.   The column store finds the range by
+    binary search and hands back views of the mapped files (segments()),  or a copy of them (read()).
+
+    python benchmarks/bench_columnstore.py [months] [repeats]
+"""
+
+import calendar
+import math
+import os
+import sys
+import tempfile
+import time
+
+from fakedatamanager import projectPath
+
+projectPath()
+from columnstore import ColumnStore
+
+months = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+HOST = '10.0.3.250'
+FIRST = calendar.timegm((2018, 1, 1, 0, 0, 0))
+DAY = 86400
+
+
+def value(timestamp):
+    return round(2500 + 2500 * math.sin(timestamp / 3600.0), 2)
+
+
+def csvRange(path, start, end):
+    timestamps = []
+    values = []
+    with open(path) as csvfile:
+        for line in csvfile:
+            timestamp, sample = line.split(',')
+            timestamp = float(timestamp)
+            if timestamp >= end:
+                break
+            if timestamp >= start:
+                timestamps.append(timestamp)
+                values.append(float(sample))
+    return timestamps, values
+
+
+def timed(function):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = function()
+    return result, (time.perf_counter() - start) / repeats
+
+
+if __name__ == "__main__":
+    last = calendar.timegm((2018 + months // 12, months % 12 + 1, 1, 0, 0, 0))
+    with tempfile.TemporaryDirectory() as directory:
+        store = ColumnStore(os.path.join(directory, 'store'))
+        csvpath = os.path.join(directory, 'PAC.csv')
+        start = time.perf_counter()
+        samples = 0
+        with open(csvpath, 'w') as csvfile:
+            for day in range(FIRST, last, DAY):
+                timestamps = [float(timestamp) for timestamp in range(day, day + DAY, 60)]
+                values = [value(timestamp) for timestamp in timestamps]
+                samples += store.append(HOST, 'PowerReal_PAC_Sum', 'inverter/1', timestamps, values)
+                csvfile.writelines('{0},{1}\n'.format(timestamp, sample) for timestamp, sample in zip(timestamps, values))
+        written = time.perf_counter() - start
+
+        #   The last month and its last day,  the worst case for the CSV
+        monthstart = calendar.timegm((2018 + (months - 1) // 12, (months - 1) % 12 + 1, 1, 0, 0, 0))
+        print("samples                     {0:8d}   {1} months,  written in {2:.2f} s".format(samples, months, written))
+        for name, rangestart in (('month', monthstart), ('day', last - DAY)):
+            (csvtimestamps, csvvalues), csvTime = timed(lambda: csvRange(csvpath, rangestart, last))
+            segments, mapTime = timed(lambda: store.segments(HOST, 'PowerReal_PAC_Sum', 'inverter/1', rangestart, last))
+            (timestamps, values), copyTime = timed(lambda: store.read(HOST, 'PowerReal_PAC_Sum', 'inverter/1',
+                                                                      rangestart, last))
+            if list(timestamps) != csvtimestamps or list(values) != csvvalues:
+                raise ValueError('The column store and the CSV differ over the {0}'.format(name))
+            print("{0:5s} {1:6d} samples  csv {2:9.3f} ms   segments() {3:7.3f} ms   read() {4:7.3f} ms".format(
+                name, len(csvtimestamps), csvTime * 1e3, mapTime * 1e3, copyTime * 1e3))
+        #   The views and maps have to go before the files can be deleted on every platform
+        del segments
+        store.close()
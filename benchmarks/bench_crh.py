@@ -0,0 +1,54 @@
+"""
+    Cost of handling the Common Response Header of one response.
+
+    Runs Fronius._extractCRHData over the recorded CommonInverterData response,  and over the same response with a
+    status code the API documentation does not list.
+
+    Point it at another copy of the project directory to compare against an older revision:
+
+    python benchmarks/bench_crh.py [responses] [projectdir]
+"""
+
+import copy
+import sys
+import threading
+import time
+
+from fakedatamanager import loadPayloads, PROJECTDIR
+
+responses = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+sys.path.insert(0, sys.argv[2] if len(sys.argv) > 2 else PROJECTDIR)
+from frosolar import Fronius, decodeJSON
+
+
+def timeExtract(fronius, json, count):
+    """
+    :return:    seconds per response,  or None if the response could not be handled
+    """
+    try:
+        fronius._extractCRHData(json)
+    except KeyError:
+        return None
+    start = time.perf_counter()
+    for _ in range(count):
+        fronius._extractCRHData(json)
+    return (time.perf_counter() - start) / count
+
+
+if __name__ == "__main__":
+    fronius = Fronius.__new__(Fronius)
+    fronius._initialiseStorage()
+    fronius.lastSuccessfullResponseTime = None
+    #   Older revisions update UnitStatus under the lock
+    fronius._lock = threading.RLock()
+
+    okay = decodeJSON(loadPayloads()['GetInverterRealtimeData_CommonInverterData'])
+    unknown = copy.deepcopy(okay)
+    unknown['Head']['Status']['Code'] = 42
+
+    for name, json in (('status 0 (OKAY)', okay), ('status 42 (undocumented)', unknown)):
+        elapsed = timeExtract(fronius, json, responses)
+        if elapsed is None:
+            print("{0:27s} KeyError".format(name))
+        else:
+            print("{0:27s} {1:8.2f} us per response   {2}".format(name, elapsed * 1e6, fronius.UnitStatus.status))
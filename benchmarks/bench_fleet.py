@@ -0,0 +1,64 @@
+"""
+    Sweep of a fleet of fake Datamanagers with FroniusFleet against polling each unit in turn.
+
+    One of the hosts does not answer at all,  it must not hold up the rest of the sweep.
+
+    python benchmarks/bench_fleet.py [units] [responseDelay]
+"""
+
+import sys
+import time
+from contextlib import ExitStack
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from fleet import FroniusFleet, FLEETCOLLECTIONS
+
+#   Nothing listens on port 1,  so connecting is refused straight away.
+UNREACHABLEHOST = '127.0.0.1:1'
+
+
+def timeSequential(hosts):
+    start = time.perf_counter()
+    for host in hosts:
+        try:
+            fronius = Fronius(host, lazy=True)
+        except Exception:
+            continue
+        for collection in FLEETCOLLECTIONS:
+            fronius._refreshCollection(collection)
+        fronius.close()
+    return time.perf_counter() - start
+
+
+def timeFleet(hosts):
+    fleet = FroniusFleet(hosts)
+    start = time.perf_counter()
+    results = fleet.sweep()
+    elapsed = time.perf_counter() - start
+    fleet.close()
+    return elapsed, results
+
+
+if __name__ == "__main__":
+    units = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    with ExitStack() as stack:
+        servers = [stack.enter_context(FakeDatamanager(responseDelay=responseDelay)) for _ in range(units)]
+        hosts = [server.host for server in servers] + [UNREACHABLEHOST]
+
+        sequential = timeSequential(hosts)
+        concurrent, results = timeFleet(hosts)
+
+    assert len(results) == len(hosts)
+    assert 'connect' in results[UNREACHABLEHOST].errors
+    assert all(sorted(results[host].values) == sorted(FLEETCOLLECTIONS) for host in hosts[:-1])
+
+    print("units                     {0:8d}  (+1 unreachable)".format(units))
+    print("response delay            {0:8.1f} ms".format(responseDelay * 1000))
+    print("one unit at a time        {0:8.2f} ms per sweep".format(sequential * 1000))
+    print("FroniusFleet.sweep()      {0:8.2f} ms per sweep".format(concurrent * 1000))
+    print("speedup                   {0:8.1f} x".format(sequential / concurrent))
@@ -0,0 +1,107 @@
+"""
+    Fleet totals,  ranks and outliers over a fleet:  Python loops over the values of each unit against one structured
+    array from fleetArray().
+
+    Builds `units` Fronius holding the recorded CommonInverterData,  3PInverterData and MeterRealtimeData responses,
+    each with its own PAC and VAC.   The loop works on the dicts a sweep returns (FleetResult.values),  the array
+    version exports the fleet once and then works on whole columns.   Both must agree.
+
+    python benchmarks/bench_fleetarray.py [units] [repeats]
+"""
+
+import copy
+import math
+import statistics
+import sys
+import time
+
+from fakedatamanager import loadPayloads, projectPath
+
+projectPath()
+from frosolar import Fronius, CollectionCache, decodeJSON
+from fleet import fleetArray, numpy
+
+unitcount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+PAYLOADCOLLECTIONS = {'GetInverterRealtimeData_CommonInverterData': 'CommonInverterData',
+                      'GetInverterRealtimeData_3PInverterData': '3PInverterData',
+                      'GetMeterRealtimeData': 'MeterRealtimeData'}
+
+
+def newUnit(index, recorded):
+    fronius = Fronius.__new__(Fronius)
+    fronius._initialiseStorage()
+    fronius.inverternumber = 1
+    fronius.metadataCache = None
+    fronius._lasttimestamps = {}
+    fronius.history = None
+    fronius.cache = CollectionCache()
+    for collection, json in recorded:
+        if collection == 'CommonInverterData':
+            json = copy.deepcopy(json)
+            json['Body']['Data']['PAC']['Value'] = 1000 + (index * 37) % 4000
+            json['Body']['Data']['UAC']['Value'] = 240 + (index % 7) - (30 if index % 97 == 0 else 0)
+        fronius._parseCollection(collection, json, collection)
+        fronius.cache.stored(collection)
+    return fronius
+
+
+def withLoops(results):
+    """
+    :return:    (fleet total of every value,  hosts by PAC highest first,
+                 hosts whose VAC is more than 3 deviations from the mean)
+    """
+    total = {}
+    for values in results.values():
+        for collection in values.values():
+            for field, value in collection.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    total[field] = total.get(field, 0) + value
+    ranked = sorted(results, key=lambda host: results[host]['CommonInverterData']['PAC'], reverse=True)
+    voltages = [values['CommonInverterData']['VAC'] for values in results.values()]
+    mean = statistics.fmean(voltages)
+    deviation = statistics.pstdev(voltages)
+    outliers = [host for host, values in results.items()
+                if abs(values['CommonInverterData']['VAC'] - mean) > 3 * deviation]
+    return total, ranked, outliers
+
+
+def withArray(fleet):
+    total = {field: numpy.nansum(fleet[field]) for field in fleet.dtype.names[1:] if not field.startswith('fetched_')}
+    ranked = fleet['host'][numpy.argsort(-fleet['PAC'], kind='stable')]
+    voltages = fleet['VAC']
+    outliers = fleet['host'][numpy.abs(voltages - voltages.mean()) > 3 * voltages.std()]
+    return total, list(ranked), list(outliers)
+
+
+def timed(function, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        result = function()
+    return result, (time.perf_counter() - start) / count
+
+
+if __name__ == "__main__":
+    if numpy is None:
+        print("NumPy is not installed")
+        sys.exit(0)
+    payloads = loadPayloads()
+    recorded = [(collection, decodeJSON(payloads[payload])) for payload, collection in PAYLOADCOLLECTIONS.items()]
+    units = [('10.0.{0}.{1}'.format(index // 256, index % 256), newUnit(index, recorded)) for index in range(unitcount)]
+
+    #   What a sweep hands back for each host
+    results, gather = timed(lambda: {host: {collection: unit.collectionValues(collection)
+                                            for collection, _ in recorded} for host, unit in units}, repeats)
+    loops, loopTime = timed(lambda: withLoops(results), repeats)
+    fleet, export = timed(lambda: fleetArray(units), repeats)
+    vectorised, arrayTime = timed(lambda: withArray(fleet), repeats)
+
+    agree = all(math.isclose(loops[0][field], vectorised[0][field]) for field in loops[0]) and loops[1] == vectorised[1] and loops[2] == vectorised[2]
+    print("units                       {0:8d}   {1} columns".format(unitcount, len(fleet.dtype.names)))
+    print("collectionValues per unit   {0:8.2f} ms".format(gather * 1e3))
+    print("fleetArray()                {0:8.2f} ms".format(export * 1e3))
+    print("aggregate with loops        {0:8.2f} ms".format(loopTime * 1e3))
+    print("aggregate on the array      {0:8.2f} ms".format(arrayTime * 1e3))
+    print("speedup                     {0:8.1f} x   aggregation only {1:.1f} x   results agree: {2}".format(
+        (gather + loopTime) / (export + arrayTime), loopTime / arrayTime, agree))
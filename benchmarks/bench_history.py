@@ -0,0 +1,102 @@
+"""
+    Cost and memory of keeping the history of the default metrics.
+
+    Stores the recorded CommonInverterData,  MeterRealtimeData and PowerFlowRealtimeData responses `responses` times
+    each,  with and without a MetricHistory,  and reports the time added per response.   The memory held by the
+    history is then compared with keeping every sample in a list,  which grows for as long as the collector runs.
+
+    python benchmarks/bench_history.py [responses] [capacity]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from fakedatamanager import loadPayloads, projectPath
+
+projectPath()
+from frosolar import CollectionCache, Fronius, decodeJSON
+from history import MetricHistory, numpy
+
+responses = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 8640
+
+PAYLOADCOLLECTIONS = {'GetInverterRealtimeData_CommonInverterData': 'CommonInverterData',
+                      'GetMeterRealtimeData': 'MeterRealtimeData',
+                      'GetPowerFlowRealtimeData': 'PowerFlowRealtimeData'}
+
+
+def newFronius(history):
+    fronius = Fronius.__new__(Fronius)
+    fronius._initialiseStorage()
+    fronius.inverternumber = 1
+    fronius.metadataCache = None
+    fronius._lasttimestamps = {}
+    fronius.cache = CollectionCache()
+    fronius.history = history
+    return fronius
+
+
+def store(fronius, responses, count):
+    """
+    :return:    seconds per response
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        for collection, json in responses:
+            fronius._lasttimestamps.clear()
+            fronius._parseCollection(collection, json, collection)
+    return (time.perf_counter() - start) / (count * len(responses))
+
+
+def heldBy(build):
+    tracemalloc.start()
+    held = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+
+def listHistory(count):
+    samples = {name: [] for name in MetricHistory().metrics}
+    for index in range(count):
+        for name in samples:
+            samples[name].append((1528777877.0 + index, float(index)))
+    return samples
+
+
+def ringHistory(count):
+    history = MetricHistory(capacity=capacity)
+    for index in range(count):
+        for buffer in history.buffers.values():
+            buffer.append(1528777877.0 + index, float(index))
+    return history
+
+
+if __name__ == "__main__":
+    payloads = loadPayloads()
+    recorded = [(collection, decodeJSON(payloads[payload])) for payload, collection in PAYLOADCOLLECTIONS.items()]
+
+    without = store(newFronius(None), recorded, responses)
+    history = MetricHistory(capacity=capacity)
+    withhistory = store(newFronius(history), recorded, responses)
+    samples = {name: len(buffer) for name, buffer in history.buffers.items()}
+
+    print("responses per collection    {0:8d}   capacity {1}".format(responses, capacity))
+    print("without history             {0:8.2f} us per response".format(without * 1e6))
+    print("with history                {0:8.2f} us per response".format(withhistory * 1e6))
+    print("samples held                {0}".format(samples))
+
+    for count in (capacity, 10 * capacity):
+        _, ringsize = heldBy(lambda: ringHistory(count))
+        _, listsize = heldBy(lambda: listHistory(count))
+        print("{0:8d} samples per metric  ring buffers {1:8.1f} KiB   lists {2:9.1f} KiB".format(count, ringsize / 1024,
+                                                                                               listsize / 1024))
+
+    if numpy is None:
+        print("NumPy views                 NumPy not installed")
+    else:
+        buffer = history['PAC']
+        timestamps, values = buffer.views()[0]
+        print("NumPy views                 {0} segment(s),  shares memory with the ring buffer: {1}".format(
+            len(buffer.views()), numpy.shares_memory(values, numpy.frombuffer(buffer.values))))
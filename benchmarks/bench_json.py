@@ -0,0 +1,49 @@
+"""
+    Parse throughput of the recorded Datamanager responses with each JSON decoder.
+
+    json.loads(bytes)           the standard library working out the encoding of the raw bytes itself
+    decodeJSONStdlib            the fallback decoder,  UTF-8 decode then the standard library
+    orjson.loads(bytes)         only if orjson is installed
+
+    python benchmarks/bench_json.py [rounds]
+"""
+
+import json
+import sys
+import time
+
+from fakedatamanager import loadPayloads, projectPath
+
+projectPath()
+import frosolar
+
+
+def throughput(decoder, payloads, rounds):
+    size = sum(len(body) for body in payloads) * rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for body in payloads:
+            decoder(body)
+    elapsed = time.perf_counter() - start
+    return size / elapsed / 1e6, elapsed / (rounds * len(payloads)) * 1e6
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    payloads = list(loadPayloads().values())
+    decoders = [('json.loads(bytes)', json.loads), ('decodeJSONStdlib', frosolar.decodeJSONStdlib)]
+    if frosolar.orjson is not None:
+        decoders.append(('orjson.loads(bytes)', frosolar.orjson.loads))
+
+    #   Every decoder must give the same result
+    for name, decoder in decoders:
+        assert [decoder(body) for body in payloads] == [json.loads(body) for body in payloads], name
+
+    print("payloads                  {0:8d}  ({1} bytes)".format(len(payloads), sum(len(body) for body in payloads)))
+    print("default decoder           {0:>8}".format(frosolar.JSONDECODER))
+    baseline = None
+    for name, decoder in decoders:
+        mbps, microseconds = throughput(decoder, payloads, rounds)
+        baseline = baseline or mbps
+        print("{0:<25} {1:8.1f} MB/s  {2:6.2f} us per response  {3:5.1f} x".format(name, mbps, microseconds, mbps / baseline))
@@ -0,0 +1,107 @@
+"""
+    Cost of storing one response of each collection.
+
+    Runs Fronius._parseCollection over each recorded response and reports the time taken and the number of dict
+    lookups (d[key],  key in d,  d.get) made on the decoded response.   The skip-parse on an unchanged Head.Timestamp
+    is defeated so every response is stored in full.   The values stored are counted as a check that nothing in the
+    recorded payloads went missing on the way.
+
+    Point it at another copy of the project directory to compare against an older revision:
+
+    python benchmarks/bench_parse.py [responses] [projectdir]
+"""
+
+import contextlib
+import io
+import json as jsonlib
+import sys
+import time
+
+from fakedatamanager import loadPayloads, PROJECTDIR
+
+responses = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+sys.path.insert(0, sys.argv[2] if len(sys.argv) > 2 else PROJECTDIR)
+from frosolar import CollectionCache, Fronius
+
+#   Recorded payload of each collection
+PAYLOADCOLLECTIONS = {'GetInverterInfo': 'InverterInfo',
+                      'GetLoggerInfo': 'LoggerInfo',
+                      'GetLoggerLEDInfo': 'LoggerLEDInfo',
+                      'GetPowerFlowRealtimeData': 'PowerFlowRealtimeData',
+                      'GetMeterRealtimeData': 'MeterRealtimeData',
+                      'GetInverterRealtimeData_CommonInverterData': 'CommonInverterData',
+                      'GetInverterRealtimeData_3PInverterData': '3PInverterData',
+                      'GetInverterRealtimeData_MinMaxInverterData': 'MinMaxInverterData'}
+
+
+class CountingDict(dict):
+    """Decoded JSON object that counts every lookup made on it."""
+    lookups = 0
+
+    def __getitem__(self, key):
+        CountingDict.lookups += 1
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        CountingDict.lookups += 1
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        CountingDict.lookups += 1
+        return dict.get(self, key, default)
+
+
+def storedValues(values):
+    """
+    :return:    Number of values holding something other than a default (None,  0 or False)
+    """
+    count = 0
+    for value in values.values():
+        if isinstance(value, dict):
+            count += storedValues(value)
+        elif value is not None and value is not False and value != 0:
+            count += 1
+    return count
+
+
+def timeParse(fronius, collection, json, count):
+    """
+    :return:    seconds per response
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        fronius._lasttimestamps.clear()
+        fronius._parseCollection(collection, json, collection)
+    return (time.perf_counter() - start) / count
+
+
+if __name__ == "__main__":
+    fronius = Fronius.__new__(Fronius)
+    fronius._initialiseStorage()
+    fronius.inverternumber = 1
+    fronius.metadataCache = None
+    fronius._lasttimestamps = {}
+    fronius.cache = CollectionCache()
+    fronius.history = None
+
+    payloads = loadPayloads()
+    total = 0
+    #   Older revisions print from inside the parsers
+    with contextlib.redirect_stdout(io.StringIO()) as printed:
+        results = []
+        for payload, collection in PAYLOADCOLLECTIONS.items():
+            json = jsonlib.loads(payloads[payload].decode('utf-8'), object_hook=CountingDict)
+            CountingDict.lookups = 0
+            fronius._lasttimestamps.clear()
+            fronius._parseCollection(collection, json, collection)
+            lookups = CountingDict.lookups
+            elapsed = timeParse(fronius, collection, json, responses)
+            results.append((collection, elapsed, lookups, storedValues(fronius.collectionValues(collection))))
+
+    print("{0:23s} {1:>14s} {2:>9s} {3:>7s}".format('collection', 'per response', 'lookups', 'stored'))
+    for collection, elapsed, lookups, stored in results:
+        total += elapsed
+        print("{0:23s} {1:11.2f} us {2:9d} {3:7d}".format(collection, elapsed * 1e6, lookups, stored))
+    print("{0:23s} {1:11.2f} us".format('all collections', total * 1e6))
+    if printed.getvalue():
+        print("{0} lines printed while parsing".format(len(printed.getvalue().splitlines())))
@@ -0,0 +1,75 @@
+"""
+    Construction time and memory of the records every Fronius holds its values in.
+
+    Builds the records of `instances` units on their own,  then constructs that many lazy Fronius against the fake
+    Datamanager,  and reports the time taken and the memory still held (tracemalloc) per instance.   A lazy Fronius
+    still makes the one GetAPIVersion request.
+
+    Point it at another copy of the project directory to compare against an older revision:
+
+    python benchmarks/bench_records.py [instances] [projectdir]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from fakedatamanager import FakeDatamanager, PROJECTDIR
+
+instances = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+sys.path.insert(0, sys.argv[2] if len(sys.argv) > 2 else PROJECTDIR)
+from frosolar import Fronius
+
+
+def storageOnly():
+    fronius = Fronius.__new__(Fronius)
+    fronius._initialiseStorage()
+    return fronius
+
+
+def timeConstruction(construct, count):
+    """
+    :return:    seconds per instance.   As in timeit the garbage collector is kept out of the timing
+    """
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    held = [construct() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    release(held)
+    return elapsed / count
+
+
+def memoryHeld(construct, count):
+    """
+    Traced on its own as tracemalloc slows construction down several times over.
+    :return:    bytes held per instance
+    """
+    gc.collect()
+    tracemalloc.start()
+    held = [construct() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    release(held)
+    return size / count
+
+
+def release(held):
+    for fronius in held:
+        if hasattr(fronius, 'session'):
+            fronius.close()
+
+
+if __name__ == "__main__":
+    storage = (timeConstruction(storageOnly, instances), memoryHeld(storageOnly, instances))
+    with FakeDatamanager() as server:
+        Fronius(server.host, lazy=True).close()
+        unit = (timeConstruction(lambda: Fronius(server.host, lazy=True), instances),
+                memoryHeld(lambda: Fronius(server.host, lazy=True), instances))
+
+    print("instances                   {0:8d}".format(instances))
+    print("records only                {0:8.1f} us  {1:8.1f} KiB per instance".format(storage[0] * 1e6,
+                                                                                     storage[1] / 1024))
+    print("Fronius(lazy=True)          {0:8.1f} us  {1:8.1f} KiB per instance".format(unit[0] * 1e6, unit[1] / 1024))
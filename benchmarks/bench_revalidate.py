@@ -0,0 +1,51 @@
+"""
+    Property read latency against a slow Datamanager with and without stale-while-revalidate.
+
+    ACPower is read every readInterval seconds while its collection expires every ttl seconds.   Without
+    stale-while-revalidate every read that finds it expired waits for the fetch,  with it the read returns the value
+    held and the fetch happens on the background thread.
+
+    python benchmarks/bench_revalidate.py [reads] [responseDelay]
+"""
+
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+
+
+def readLatencies(host, reads, staleWhileRevalidate, ttl, readInterval):
+    fronius = Fronius(host, lazy=True, staleWhileRevalidate=staleWhileRevalidate, maxStaleness=ttl * 10,
+                      cacheTTLs={'CommonInverterData': ttl})
+    fronius.ACPower
+    latencies = []
+    worstAge = 0
+    for _ in range(reads):
+        time.sleep(readInterval)
+        start = time.perf_counter()
+        aged = fronius.read('ACPower')
+        latencies.append(time.perf_counter() - start)
+        worstAge = max(worstAge, aged.age)
+    fronius.close()
+    latencies.sort()
+    return sum(latencies) / reads, latencies[-1], worstAge
+
+
+if __name__ == "__main__":
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    ttl = responseDelay
+    readInterval = responseDelay / 5
+
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        blocking = readLatencies(server.host, reads, False, ttl, readInterval)
+        revalidating = readLatencies(server.host, reads, True, ttl, readInterval)
+
+    print("response delay            {0:8.1f} ms  (TTL {1:.1f} ms)".format(responseDelay * 1000, ttl * 1000))
+    print("blocking reads            {0:8.2f} ms mean  {1:8.2f} ms worst  (oldest value {2:6.1f} ms)".format(
+        blocking[0] * 1000, blocking[1] * 1000, blocking[2] * 1000))
+    print("stale-while-revalidate    {0:8.2f} ms mean  {1:8.2f} ms worst  (oldest value {2:6.1f} ms)".format(
+        revalidating[0] * 1000, revalidating[1] * 1000, revalidating[2] * 1000))
@@ -0,0 +1,48 @@
+"""
+    Per-request latency of the pooled keep-alive session against a fresh connection per request.
+
+    Polls CommonInverterData, 3PInverterData and GetMeterRealtimeData back to back from the fake Datamanager,
+    which imitates the slow connection accept of the embedded web server.
+
+    python benchmarks/bench_session.py [rounds] [acceptDelay]
+"""
+
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+
+
+def pollRound(fronius):
+    fronius._GetInverterRealtimeData(fronius.scope, fronius.DeviceID, 'CommonInverterData')
+    fronius._GetInverterRealtimeData(fronius.scope, fronius.DeviceID, '3PInverterData')
+    fronius._GetMeterRealtimeData()
+
+
+def timeRounds(host, rounds, keepAlive):
+    fronius = Fronius(host, keepAlive=keepAlive)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        pollRound(fronius)
+    elapsed = time.perf_counter() - start
+    fronius.close()
+    return elapsed / (rounds * 3)
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    acceptDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+
+    with FakeDatamanager(acceptDelay=acceptDelay) as server:
+        fresh = timeRounds(server.host, rounds, keepAlive=False)
+        freshConnections = server.connections
+        pooled = timeRounds(server.host, rounds, keepAlive=True)
+        pooledConnections = server.connections - freshConnections
+
+    print("accept delay              {0:8.1f} ms".format(acceptDelay * 1000))
+    print("new connection / request  {0:8.2f} ms per request  ({1} connections)".format(fresh * 1000, freshConnections))
+    print("pooled keep-alive session {0:8.2f} ms per request  ({1} connections)".format(pooled * 1000, pooledConnections))
+    print("speedup                   {0:8.1f} x".format(fresh / pooled))
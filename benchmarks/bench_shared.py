@@ -0,0 +1,105 @@
+"""
+    Reading values published into shared memory by another process against reading them from a Fronius of its own.
+
+    A publisher process polls the fake Datamanager and publishes as fast as it can while this process reads.   Every
+    snapshot read must be one the publisher wrote whole:  the publisher writes the same counter into every numeric
+    property of a snapshot,  so a torn read shows up as a snapshot holding two different counters.
+
+    python benchmarks/bench_shared.py [reads] [seconds]
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius, Snapshot, SnapshotTimes
+from sharedsnapshot import SnapshotPublisher, SharedFronius, SHAREDPROPERTIES
+
+COUNTED = [name for name in SHAREDPROPERTIES if name not in ('Serial', 'Manufacturer', 'Model', 'Meter_Location',
+                                                             'Mode', 'BatteryStandby', 'Power_Akku')]
+
+
+def publishCounters(name, ready, stop):
+    """
+    Publish snapshots whose numeric properties all hold the same counter until stop is set.
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'project'))
+    template = Snapshot(**dict.fromkeys(Snapshot._fields, None))
+    fetched = SnapshotTimes(*[time.time()] * len(SnapshotTimes._fields))
+    publisher = SnapshotPublisher(None, name=name)
+    ready.set()
+    counter = 0
+    while not stop.is_set():
+        counter += 1
+        values = dict.fromkeys(COUNTED, counter)
+        values['Serial'] = 'S{0}'.format(counter)
+        publisher.publish(template._replace(fetched=fetched, **values))
+    publisher.close()
+
+
+def tornReads(name, seconds):
+    """
+    Read snapshots while the publisher process is busy writing.
+    :return:    (snapshots read,  torn snapshots,  distinct publishes seen)
+    """
+    ready = multiprocessing.Event()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(target=publishCounters, args=(name, ready, stop))
+    process.start()
+    ready.wait()
+    reads = torn = 0
+    seen = set()
+    with SharedFronius(name=name) as shared:
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            snapshot = shared.snapshot()
+            values = {getattr(snapshot, field) for field in COUNTED}
+            if snapshot.Serial is not None:
+                values.add(int(snapshot.Serial[1:]))
+            reads += 1
+            if len(values) > 1:
+                torn += 1
+            seen.update(values)
+    stop.set()
+    process.join()
+    return reads, torn, len(seen)
+
+
+def timeCalls(function, reads):
+    start = time.perf_counter()
+    for _ in range(reads):
+        function()
+    return (time.perf_counter() - start) / reads
+
+
+if __name__ == "__main__":
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    name = 'frosolar_bench_{0}'.format(os.getpid())
+
+    snapshots, torn, publishes = tornReads(name, seconds)
+    assert torn == 0, torn
+
+    with FakeDatamanager() as server:
+        fronius = Fronius(server.host, lazy=True)
+        publisher = SnapshotPublisher(fronius, name=name)
+        publisher.publish()
+        before = server.requests
+        with SharedFronius(name=name) as shared:
+            assert shared.snapshot()[:-1] == fronius.snapshot()[:-1], 'published values differ'
+            sharedRead = timeCalls(lambda: shared.ACPower, reads)
+            snapshotRead = timeCalls(shared.snapshot, reads // 10)
+        requests = server.requests - before
+        ownRead = timeCalls(lambda: fronius.ACPower, reads)
+        publisher.close()
+        fronius.close()
+
+    print("snapshots read while publishing {0:8d}  ({1} publishes seen,  {2} torn)".format(snapshots, publishes, torn))
+    print("requests made by the reader     {0:8d}".format(requests))
+    print("SharedFronius.ACPower           {0:8.2f} us per read".format(sharedRead * 1e6))
+    print("SharedFronius.snapshot()        {0:8.2f} us per read".format(snapshotRead * 1e6))
+    print("Fronius.ACPower (cached)        {0:8.2f} us per read".format(ownRead * 1e6))
@@ -0,0 +1,56 @@
+"""
+    Concurrent property reads from many threads once the cached values have gone stale.
+
+    Every thread reads ACPower, ACVoltage and ACCurrent at the same moment.   Without coalescing each read of a stale
+    value sends its own CommonInverterData request,  with single-flight they all share one.
+
+    python benchmarks/bench_singleflight.py [threads] [responseDelay]
+"""
+
+import sys
+import threading
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+
+
+def staleReads(fronius, server, threads):
+    fronius.cache.invalidate('CommonInverterData')
+
+    barrier = threading.Barrier(threads)
+    results = []
+
+    def reader():
+        barrier.wait()
+        results.append((fronius.ACPower, fronius.ACVoltage, fronius.ACCurrent))
+
+    before = server.requests
+    start = time.perf_counter()
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    assert len(set(results)) == 1, results
+    return server.requests - before, elapsed
+
+
+if __name__ == "__main__":
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    with FakeDatamanager(responseDelay=responseDelay) as server:
+        fronius = Fronius(server.host, lazy=True, poolSize=threads)
+        fronius._refreshCollection('CommonInverterData')
+        requests, elapsed = staleReads(fronius, server, threads)
+        fronius.close()
+
+    print("threads                   {0:8d}  (3 properties each)".format(threads))
+    print("response delay            {0:8.1f} ms".format(responseDelay * 1000))
+    print("requests sent             {0:8d}".format(requests))
+    print("elapsed                   {0:8.2f} ms".format(elapsed * 1000))
@@ -0,0 +1,60 @@
+"""
+    Cost of storing a realtime response that has a new Head.Timestamp against one that repeats the last Timestamp.
+
+    The Datamanager only updates its values every few seconds so polling faster than that mostly returns responses
+    that have already been stored.   Those are not parsed again,  only their freshness markers are updated.
+
+    python benchmarks/bench_skipparse.py [rounds]
+"""
+
+import os
+import sys
+import time
+
+from fakedatamanager import FakeDatamanager, loadPayloads, projectPath
+
+projectPath()
+from frosolar import Fronius, decodeJSON
+
+COLLECTIONS = {'CommonInverterData': 'GetInverterRealtimeData_CommonInverterData',
+               '3PInverterData': 'GetInverterRealtimeData_3PInverterData',
+               'MinMaxInverterData': 'GetInverterRealtimeData_MinMaxInverterData',
+               'MeterRealtimeData': 'GetMeterRealtimeData',
+               'PowerFlowRealtimeData': 'GetPowerFlowRealtimeData'}
+
+
+def timeParses(fronius, responses, rounds, changing):
+    start = time.perf_counter()
+    for round in range(rounds):
+        for collection, url, json in responses:
+            if changing:
+                json['Head']['Timestamp'] = str(round)
+            fronius._parseCollection(collection, json, url)
+    return (time.perf_counter() - start) / (rounds * len(responses))
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    payloads = loadPayloads()
+    with FakeDatamanager() as server:
+        fronius = Fronius(server.host, lazy=True)
+        fronius.close()
+
+    responses = [(collection, fronius._collectionURL(collection), decodeJSON(payloads[name]))
+                 for collection, name in COLLECTIONS.items()]
+
+    #   The MinMax parser prints as it goes,  keep that out of the timing output
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        parsed = timeParses(fronius, responses, rounds, changing=True)
+        fronius.skippedParses = 0
+        skipped = timeParses(fronius, responses, rounds, changing=False)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print("collections               {0:8d}".format(len(responses)))
+    print("new Timestamp, parsed     {0:8.2f} us per response".format(parsed * 1e6))
+    print("same Timestamp, skipped   {0:8.2f} us per response  ({1} skipped)".format(skipped * 1e6, fronius.skippedParses))
+    print("speedup                   {0:8.1f} x".format(parsed / skipped))
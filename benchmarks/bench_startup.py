@@ -0,0 +1,58 @@
+"""
+    Start up of a collector with and without the on-disk metadata cache.
+
+    Each start constructs a lazy Fronius and makes sure the API version, InverterInfo, LoggerInfo and ActiveDeviceInfo
+    are held,  as a collector does before it starts polling.   The cold start fetches all four,  the warm start loads
+    them from the cache written by the cold start.
+
+    python benchmarks/bench_startup.py [starts] [responseDelay]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from fakedatamanager import FakeDatamanager, projectPath
+
+projectPath()
+from frosolar import Fronius
+from metadatacache import MetadataCache, METADATACOLLECTIONS
+
+
+def start(host, metadataCache):
+    fronius = Fronius(host, lazy=True, metadataCache=metadataCache)
+    for collection in METADATACOLLECTIONS[1:]:
+        fronius._ensureCurrent(collection)
+    fronius.close()
+    return fronius
+
+
+def timeStarts(server, starts, path, keep):
+    elapsed = 0
+    requests = server.requests
+    for _ in range(starts):
+        if not keep and os.path.exists(path):
+            os.remove(path)
+        begin = time.perf_counter()
+        fronius = start(server.host, MetadataCache(path))
+        elapsed += time.perf_counter() - begin
+    return elapsed / starts, (server.requests - requests) / starts, fronius
+
+
+if __name__ == "__main__":
+    starts = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    responseDelay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    with tempfile.TemporaryDirectory() as directory, FakeDatamanager(responseDelay=responseDelay) as server:
+        path = os.path.join(directory, 'metadata.json')
+        cold, coldRequests, coldFronius = timeStarts(server, starts, path, keep=False)
+        warm, warmRequests, warmFronius = timeStarts(server, starts, path, keep=True)
+
+    assert warmFronius.LoggerUniqueID == coldFronius.LoggerUniqueID
+    assert warmFronius.BaseURL == coldFronius.BaseURL
+
+    print("response delay            {0:8.1f} ms".format(responseDelay * 1000))
+    print("cold start                {0:8.2f} ms  ({1:.0f} requests)".format(cold * 1000, coldRequests))
+    print("warm start                {0:8.2f} ms  ({1:.0f} requests)".format(warm * 1000, warmRequests))
+    print("speedup                   {0:8.1f} x".format(cold / warm))
@@ -0,0 +1,186 @@
+"""
+    Fake Fronius Datamanager used by the benchmarks.
+
+    Serves the recorded responses in the payloads directory over plain HTTP/1.1 so that the Fronius class can be
+    exercised without access to an actual inverter.   The delays of a real Datamanager can be imitated:
+
+        acceptDelay     Seconds spent before a NEW connection is served.  The embedded web server is slow to accept.
+        responseDelay   Seconds spent putting together every response.
+
+    GetArchiveData is not recorded,  its responses are made up from the request.   Every channel asked for gets a
+    sample every ARCHIVEINTERVAL seconds of each day from StartDate to EndDate.   Like a real Datamanager it refuses a
+    range of more than ARCHIVEMAXDAYS days.
+"""
+
+import datetime
+import json
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+PAYLOADDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'payloads')
+PROJECTDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'project')
+
+ARCHIVEINTERVAL = 300
+ARCHIVEMAXDAYS = 16
+#   Time zone the made up archive is reported in,  as the Datamanager reports local time
+ARCHIVETIMEZONE = datetime.timezone(datetime.timedelta(hours=10))
+ARCHIVEDEVICE = 'inverter/1'
+
+
+def projectPath():
+    """
+    Make the project modules importable from the benchmark scripts.
+    :return:
+    """
+    if PROJECTDIR not in sys.path:
+        sys.path.insert(0, PROJECTDIR)
+
+
+def loadPayloads():
+    """
+    Read every recorded response from the payloads directory.
+    :return:    Dict of payload name to the raw bytes of the recorded response
+    """
+    payloads = {}
+    for filename in sorted(os.listdir(PAYLOADDIR)):
+        if filename.endswith('.json'):
+            with open(os.path.join(PAYLOADDIR, filename), 'rb') as payload:
+                payloads[filename[:-5]] = payload.read()
+    return payloads
+
+
+def archiveValue(channel, timestamp):
+    """
+    The made up value of a channel at a time.   The same every time it is asked for.
+    """
+    return float((int(timestamp) // ARCHIVEINTERVAL) % 5000) + len(channel)
+
+
+def archiveResponse(query, maxDays=ARCHIVEMAXDAYS):
+    """
+    Make up the GetArchiveData response to a request.
+    :param query:   The parsed query string
+    :param maxDays: Longest range answered
+    :return:    The raw bytes of the response and the number of channel days in it
+    """
+    head = {'RequestArguments': {name: values if name == 'Channel' else values[0] for name, values in query.items()},
+            'Status': {'Code': 0, 'Reason': '', 'UserMessage': ''},
+            'Timestamp': datetime.datetime.now(ARCHIVETIMEZONE).replace(microsecond=0).isoformat()}
+    start = datetime.date.fromisoformat(query['StartDate'][0])
+    end = datetime.date.fromisoformat(query['EndDate'][0])
+    if end < start or (end - start).days + 1 > maxDays:
+        head['Status'] = {'Code': 6, 'Reason': 'Query timespan exceeded', 'UserMessage': ''}
+        return json.dumps({'Head': head, 'Body': {'Data': {}}}).encode('utf-8'), 0
+
+    days = (end - start).days + 1
+    begin = datetime.datetime.combine(start, datetime.time(), ARCHIVETIMEZONE)
+    finish = datetime.datetime.combine(end, datetime.time(23, 59, 59), ARCHIVETIMEZONE)
+    first = begin.timestamp()
+    samples = range(0, int(finish.timestamp() - first) + 1, ARCHIVEINTERVAL)
+    channels = {}
+    for channel in query.get('Channel', []):
+        channels[channel] = {'Unit': 'W',
+                             'Values': {str(offset): archiveValue(channel, first + offset) for offset in samples}}
+    data = {ARCHIVEDEVICE: {'DeviceType': 99, 'NodeType': 97, 'Start': begin.isoformat(), 'End': finish.isoformat(),
+                            'Data': channels}}
+    return json.dumps({'Head': head, 'Body': {'Data': data}}).encode('utf-8'), days * len(channels)
+
+
+class FakeDatamanagerHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        #   Called once per connection, so this is where a slow accept is imitated.
+        if self.server.acceptDelay:
+            time.sleep(self.server.acceptDelay)
+        self.server.connections += 1
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.server.responseDelay:
+            time.sleep(self.server.responseDelay)
+
+        parts = urlsplit(self.path)
+        endpoint = parts.path.rstrip('/').split('/')[-1].split('.')[0]
+        query = parse_qs(parts.query)
+        name = endpoint
+        if 'DataCollection' in query:
+            name = '{0}_{1}'.format(endpoint, query['DataCollection'][0])
+
+        if endpoint == 'GetArchiveData':
+            self.server.archiveRequests += 1
+            body, channeldays = archiveResponse(query, self.server.archiveMaxDays)
+            self.server.archiveChannelDays += channeldays
+        else:
+            body = self.server.payloads.get(name)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeDatamanager(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering with the recorded payloads.
+    Use as a context manager,  the server runs on a background thread until the block exits.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, acceptDelay=0.0, responseDelay=0.0, payloads=None):
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0), FakeDatamanagerHandler)
+        self.acceptDelay = acceptDelay
+        self.responseDelay = responseDelay
+        self.payloads = payloads if payloads is not None else loadPayloads()
+        self.connections = 0
+        self.requests = 0
+        self.archiveRequests = 0
+        self.archiveChannelDays = 0
+        self.archiveMaxDays = ARCHIVEMAXDAYS
+        self.thread = None
+
+    def handle_error(self, request, client_address):
+        #   A client giving up on a slow response is expected,  anything else is still reported.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            ThreadingHTTPServer.handle_error(self, request, client_address)
+
+    @property
+    def host(self):
+        return '{0}:{1}'.format(*self.server_address)
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+        return False
+
+
+if __name__ == "__main__":
+    with FakeDatamanager() as server:
+        print("Fake Datamanager listening on", server.host)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
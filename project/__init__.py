@@ -19,7 +19,7 @@
 __version__ = '0.5'
 
 
-__all__ = ["frosolar"]
+__all__ = ["frosolar", "asyncfrosolar", "fleet", "metadatacache", "sharedsnapshot", "history", "archive", "columnstore"]
 
 from messages import messages
 from collections import namedtuple
\ No newline at end of file
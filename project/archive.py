@@ -0,0 +1,436 @@
+"""
+    Fronius Solar Invertert communicatons - archive data
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    GetArchiveData returns the values the Datamanager has logged over a range of days.   It answers at most
+    ARCHIVEMAXDAYS days per request,  so ArchiveClient splits a longer range into windows,  fetches them a few at a
+    time and joins the windows of each channel back together.   Several channels are asked for in one request (the
+    Channel parameter repeated) and the response is split back into a series per channel.   For ranges too long to
+    hold at once the windows can be streamed instead,  the next window being fetched while the current one is used.
+    ArchiveSync remembers the last sample taken of each channel so a regular job only fetches what is new.
+
+    Each device in a response has the time its data starts at and,  for each channel,  the values keyed by the number
+    of seconds after that start:
+
+        "inverter/1": {"Start": "2018-06-01T00:00:00+10:00",  "End": ...,
+                       "Data": {"PowerReal_PAC_Sum": {"Unit": "W",  "Values": {"0": 0,  "300": 12.5,  ...}}}}
+
+    The values are returned as ArchiveSeries,  two array('d') of timestamp (time.time() seconds) and value.
+"""
+
+from array import array
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import time
+
+from metadatacache import hostsFileLock, readHostsFile, writeHostsFile
+
+
+#   Longest range of days the Datamanager answers in one request
+ARCHIVEMAXDAYS = 16
+
+#   Most channels asked for in one request.   The API sets no limit but every channel adds 16 days of samples to the
+#   response the Datamanager has to put together,  raise it with care.
+ARCHIVEMAXCHANNELS = 8
+
+#   The values of one channel of one device.   timestamps and values are array('d'),  oldest first.
+#   device is the key the Datamanager reports the device under,  such as inverter/1
+ArchiveSeries = namedtuple('ArchiveSeries', ['channel', 'device', 'unit', 'timestamps', 'values'])
+
+#   Bumped whenever the layout of the ArchiveSync file changes.   Files of any other version are ignored.
+ARCHIVESYNCFORMAT = 1
+
+#   Days fetched when a channel has never been synced.   Same as Fronius._getGetArchiveData
+ARCHIVESYNCDAYS = 15
+
+#   One sample yielded by ArchiveClient.iterSamples()
+ArchiveSample = namedtuple('ArchiveSample', ['channel', 'device', 'timestamp', 'value'])
+
+
+def archiveWindows(StartDate, EndDate, maxDays=ARCHIVEMAXDAYS):
+    """
+    Split a range of days into the fewest windows the Datamanager answers.
+    :param StartDate:   datetime.date.   First day,  included
+    :param EndDate:     datetime.date.   Last day,  included
+    :param maxDays:     Most days per window
+    :return:    List of (StartDate, EndDate) of each window,  in order
+    """
+    if EndDate < StartDate:
+        raise ValueError('EndDate {0} is before StartDate {1}'.format(EndDate, StartDate))
+    windows = []
+    step = datetime.timedelta(days=maxDays)
+    start = StartDate
+    while start <= EndDate:
+        end = min(start + step - datetime.timedelta(days=1), EndDate)
+        windows.append((start, end))
+        start = end + datetime.timedelta(days=1)
+    return windows
+
+
+def parseArchiveData(json):
+    """
+    The series in one GetArchiveData response.
+    :param json:    The decoded response
+    :return:    Dict of (channel, device) to ArchiveSeries
+    """
+    series = {}
+    for device, devicedata in json['Body']['Data'].items():
+        start = datetime.datetime.fromisoformat(devicedata['Start']).timestamp()
+        for channel, channeldata in devicedata.get('Data', {}).items():
+            #   The offsets are strings and come in no particular order
+            samples = sorted((int(offset), value) for offset, value in channeldata.get('Values', {}).items()
+                             if value is not None)
+            series[(channel, device)] = ArchiveSeries(channel, device, channeldata.get('Unit'),
+                                                      array('d', [start + offset for offset, _ in samples]),
+                                                      array('d', [value for _, value in samples]))
+    return series
+
+
+def trimSeries(series, after):
+    """
+    Drop the samples of a series that are no later than a time.   Used to drop the same sample reported at the edge
+    of two windows.
+    :param series:  ArchiveSeries
+    :param after:   Time of the last sample already taken,  or None
+    :return:    ArchiveSeries.   The same one if nothing is dropped
+    """
+    if after is None or not series.timestamps or series.timestamps[0] > after:
+        return series
+    keep = [index for index, timestamp in enumerate(series.timestamps) if timestamp > after]
+    return series._replace(timestamps=array('d', [series.timestamps[index] for index in keep]),
+                           values=array('d', [series.values[index] for index in keep]))
+
+
+def mergeSeries(parts):
+    """
+    Join the series of one channel fetched in consecutive windows.
+    :param parts:   ArchiveSeries of the same channel and device,  in window order and already trimmed
+    :return:    ArchiveSeries
+    """
+    first = parts[0]
+    timestamps = array('d')
+    values = array('d')
+    for part in parts:
+        timestamps.extend(part.timestamps)
+        values.extend(part.values)
+    return ArchiveSeries(first.channel, first.device, first.unit, timestamps, values)
+
+
+class ArchiveClient:
+    """
+    Fetches archive data over any range of days.
+    Attributes:
+        fronius             The Fronius the requests are sent through
+        maxParallelRequests Most requests in flight at once.  Keep it small,  the Datamanager is easily overloaded
+        maxDays             Most days asked for in one request
+        maxChannels         Most channels asked for in one request
+    """
+
+    def __init__(self, fronius, maxParallelRequests=2, maxDays=ARCHIVEMAXDAYS, maxChannels=ARCHIVEMAXCHANNELS):
+        self.fronius = fronius
+        self.maxParallelRequests = maxParallelRequests
+        self.maxDays = maxDays
+        self.maxChannels = maxChannels
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _fetchWindow(self, request):
+        """
+        :param request: (channels, StartDate, EndDate, options)
+        :return:    Dict of (channel, device) to ArchiveSeries
+        """
+        channels, start, end, options = request
+        series = self.fronius._getGetArchiveData(StartDate=start, EndDate=end, Channel=channels, **options)
+        if series is None:
+            raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(self.fronius.host))
+        return series
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _requests(self, channels, StartDate, EndDate, Scope, SeriesType, DeviceClass, DeviceID, devices=None):
+        """
+        Pack the channels into as few requests as maxChannels allows.   A request is needed per device only when
+        devices are named,  Scope System answers for every device at once.
+        :return:    The requests covering a range,  window by window
+        """
+        if isinstance(channels, str):
+            channels = [channels]
+        if EndDate is None:
+            EndDate = datetime.date.today()
+        if devices is None:
+            devices = [(DeviceClass, DeviceID)]
+        else:
+            Scope = 'Device'
+        batches = [list(channels[index:index + self.maxChannels]) for index in range(0, len(channels), self.maxChannels)]
+        return [(batch, start, end, {'Scope': Scope, 'SeriesType': SeriesType, 'DeviceClass': deviceclass,
+                                     'DeviceID': deviceid})
+                for start, end in archiveWindows(StartDate, EndDate, self.maxDays)
+                for deviceclass, deviceid in devices for batch in batches]
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def iterWindows(self, channels, StartDate, EndDate=None, Scope='System', SeriesType='Detail', DeviceClass=None,
+                    DeviceID=None, prefetch=1, after=None, devices=None):
+        """
+        Stream the archive of one or more channels one window at a time.   Only the window being used and the
+        `prefetch` windows being fetched behind it are held,  however long the range.
+        Stopping early (close() or leaving a for loop) drops the windows fetched ahead.
+        :param channels:    Channel name or list of channel names
+        :param StartDate:   datetime.date.   First day,  included
+        :param EndDate:     datetime.date.   Last day,  included.   Defaults to today
+        :param Scope:       System for every device,  Device for the one given by DeviceClass and DeviceID
+        :param SeriesType:  Detail or DailySum
+        :param DeviceClass:
+        :param DeviceID:
+        :param prefetch:    Requests sent ahead of the window being used.   Capped by maxParallelRequests
+        :param after:       Dict of (channel, device) to a time.   Samples of the channel no later than it are dropped
+        :param devices:     List of (DeviceClass, DeviceID) to fetch with Scope Device instead of DeviceClass and
+                            DeviceID
+        :return:    Generator of ArchiveSeries,  one per channel and device of each window,  in time order.   Series
+                    left empty by the dropped samples are not yielded
+        """
+        responses = self.iterResponses(channels, StartDate, EndDate, Scope, SeriesType, DeviceClass, DeviceID,
+                                       prefetch, after, devices)
+        try:
+            for response in responses:
+                for series in response:
+                    yield series
+        finally:
+            responses.close()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def iterResponses(self, channels, StartDate, EndDate=None, Scope='System', SeriesType='Detail', DeviceClass=None,
+                      DeviceID=None, prefetch=1, after=None, devices=None):
+        """
+        Same as iterWindows() but the series of each request are handed over together.   See iterWindows() for the
+        arguments.
+        :return:    Generator of lists of ArchiveSeries,  one list per request
+        """
+        requests = deque(self._requests(channels, StartDate, EndDate, Scope, SeriesType, DeviceClass, DeviceID,
+                                        devices))
+        inflight = max(1, min(prefetch + 1, self.maxParallelRequests))
+        #   Time of the last sample yielded of each channel and device
+        last = dict(after) if after else {}
+
+        pending = deque()
+        pool = ThreadPoolExecutor(max_workers=inflight)
+        try:
+            while requests or pending:
+                while requests and len(pending) < inflight:
+                    pending.append(pool.submit(self._fetchWindow, requests.popleft()))
+                response = pending.popleft().result()
+                kept = []
+                for key, series in response.items():
+                    series = trimSeries(series, last.get(key))
+                    if series.timestamps:
+                        last[key] = series.timestamps[-1]
+                        kept.append(series)
+                yield kept
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def iterSamples(self, channels, StartDate, EndDate=None, **options):
+        """
+        Stream the archive sample by sample.   See iterWindows() for the arguments.
+        :return:    Generator of ArchiveSample,  window by window and in time order within each channel
+        """
+        for series in self.iterWindows(channels, StartDate, EndDate, **options):
+            channel = series.channel
+            device = series.device
+            for timestamp, value in zip(series.timestamps, series.values):
+                yield ArchiveSample(channel, device, timestamp, value)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def fetch(self, channels, StartDate, EndDate=None, Scope='System', SeriesType='Detail', DeviceClass=None,
+              DeviceID=None, devices=None):
+        """
+        Fetch the archive of one or more channels over a range of days,  with maxParallelRequests in flight.
+        :param channels:    Channel name or list of channel names
+        :param StartDate:   datetime.date.   First day,  included
+        :param EndDate:     datetime.date.   Last day,  included.   Defaults to today
+        :param Scope:       System for every device,  Device for the one given by DeviceClass and DeviceID
+        :param SeriesType:  Detail or DailySum
+        :param DeviceClass:
+        :param DeviceID:
+        :param devices:     List of (DeviceClass, DeviceID).   See iterWindows()
+        :return:    Dict of (channel, device) to ArchiveSeries covering the whole range
+        """
+        parts = {}
+        for series in self.iterWindows(channels, StartDate, EndDate, Scope, SeriesType, DeviceClass, DeviceID,
+                                       prefetch=self.maxParallelRequests, devices=devices):
+            parts.setdefault((series.channel, series.device), []).append(series)
+        return {key: mergeSeries(seriesparts) for key, seriesparts in parts.items()}
+
+
+class ArchiveSync:
+    """
+    Incremental archive fetching.   The time of the last sample taken of each host,  channel and device (its high
+    water mark) is kept in a JSON file,  and each sync only asks for the days from there on.
+    The first day asked for is overlapDays before the day of the mark,  in the inverter's time zone.   Samples no later
+    than the mark are dropped so the overlap is never taken twice.
+    Attributes:
+        client          The ArchiveClient the requests are sent through
+        path            The JSON file.   Created when the first mark is saved
+        overlapDays     Days asked for again before the day of the mark
+    """
+
+    def __init__(self, client, path, overlapDays=1):
+        self.client = client
+        self.path = path
+        self.overlapDays = overlapDays
+        #   Shared with every other ArchiveSync of the same file
+        self._lock = hostsFileLock(path)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _read(self):
+        """
+        :return:    Dict of host to {channel: {device: mark}}
+        """
+        return readHostsFile(self.path, ARCHIVESYNCFORMAT)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _write(self, hosts):
+        writeHostsFile(self.path, ARCHIVESYNCFORMAT, hosts)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def marks(self):
+        """
+        :return:    Dict of (channel, device) to the time of the last sample taken from the client's host
+        """
+        channels = self._read().get(self.client.fronius.host, {})
+        return {(channel, device): mark for channel, devices in channels.items() for device, mark in devices.items()}
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _advance(self, taken):
+        """
+        Move the marks up to the last samples taken,  in one rewrite of the file.
+        :param taken:   Dict of (channel, device) to the time of the last sample taken.   Emptied once saved
+        :return:
+        """
+        if not taken:
+            return
+        with self._lock:
+            hosts = self._read()
+            channels = hosts.setdefault(self.client.fronius.host, {})
+            changed = False
+            for (channel, device), mark in taken.items():
+                devices = channels.setdefault(channel, {})
+                if mark > devices.get(device, float('-inf')):
+                    devices[device] = mark
+                    changed = True
+            if changed:
+                self._write(hosts)
+        taken.clear()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _localDate(self, timestamp):
+        """
+        The day a time falls on where the inverter is,  the days the Datamanager's archive is split into.
+        Uses the UTCOffset reported by the logger.   If it is not known the local time of this machine is used.
+        :param timestamp:
+        :return:    datetime.date
+        """
+        utcoffset = self.client.fronius.UTCOffset
+        if isinstance(utcoffset, (int, float)):
+            timezone = datetime.timezone(datetime.timedelta(seconds=utcoffset))
+            return datetime.datetime.fromtimestamp(timestamp, timezone).date()
+        return datetime.date.fromtimestamp(timestamp)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def reset(self, channels=None):
+        """
+        Forget the marks of the client's host so the next sync starts over.
+        :param channels:    Only forget these channels.   Defaults to all of them
+        :return:
+        """
+        with self._lock:
+            hosts = self._read()
+            if channels is None:
+                hosts.pop(self.client.fronius.host, None)
+            else:
+                for channel in channels:
+                    hosts.get(self.client.fronius.host, {}).pop(channel, None)
+            self._write(hosts)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def sync(self, channels, StartDate=None, EndDate=None, **options):
+        """
+        Stream everything new since the last sync.   A channel's mark is moved up once the consumer asks for the
+        next series,  so a consumer that stops part way gets the series it did not finish again next time.   The marks
+        are saved once the series of a request have all been taken and when the generator is closed.
+        :param channels:    Channel name or list of channel names
+        :param StartDate:   datetime.date.   First day of a channel or device that has never been synced.   Defaults
+                            to ARCHIVESYNCDAYS days ago
+        :param EndDate:     datetime.date.   Last day,  included.   Defaults to today where the inverter is
+        :param options:     Passed on to ArchiveClient.iterWindows()
+        :return:    Generator of ArchiveSeries holding only samples later than the marks
+        """
+        if isinstance(channels, str):
+            channels = [channels]
+        if EndDate is None:
+            EndDate = self._localDate(time.time())
+        if StartDate is None:
+            StartDate = EndDate - datetime.timedelta(days=ARCHIVESYNCDAYS)
+        marks = self.marks()
+
+        #   Channels are fetched together from the earliest day any of their devices needs
+        bystart = {}
+        for channel in channels:
+            channelmarks = [mark for (markchannel, _), mark in marks.items() if markchannel == channel]
+            start = StartDate
+            if channelmarks:
+                start = self._localDate(min(channelmarks)) - datetime.timedelta(days=self.overlapDays)
+            bystart.setdefault(min(start, EndDate), []).append(channel)
+
+        #   A device first seen part way through,  such as a meter added since the last sync,  has no mark of its own.
+        #   Its days before the channel's start are fetched from StartDate before any of it is handed over.
+        backfilled = set()
+        #   Last sample of each series the consumer has finished with,  not saved yet
+        taken = {}
+        try:
+            for start, startchannels in sorted(bystart.items()):
+                for response in self.client.iterResponses(startchannels, start, EndDate, after=marks, **options):
+                    for series in response:
+                        if ((series.channel, series.device) not in marks and series.channel not in backfilled and
+                                start > StartDate):
+                            backfilled.add(series.channel)
+                            for earlier in self._backfill(series.channel, StartDate, start, marks, options):
+                                for earlierseries in earlier:
+                                    yield earlierseries
+                                    taken[(earlierseries.channel, earlierseries.device)] = earlierseries.timestamps[-1]
+                                self._advance(taken)
+                        yield series
+                        taken[(series.channel, series.device)] = series.timestamps[-1]
+                    self._advance(taken)
+        finally:
+            self._advance(taken)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _backfill(self, channel, StartDate, start, marks, options):
+        """
+        The samples of a channel before start of every device without a mark.   The devices with marks have nothing
+        before start that has not already been taken,  it is all dropped.
+        :param channel:
+        :param StartDate:   First day
+        :param start:       Day the sync of the channel started on.   Not included
+        :param marks:
+        :param options:     See sync()
+        :return:    Generator of the lists of ArchiveSeries of each request
+        """
+        return self.client.iterResponses([channel], StartDate, start - datetime.timedelta(days=1), after=marks,
+                                         **options)
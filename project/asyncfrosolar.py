@@ -0,0 +1,327 @@
+"""
+    Fronius Solar Invertert communicatons - asyncio client
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    Same data model and properties as frosolar.Fronius but every request is made on the asyncio event loop,
+    so it can be embedded in asyncio collectors without wrapping every property in a thread.
+"""
+
+import asyncio
+from urllib.parse import urlsplit
+
+from frosolar import FroniusData, INITIALCOLLECTIONS, REALTIMECOLLECTIONS
+
+
+class AsyncHTTPTransport:
+    """
+    Minimal non-blocking HTTP/1.1 GET client built on asyncio streams.
+    The Datamanager only serves plain GET requests so nothing more is needed.  Idle connections are kept open and
+    reused in the same way as the requests session of Fronius.
+    Attributes:
+        connectTimeout  Seconds to wait for the Datamanager to accept the TCP connection
+        readTimeout     Seconds to wait for the Datamanager to send its response
+        poolSize        Maximum number of idle connections kept open per host
+    """
+
+    def __init__(self, connectTimeout=10, readTimeout=10, poolSize=4):
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.poolSize = poolSize
+
+        #   Idle keep-alive connections for each (host, port, https)
+        self._idle = {}
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def get(self, url):
+        """
+        Perform a GET request.
+        :param url:
+        :return:    (HTTP status code, raw bytes of the response body)
+        """
+        parts = urlsplit(url)
+        secure = parts.scheme == 'https'
+        port = parts.port or (443 if secure else 80)
+        key = (parts.hostname, port, secure)
+
+        target = parts.path or '/'
+        if parts.query:
+            target = target + '?' + parts.query
+        request = ('GET {0} HTTP/1.1\r\nHost: {1}\r\nAccept: application/json\r\nConnection: keep-alive\r\n\r\n'
+                   .format(target, parts.netloc)).encode('latin-1')
+
+        #   Reuse an idle connection if there is one.   The Datamanager may have dropped it in the meantime,  or
+        #   left it half open so that it never answers.   Either way the request is retried once on a brand new
+        #   connection and the other idle connections,  just as old,  are closed rather than tried in turn.
+        idle = self._idle.setdefault(key, [])
+        if idle:
+            reader, writer = idle.pop()
+            try:
+                return await self._exchange(key, reader, writer, request)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                while idle:
+                    idle.pop()[1].close()
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, port, ssl=True if secure else None), self.connectTimeout)
+        return await self._exchange(key, reader, writer, request)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def _exchange(self, key, reader, writer, request):
+        """
+        Send one request on a connection and read back the response.
+        The connection is returned to the idle pool if the Datamanager allows it to be kept alive.
+        :return:    (HTTP status code, raw bytes of the response body)
+        """
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, keepalive, body = await asyncio.wait_for(self._readResponse(reader), self.readTimeout)
+        except BaseException:
+            writer.close()
+            raise
+
+        if keepalive and len(self._idle[key]) < self.poolSize:
+            self._idle[key].append((reader, writer))
+        else:
+            writer.close()
+        return status, body
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def _readResponse(self, reader):
+        """
+        Read the status line, headers and body of a single response.
+        :return:    (HTTP status code, whether the connection can be reused, raw bytes of the body)
+        """
+        statusline = await reader.readline()
+        if not statusline:
+            raise ConnectionError('Connection closed by the Fronius unit')
+        version, status = statusline.split(None, 2)[:2]
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keepalive = version == b'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    #   Skip any trailers
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+
+        #   No length given so the body runs until the connection is closed.
+        else:
+            body = await reader.read()
+            keepalive = False
+
+        return int(status), keepalive, body
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def close(self):
+        """
+        Close every idle connection.
+        :return:
+        """
+        for idle in self._idle.values():
+            while idle:
+                reader, writer = idle.pop()
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+
+class AsyncFronius(FroniusData):
+    """
+    asyncio interface to communicate with the Fronius Symo over http / JSON
+    Holds the same records and has the same properties as Fronius,  both come from FroniusData.   None of the blocking
+    requests of Fronius are inherited.   Properties never fetch anything,  they return whatever the last awaited
+    refresh() stored.
+
+        async with AsyncFronius(host) as fronius:
+            await fronius.refresh()
+            print(fronius.ACPower)
+
+    Attributes:
+        host            The ip/domain of the Fronius device
+        useHTTPS        Use HTTPS instead of HTTP :  Froinus API V1 only supports HTTP
+        HTTPtimeout     HTTP timeout in seconds.  Used for both connect and read unless they are given separately
+        connectTimeout  Seconds to wait for the Datamanager to accept the TCP connection
+        readTimeout     Seconds to wait for the Datamanager to send its response
+        poolSize        Maximum number of idle connections kept open to the Datamanager
+        maxParallelRequests     How many requests refresh() may have in flight at the same time
+        failureThreshold    Consecutive failed requests after which the host's circuit breaker opens
+        breakerCooldown     Seconds the circuit stays open before a probe request is let through
+        maxBreakerCooldown  The cooldown doubles each time a probe fails,  up to this many seconds
+        jsonDecoder     Callable decoding the raw bytes of a response.  Defaults to decodeJSON (orjson if installed)
+        cacheTTLs       Dict of collection to seconds it stays fresh.  Defaults to COLLECTIONTTLS.   Properties never
+                        fetch,  the cache only records when each collection was last refreshed
+        metadataCache   A metadatacache.MetadataCache.   connect() loads the metadata from it instead of fetching it
+        history         A history.MetricHistory.   See Fronius
+    """
+
+    def __init__(self, host, useHTTPS=False, HTTPtimeout=10, connectTimeout=None, readTimeout=None, poolSize=4, maxParallelRequests=4, failureThreshold=3, breakerCooldown=5, maxBreakerCooldown=300, jsonDecoder=None, cacheTTLs=None, metadataCache=None, history=None):
+
+        #   Same settings and records as Fronius.
+        self._initialiseSettings(host, useHTTPS=useHTTPS, HTTPtimeout=HTTPtimeout, connectTimeout=connectTimeout,
+                                 readTimeout=readTimeout, poolSize=poolSize, maxParallelRequests=maxParallelRequests,
+                                 failureThreshold=failureThreshold, breakerCooldown=breakerCooldown,
+                                 maxBreakerCooldown=maxBreakerCooldown, jsonDecoder=jsonDecoder, cacheTTLs=cacheTTLs,
+                                 metadataCache=metadataCache, history=history)
+        self.transport = AsyncHTTPTransport(self.connectTimeout, self.readTimeout, poolSize)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def connect(self, populate=True):
+        """
+        Check the API version of the unit and optionally fetch the initial set of data.
+        :param populate:    Fetch every collection Fronius fetches on construction
+        :return:
+        """
+        #   With a metadata cache nothing is asked for unless the API version has to be validated.
+        json = None
+        if self.metadataCache is None or self.metadataCache.validateAPIVersion:
+            json = await self._fetchDataFromAPIAsync(self._collectionURL('APIVersion'))
+            if json is None:
+                raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(self.host))
+
+        if not self._loadMetadata(json):
+            if json is None:
+                json = await self._fetchDataFromAPIAsync(self._collectionURL('APIVersion'))
+                if json is None:
+                    raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(self.host))
+            self._parseAPIVersion(json)
+            if self.metadataCache is not None:
+                self.metadataCache.store(self.host, 'APIVersion', json)
+        if self.APIVersion != 1:
+            raise ValueError('Wrong API Version.  Version {} not supported'.format(self.APIVersion))
+
+        #   Anything already loaded from the metadata cache is skipped.
+        if populate:
+            await self.refresh([collection for collection in INITIALCOLLECTIONS if self._pollWait(collection) <= 0])
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def refresh(self, collections=None):
+        """
+        Fetch several collections concurrently.
+        :param collections:     Collection names as understood by Fronius._refreshCollection.  Defaults to REALTIMECOLLECTIONS
+        :return:    List with the result of each collection
+        """
+        if collections is None:
+            collections = REALTIMECOLLECTIONS
+
+        semaphore = asyncio.Semaphore(self.maxParallelRequests)
+
+        async def bounded(collection):
+            async with semaphore:
+                return await self.refreshCollection(collection)
+
+        return await asyncio.gather(*[bounded(collection) for collection in collections])
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def refreshCollection(self, collection):
+        """
+        Fetch a single collection.
+        :param collection:  Collection name as understood by Fronius._refreshCollection
+        :return:    False if the unit could not be reached, otherwise the result of the parser
+        """
+        url = self._collectionURL(collection)
+        json = await self._fetchDataFromAPIAsync(url)
+        if json is None:
+            return False
+        #   Marked as fetched by the parser,  but only if the unit reports success.
+        self._extractCRHData(json)
+        return self._parseCollection(collection, json, url)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def _fetchDataFromAPIAsync(self, url):
+        """
+        Performs the http query to Fronius unit without blocking the event loop.
+        :param url:    The Target URL of the Fronius system.
+        :return:    Return the JSON text block containing queried data
+        """
+        if not self.breaker.allowRequest():
+            return None
+
+        #   See Fronius._fetchDataFromAPI.   A malformed response raises ValueError but still counts as a failure.
+        recorded = False
+        try:
+            status_code, content = await self.transport.get(url)
+            self.breaker.recordResponse(status_code)
+            recorded = True
+
+        except asyncio.TimeoutError:
+            print("Request Exception Timed Out")
+            return None
+
+        except (OSError, asyncio.IncompleteReadError):
+            print("Connection Error")
+            return None
+
+        finally:
+            if not recorded:
+                self.breaker.recordFailure()
+
+        return self._decodeResponse(status_code, content, url)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    async def close(self):
+        """
+        Close the pooled connections to the Fronius unit.
+        :return:
+        """
+        await self.transport.close()
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    """
+    This is used for part of the manual testing of the module during development
+    """
+
+    async def main():
+        async with AsyncFronius("10.0.3.250") as fronius:
+            await fronius.refresh()
+            print('ACPower', fronius.ACPower)
+            print('ACVoltage', fronius.ACVoltage)
+            print('PowerReal_P_Sum', fronius.PowerReal_P_Sum)
+            print('Power_PV', fronius.Power_PV)
+
+    asyncio.run(main())
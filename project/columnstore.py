@@ -0,0 +1,295 @@
+"""
+    Fronius Solar Invertert communicatons - local column store
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    Keeps archive and realtime values on disk for fast range queries.   Each channel of each device of each host is
+    stored as two columns of doubles (native byte order),  one of timestamps and one of values,  split into one pair
+    of files per calendar month (UTC):
+
+        <directory>/<host>/<device>/<channel>/2018-06.ts
+        <directory>/<host>/<device>/<channel>/2018-06.val
+
+    Samples are only ever appended,  and only if they are later than the last one stored,  so writing the same
+    samples twice stores them once.   Reads map the files into memory and find the range by binary search on the
+    timestamp column.   What they return are views of the mapped files,  nothing is parsed or copied.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+import calendar
+import mmap
+import os
+import re
+import threading
+import time
+
+#   NumPy is optional.   Only arrays() needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+ITEMSIZE = array('d').itemsize
+
+#   Characters left as they are in directory names.   Anything else (the / of inverter/1) becomes _
+_UNSAFE = re.compile(r'[^A-Za-z0-9._:-]')
+
+
+def _partition(timestamp):
+    """
+    :return:    The name of the month (UTC) a time falls in
+    """
+    return time.strftime('%Y-%m', time.gmtime(timestamp))
+
+
+def _nextPartition(timestamp):
+    """
+    :return:    The time the month after the one a time falls in starts
+    """
+    moment = time.gmtime(timestamp)
+    year, month = (moment.tm_year + 1, 1) if moment.tm_mon == 12 else (moment.tm_year, moment.tm_mon + 1)
+    return calendar.timegm((year, month, 1, 0, 0, 0))
+
+
+class ColumnStore:
+    """
+    Append-only columns of timestamps and values,  by host,  channel and device.
+    One process writes to a directory.   Any number of readers may map it.
+    Attributes:
+        directory   Where the files are kept
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        #   Time of the last sample stored of each column,  None if it has none
+        self._last = {}
+        #   Mapped files by path:  (size they were mapped at,  mmap,  memoryview of doubles)
+        self._maps = {}
+        self._lock = threading.Lock()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _columnPath(self, host, channel, device):
+        return os.path.join(self.directory, _UNSAFE.sub('_', host), _UNSAFE.sub('_', device), _UNSAFE.sub('_', channel))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def partitions(self, host, channel, device):
+        """
+        :return:    The months stored for a column,  oldest first
+        """
+        try:
+            names = os.listdir(self._columnPath(host, channel, device))
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-3] for name in names if name.endswith('.ts'))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _lastStored(self, host, channel, device):
+        """
+        Time of the last sample of a column.   A pair of files left different lengths by a crash part way through an
+        append is cut back to the samples both hold.   A month left empty that way is passed over for the one before.
+        :return:    None if nothing is stored
+        """
+        key = (host, channel, device)
+        if key in self._last:
+            return self._last[key]
+        last = None
+        for partition in reversed(self.partitions(host, channel, device)):
+            base = os.path.join(self._columnPath(host, channel, device), partition)
+            samples = min(os.path.getsize(base + '.ts'), os.path.getsize(base + '.val')) // ITEMSIZE
+            for suffix in ('.ts', '.val'):
+                if os.path.getsize(base + suffix) != samples * ITEMSIZE:
+                    os.truncate(base + suffix, samples * ITEMSIZE)
+            if samples:
+                with open(base + '.ts', 'rb') as column:
+                    column.seek((samples - 1) * ITEMSIZE)
+                    last = array('d', column.read(ITEMSIZE))[0]
+                break
+        self._last[key] = last
+        return last
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def append(self, host, channel, device, timestamps, values):
+        """
+        Store samples.   Those no later than the last sample stored are skipped.
+        :param host:
+        :param channel:
+        :param device:
+        :param timestamps:  Sequence of times (time.time() seconds),  in order
+        :param values:      Sequence of values,  one per timestamp
+        :return:    Number of samples stored
+        """
+        if len(timestamps) != len(values):
+            raise ValueError('{0} timestamps but {1} values'.format(len(timestamps), len(values)))
+        if not isinstance(timestamps, array) or timestamps.typecode != 'd':
+            timestamps = array('d', timestamps)
+        if not isinstance(values, array) or values.typecode != 'd':
+            values = array('d', values)
+
+        with self._lock:
+            last = self._lastStored(host, channel, device)
+            first = start = 0 if last is None else bisect_right(timestamps, last)
+            if start == len(timestamps):
+                return 0
+            columnpath = self._columnPath(host, channel, device)
+            os.makedirs(columnpath, exist_ok=True)
+
+            #   One write per month the samples fall in
+            while start < len(timestamps):
+                end = bisect_left(timestamps, _nextPartition(timestamps[start]), start)
+                base = os.path.join(columnpath, _partition(timestamps[start]))
+                with open(base + '.ts', 'ab') as column:
+                    column.write(timestamps[start:end].tobytes())
+                with open(base + '.val', 'ab') as column:
+                    column.write(values[start:end].tobytes())
+                start = end
+            self._last[(host, channel, device)] = timestamps[-1]
+        return len(timestamps) - first
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def appendSeries(self, host, series):
+        """
+        Store archive data.
+        :param host:
+        :param series:  An archive.ArchiveSeries,  or an iterable of them such as ArchiveSync.sync()
+        :return:    Number of samples stored
+        """
+        if hasattr(series, 'channel'):
+            series = [series]
+        return sum(self.append(host, part.channel, part.device, part.timestamps, part.values) for part in series)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def appendHistory(self, host, history, device='realtime'):
+        """
+        Store the samples of a history.MetricHistory not stored yet.   Each metric is stored as a channel of its own.
+        :param host:
+        :param history:
+        :param device:  Device the realtime values are stored under
+        :return:    Number of samples stored
+        """
+        stored = 0
+        for name in history.metrics:
+            samples = history.samples(name)
+            stored += self.append(host, name, device, [timestamp for timestamp, _ in samples],
+                                  [value for _, value in samples])
+        return stored
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _map(self, path):
+        """
+        :return:    The file mapped into memory as a memoryview of doubles.   Remapped if the file has grown
+        """
+        size = os.path.getsize(path)
+        mapped = self._maps.get(path)
+        if mapped is None or mapped[0] != size:
+            self._unmap(path)
+            if not size:
+                return memoryview(array('d'))
+            with open(path, 'rb') as column:
+                mapping = mmap.mmap(column.fileno(), 0, access=mmap.ACCESS_READ)
+            mapped = (size, mapping, memoryview(mapping).cast('d'))
+            self._maps[path] = mapped
+        return mapped[2]
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _unmap(self, path):
+        """
+        Close the map of a file,  if it has one.
+        Views handed out by segments() keep the map open until they are dropped,  it is then closed by the garbage
+        collector instead.
+        :return:
+        """
+        mapped = self._maps.pop(path, None)
+        if mapped is None:
+            return
+        size, mapping, view = mapped
+        view.release()
+        try:
+            mapping.close()
+        except BufferError:
+            pass
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Close every mapped file.
+        :return:
+        """
+        with self._lock:
+            for path in list(self._maps):
+                self._unmap(path)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def segments(self, host, channel, device, start=None, end=None):
+        """
+        The samples of a column in a range of time,  without copying them.
+        :param host:
+        :param channel:
+        :param device:
+        :param start:   Earliest time,  included.   Defaults to the first sample
+        :param end:     Latest time,  excluded.   Defaults to the last sample
+        :return:    List of (timestamps, values) memoryviews of doubles,  one pair per month,  oldest first
+        """
+        columnpath = self._columnPath(host, channel, device)
+        segments = []
+        with self._lock:
+            for partition in self.partitions(host, channel, device):
+                #   Months wholly outside the range are not even opened
+                if start is not None and partition < _partition(start):
+                    continue
+                if end is not None and partition > _partition(end):
+                    break
+                base = os.path.join(columnpath, partition)
+                timestamps = self._map(base + '.ts')
+                values = self._map(base + '.val')
+                samples = min(len(timestamps), len(values))
+                first = 0 if start is None else bisect_left(timestamps, start, 0, samples)
+                last = samples if end is None else bisect_left(timestamps, end, first, samples)
+                if first < last:
+                    segments.append((timestamps[first:last], values[first:last]))
+        return segments
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def read(self, host, channel, device, start=None, end=None):
+        """
+        The samples of a column in a range of time,  joined into one pair of arrays.   See segments()
+        :return:    (timestamps, values) array('d').   A copy of the samples
+        """
+        timestamps = array('d')
+        values = array('d')
+        for segmenttimestamps, segmentvalues in self.segments(host, channel, device, start, end):
+            timestamps.frombytes(segmenttimestamps.cast('B'))
+            values.frombytes(segmentvalues.cast('B'))
+        return timestamps, values
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def arrays(self, host, channel, device, start=None, end=None):
+        """
+        The samples of a column in a range of time as NumPy arrays.   Views of the mapped file if the range is
+        within one month,  otherwise joined into a copy.
+        :return:    (timestamps, values)
+        """
+        if numpy is None:
+            raise ImportError('NumPy is not installed.  Use segments() or read() instead')
+        segments = [(numpy.frombuffer(timestamps, dtype=numpy.float64), numpy.frombuffer(values, dtype=numpy.float64))
+                    for timestamps, values in self.segments(host, channel, device, start, end)]
+        if not segments:
+            return numpy.empty(0), numpy.empty(0)
+        if len(segments) == 1:
+            return segments[0]
+        return (numpy.concatenate([timestamps for timestamps, _ in segments]),
+                numpy.concatenate([values for _, values in segments]))
@@ -0,0 +1,283 @@
+"""
+    Fronius Solar Invertert communicatons - fleet polling
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    Polls one Fronius per site across many sites.   The refreshes of every site are scheduled on one thread pool
+    with a cap on the total number of requests in flight and a cap on the number in flight to any single Datamanager.
+    The values held for the whole fleet can be exported as one NumPy structured array,  one row per host.
+"""
+
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
+
+from frosolar import Fronius, COLLECTIONRECORDS, COLLECTIONFIELDS
+
+#   NumPy is optional.   Only fleetArray() needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#   Collections refreshed on every sweep when none are named.
+FLEETCOLLECTIONS = ['CommonInverterData', '3PInverterData', 'MeterRealtimeData', 'PowerFlowRealtimeData']
+
+#   Outcome of one sweep for one host.
+#   values is a dict of collection name to the dict returned by Fronius.collectionValues
+#   errors is a dict of collection name (or 'connect') to the exception raised
+FleetResult = namedtuple('FleetResult', ['host', 'values', 'errors', 'elapsed'])
+
+#   Collections exported by fleetArray() when none are named.
+FLEETARRAYCOLLECTIONS = ['CommonInverterData', '3PInverterData', 'MeterRealtimeData']
+
+#   Meter fields that are not numbers
+NONNUMERICFIELDS = ('Details', 'Manufacturer', 'Model', 'Serial')
+
+
+def fleetColumns(collections=None):
+    """
+    The value columns of fleetArray().   One per numeric value cell of each collection,  named after the field.
+    :param collections:     Defaults to FLEETARRAYCOLLECTIONS
+    :return:    List of (column, collection, field)
+    """
+    if collections is None:
+        collections = FLEETARRAYCOLLECTIONS
+    columns = []
+    for collection in collections:
+        if collection not in COLLECTIONRECORDS:
+            raise ValueError('Unknown collection {0}'.format(collection))
+        for fieldmap in COLLECTIONFIELDS[collection].fields:
+            if fieldmap.kind in ('unit', 'cell') and fieldmap.field not in NONNUMERICFIELDS:
+                columns.append((fieldmap.field, collection, fieldmap.field))
+        if not columns or columns[-1][1] != collection:
+            raise ValueError('Collection {0} has no value cells to export'.format(collection))
+    names = [column for column, _, _ in columns]
+    if len(set(names)) != len(names):
+        raise ValueError('Collections {0} have fields with the same name'.format(collections))
+    return columns
+
+
+def fleetArray(units, collections=None):
+    """
+    The values held by each unit as one structured array so the whole fleet can be summed,  ranked and compared
+    without a loop over the units.   Nothing is fetched.
+    Columns are host,  as wide as the longest host,  one float64 per field in fleetColumns() and fetched_<collection>,
+    the time.time() each collection was last stored.   Values the unit did not report,  and every value of a host
+    without a unit,  are NaN.
+    :param units:           Iterable of (host, Fronius).   The Fronius may be None for a host not yet connected
+    :param collections:     Defaults to FLEETARRAYCOLLECTIONS
+    :return:    numpy structured array with one row per host
+    """
+    if numpy is None:
+        raise ImportError('NumPy is not installed.  Use FleetResult.values instead')
+    if collections is None:
+        collections = FLEETARRAYCOLLECTIONS
+    columns = fleetColumns(collections)
+
+    #   Fields grouped by collection so each record is looked up once per unit
+    bycollection = [(collection, COLLECTIONRECORDS[collection],
+                     [field for _, fieldcollection, field in columns if fieldcollection == collection])
+                    for collection in collections]
+    nan = float('nan')
+    now = time.time()
+    hosts = []
+    flat = []
+    for host, unit in units:
+        hosts.append(host)
+        if unit is None:
+            flat.extend([nan] * (len(columns) + len(collections)))
+            continue
+        fetched = []
+        for collection, recordname, fields in bycollection:
+            record = getattr(unit, recordname)
+            for field in fields:
+                cell = getattr(record, field)
+                value = cell.Value
+                if cell.lastupdated is None or value is None or value.__class__ is str:
+                    value = nan
+                flat.append(value)
+            age = unit.cache.age(collection)
+            fetched.append(nan if age is None else now - age)
+        flat.extend(fetched)
+
+    #   The host column is sized to the hosts so that no host name is cut short
+    dtype = numpy.dtype([('host', 'U{0}'.format(max([len(host) for host in hosts], default=1)))] +
+                        [(column, 'f8') for column, _, _ in columns] +
+                        [('fetched_{0}'.format(collection), 'f8') for collection in collections])
+
+    #   Converted in one go and then copied in column by column,  much quicker than numpy.array() of row tuples
+    table = numpy.array(flat, dtype='f8').reshape(len(hosts), len(columns) + len(collections))
+    fleet = numpy.empty(len(hosts), dtype=dtype)
+    fleet['host'] = hosts
+    for index, name in enumerate(dtype.names[1:]):
+        fleet[name] = table[:, index]
+    return fleet
+
+
+class _HostSweep:
+    """
+    Book keeping for one host during a sweep.
+    """
+    __slots__ = ('host', 'pending', 'inflight', 'values', 'errors', 'starttime')
+
+    def __init__(self, host, pending):
+        self.host = host
+        self.pending = deque(pending)
+        self.inflight = 0
+        self.values = {}
+        self.errors = {}
+        self.starttime = time.perf_counter()
+
+
+class FroniusFleet:
+    """
+    Polls a list of Fronius units with bounded concurrency.
+    Attributes:
+        hosts               The ip/domain of each Fronius device
+        maxConcurrency      Most requests in flight across the whole fleet
+        perHostConcurrency  Most requests in flight to any one Datamanager
+        collections         Collections refreshed on each sweep.  Defaults to FLEETCOLLECTIONS
+        froniusOptions      Passed on to each Fronius.   Defaults to lazy construction and a 3 second connect timeout
+                            so that an unreachable host is given up on quickly.
+    """
+
+    def __init__(self, hosts, maxConcurrency=32, perHostConcurrency=2, collections=None, **froniusOptions):
+        self.hosts = list(hosts)
+        self.maxConcurrency = maxConcurrency
+        self.perHostConcurrency = perHostConcurrency
+        if collections is None:
+            collections = FLEETCOLLECTIONS
+        self.collections = list(collections)
+
+        froniusOptions.setdefault('lazy', True)
+        froniusOptions.setdefault('connectTimeout', 3)
+        froniusOptions.setdefault('poolSize', perHostConcurrency)
+        self.froniusOptions = froniusOptions
+
+        #   One Fronius per host,  created on the first sweep that reaches the host.
+        self.units = {}
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def sweep(self, collections=None):
+        """
+        Refresh every host and wait for all of them.
+        :param collections:     Collections to refresh.  Defaults to self.collections
+        :return:    dict of host to FleetResult
+        """
+        return {result.host: result for result in self.iterSweep(collections)}
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def iterSweep(self, collections=None):
+        """
+        Refresh every host,  yielding each host's FleetResult as soon as all of its collections have completed.
+        A host that cannot be reached fails its first request and is dropped from the sweep,  it never holds up the
+        other hosts.
+        :param collections:     Collections to refresh.  Defaults to self.collections
+        :return:    Generator of FleetResult
+        """
+        if collections is None:
+            collections = self.collections
+
+        sweeps = []
+        for host in self.hosts:
+            if host in self.units:
+                sweeps.append(_HostSweep(host, collections))
+            else:
+                #   The unit has to be constructed before anything else can be fetched from it.
+                sweeps.append(_HostSweep(host, ['connect']))
+
+        #   Hosts with nothing to fetch are finished straight away
+        for hostsweep in sweeps:
+            if not hostsweep.pending:
+                yield FleetResult(hostsweep.host, {}, {}, 0.0)
+
+        inflight = {}
+        with ThreadPoolExecutor(max_workers=self.maxConcurrency) as pool:
+            self._schedule(pool, sweeps, inflight)
+            while inflight:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    hostsweep, task = inflight.pop(future)
+                    hostsweep.inflight -= 1
+                    self._complete(hostsweep, task, future, collections)
+                    if not hostsweep.pending and hostsweep.inflight == 0:
+                        yield FleetResult(hostsweep.host, hostsweep.values, hostsweep.errors,
+                                          time.perf_counter() - hostsweep.starttime)
+                self._schedule(pool, sweeps, inflight)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _schedule(self, pool, sweeps, inflight):
+        """
+        Submit as many pending requests as the global and per host caps allow.
+        """
+        for hostsweep in sweeps:
+            if len(inflight) >= self.maxConcurrency:
+                return
+            #   Nothing else can be sent to a host until it has been connected.
+            if hostsweep.host in self.units:
+                limit = self.perHostConcurrency
+            else:
+                limit = 1
+            while hostsweep.pending and hostsweep.inflight < limit and len(inflight) < self.maxConcurrency:
+                task = hostsweep.pending.popleft()
+                if task == 'connect':
+                    future = pool.submit(Fronius, hostsweep.host, **self.froniusOptions)
+                else:
+                    future = pool.submit(self.units[hostsweep.host]._refreshCollection, task)
+                hostsweep.inflight += 1
+                inflight[future] = (hostsweep, task)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _complete(self, hostsweep, task, future, collections):
+        """
+        Record the outcome of one request.
+        """
+        try:
+            result = future.result()
+            #   The unit could not be reached or its circuit breaker is open.   What it holds is not from this sweep.
+            if result is False:
+                raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(hostsweep.host))
+        except Exception as err:
+            hostsweep.errors[task] = err
+            #   The host is not answering.   Drop the rest of its requests rather than waiting out more timeouts.
+            hostsweep.pending.clear()
+            return
+
+        if task == 'connect':
+            self.units[hostsweep.host] = result
+            hostsweep.pending.extend(collections)
+        elif task in COLLECTIONRECORDS:
+            hostsweep.values[task] = self.units[hostsweep.host].collectionValues(task)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def toArray(self, collections=None):
+        """
+        The values last fetched from every host.   See fleetArray().
+        :param collections:     Defaults to FLEETARRAYCOLLECTIONS
+        :return:    numpy structured array with one row per host,  in the order of self.hosts
+        """
+        return fleetArray([(host, self.units.get(host)) for host in self.hosts], collections)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Close the pooled connections of every unit.
+        :return:
+        """
+        for unit in self.units.values():
+            unit.close()
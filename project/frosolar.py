@@ -29,28 +29,869 @@
 
 
 import requests
+from requests.adapters import HTTPAdapter
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import functools
+import threading
+import json as jsonlib
+import time
+
+from metadatacache import METADATACOLLECTIONS
+from archive import parseArchiveData
+
+#   orjson parses the raw response bytes several times faster than the standard library.   It is optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+#   Collections fetched to populate a new instance.   Each name is understood by Fronius._refreshCollection
+INITIALCOLLECTIONS = ['InverterInfo', 'LoggerInfo', 'PowerFlowRealtimeData', 'MeterRealtimeData',
+                      'CumulationInverterData', 'CommonInverterData', '3PInverterData', 'MinMaxInverterData',
+                      'ActiveDeviceInfo']
+
+#   The record attribute of Fronius that each stored collection is kept in.
+COLLECTIONRECORDS = {'InverterInfo': 'InverterInfo',
+                     'LoggerInfo': 'LoggerInfo',
+                     'LoggerLEDInfo': 'InverterStatusLEDs',
+                     'PowerFlowRealtimeData': 'PowerFlowRealtimeSite',
+                     'MeterRealtimeData': 'MeterRealTimeData',
+                     'CommonInverterData': 'CommonInverterValues',
+                     '3PInverterData': 'ThreePhaseinverterValues',
+                     'MinMaxInverterData': 'MinMaxInverterDatavalues'}
+
+#   Properties captured by snapshot(),  by the collection they are read from.
+SNAPSHOTPROPERTIES = {
+    'CommonInverterData': ['ACPower', 'Day_Energy', 'Year_Energy', 'Total_Energy', 'ACCurrent', 'ACVoltage',
+                           'ACFrequency', 'DCCurrent', 'DCVoltage', 'DeviceStatusCode', 'DeviceErrorCode',
+                           'DeviceLEDColor', 'DeviceLEDState', 'DeviceMgmtTimerRemainingTime', 'DeviceStateToReset'],
+    '3PInverterData': ['ACcurrentPH1', 'ACcurrentPH2', 'ACcurrentPH3', 'ACVoltsPH1', 'ACVoltsPH2', 'ACVoltsPH3',
+                       'AmbientTemp', 'Rotation_Speed_Fan_FR', 'Rotation_Speed_Fan_FL', 'Rotation_Speed_Fan_BR',
+                       'Rotation_Speed_Fan_BL'],
+    'MinMaxInverterData': ['Day_PowerMAX', 'Day_VoltageACMAX', 'Day_VoltageACMIN', 'Day_VoltageDCMAX',
+                           'Year_PowerMAX', 'Year_VoltageACMAX', 'Year_VoltageACMIN', 'Year_VoltageDCMAX',
+                           'Total_PowerMAX', 'Total_VoltageACMAX', 'Total_VoltageACMIN', 'Total_VoltageDCMAX'],
+    'MeterRealtimeData': ['Current_AC_Phase_1', 'Current_AC_Phase_2', 'Current_AC_Phase_3', 'Serial', 'Enable',
+                          'EnergyReactive_VArAC_Sum_Consumed', 'EnergyReactive_VArAC_Sum_Produced',
+                          'EnergyReal_WAC_Minus_Absolute', 'EnergyReal_WAC_Plus_Absolute',
+                          'EnergyReal_WAC_Sum_Consumed', 'EnergyReal_WAC_Sum_Produced', 'Frequency_Phase_Average',
+                          'Meter_Location_Current', 'PowerApparent_S_Phase_1', 'PowerApparent_S_Phase_2',
+                          'PowerApparent_S_Phase_3', 'PowerApparent_S_Sum', 'PowerFactor_Phase_1',
+                          'PowerFactor_Phase_2', 'PowerFactor_Phase_3', 'PowerFactor_Sum', 'PowerReactive_Q_Phase_1',
+                          'PowerReactive_Q_Phase_2', 'PowerReactive_Q_Phase_3', 'PowerReactive_Q_Sum',
+                          'PowerReal_P_Phase_1', 'PowerReal_P_Phase_2', 'PowerReal_P_Phase_3', 'PowerReal_P_Sum',
+                          'TimeStamp', 'Visible', 'Voltage_AC_PhaseToPhase_12', 'Voltage_AC_PhaseToPhase_23',
+                          'Voltage_AC_PhaseToPhase_31', 'Voltage_AC_Phase_1', 'Voltage_AC_Phase_2',
+                          'Voltage_AC_Phase_3', 'Manufacturer', 'Model'],
+    'PowerFlowRealtimeData': ['BatteryStandby', 'Energy_Day', 'Energy_Total', 'Energy_Year', 'Meter_Location', 'Mode',
+                              'Power_Akku', 'Power_Grid', 'Power_Load', 'Power_PV', 'Rel_Autonomy',
+                              'Rel_SelfConsumption'],
+    'InverterInfo': ['InverterCustomName', 'InverterDT', 'InverterErrorCode', 'InverterPVPower', 'InverterShow',
+                     'InverterStatusCode', 'InverterUniqueID'],
+    'LoggerInfo': ['CO2Factor', 'CO2Unit', 'CashCurrency', 'CashFactor', 'DefaultLanguage', 'DeliveryFactor',
+                   'HWVersion', 'PlatformID', 'ProductID', 'SWVersion', 'TimezoneLocation', 'TimezoneName', 'UTCOffset',
+                   'LoggerUniqueID'],
+    'LoggerLEDInfo': ['PowerLEDColor', 'PowerLEDState', 'SolarNetLEDColor', 'SolarNetLEDState', 'SolarWebLEDColor',
+                      'SolarWebLEDState', 'WLANLEDColor', 'WLANLEDState']}
+
+#   Field of the collection's record behind each property,  where it differs from the property name.
+#   (field, name) for a value of a nested record such as DeviceStatus or an LED.
+PROPERTYFIELDS = {'ACPower': 'PAC', 'ACCurrent': 'IAC', 'ACVoltage': 'VAC', 'ACFrequency': 'FAC', 'DCCurrent': 'IDC',
+                  'DCVoltage': 'VDC',
+                  'ACcurrentPH1': 'IAC_L1', 'ACcurrentPH2': 'IAC_L2', 'ACcurrentPH3': 'IAC_L3',
+                  'ACVoltsPH1': 'VAC_PH1', 'ACVoltsPH2': 'VAC_PH2', 'ACVoltsPH3': 'VAC_PH3', 'AmbientTemp': 'T_Ambient',
+                  'Day_PowerMAX': 'Day_PMAX', 'Day_VoltageACMAX': 'Day_VACMAX', 'Day_VoltageACMIN': 'Day_VACMNIN',
+                  'Day_VoltageDCMAX': 'Day_VDCMax', 'Year_PowerMAX': 'Year_PMAX', 'Year_VoltageACMAX': 'Year_VACMAX',
+                  'Year_VoltageACMIN': 'Year_VACMNIN', 'Year_VoltageDCMAX': 'Year_VDCMax',
+                  'Total_PowerMAX': 'Total_PMAX', 'Total_VoltageACMAX': 'Total_VACMAX',
+                  'Total_VoltageACMIN': 'Total_VACMNIN', 'Total_VoltageDCMAX': 'Total_VDCMax',
+                  'DeviceStatusCode': ('DeviceStatus', 'StatusCode'), 'DeviceErrorCode': ('DeviceStatus', 'ErrorCode'),
+                  'DeviceLEDColor': ('DeviceStatus', 'LEDColor'), 'DeviceLEDState': ('DeviceStatus', 'LEDState'),
+                  'DeviceMgmtTimerRemainingTime': ('DeviceStatus', 'MgmtTimerRemainingTime'),
+                  'DeviceStateToReset': ('DeviceStatus', 'StateToReset'),
+                  'InverterCustomName': 'CustomName', 'InverterDT': 'DT', 'InverterErrorCode': 'ErrorCode',
+                  'InverterPVPower': 'PVPower', 'InverterShow': 'Show', 'InverterStatusCode': 'StatusCode',
+                  'InverterUniqueID': 'UniqueID',
+                  'CO2Factor': 'C02Factor', 'LoggerUniqueID': 'UniqueID',
+                  'PowerLEDColor': ('powerLED', 'Color'), 'PowerLEDState': ('powerLED', 'State'),
+                  'SolarNetLEDColor': ('SolarNetLED', 'Color'), 'SolarNetLEDState': ('SolarNetLED', 'State'),
+                  'SolarWebLEDColor': ('SolarWebLED', 'Color'), 'SolarWebLEDState': ('SolarWebLED', 'State'),
+                  'WLANLEDColor': ('WLANLED', 'Color'), 'WLANLEDState': ('WLANLED', 'State')}
+
+#   Immutable record returned by Fronius.snapshot().   One field per property in SNAPSHOTPROPERTIES plus fetched,
+#   the wall clock time (time.time()) each collection was fetched,  named after the record holding the collection.
+SnapshotTimes = namedtuple('SnapshotTimes', [COLLECTIONRECORDS[collection] for collection in SNAPSHOTPROPERTIES])
+Snapshot = namedtuple('Snapshot', [name for names in SNAPSHOTPROPERTIES.values() for name in names] + ['fetched'])
+
+#   Storage for the values of each collection.
+#   Each Fronius holds one record per collection and the parsers assign to its fields in place.   A field holding a
+#   value cell (Value/Unit or LED) is given its own cell when the record is created.   Every other field starts as None.
+class _Record:
+    """
+    Mutable record of named values.   Subclasses list their fields in _fields and __slots__ and any fields that hold
+    a cell of their own in _cells.
+    """
+    __slots__ = ()
+    _fields = ()
+    _cells = {}
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._plainfields = tuple(field for field in cls._fields if field not in cls._cells)
+        cls._cellfields = tuple((field, cls._cells[field]) for field in cls._fields if field in cls._cells)
+
+    def __init__(self):
+        for field in self._plainfields:
+            setattr(self, field, None)
+        for field, cell in self._cellfields:
+            setattr(self, field, cell())
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__,
+                                 ', '.join('{0}={1!r}'.format(field, getattr(self, field)) for field in self._fields))
+
+
+#   The value cells are created by the hundred so they set their fields directly.
+class UnitValue(_Record):
+    """Value reported with its unit.   Inverter realtime data."""
+    __slots__ = _fields = ('Value', 'Unit', 'lastupdated')
+
+    def __init__(self):
+        self.Value = None
+        self.Unit = None
+        self.lastupdated = None
 
-class Fronius:
+
+class MeterValue(_Record):
+    """Value reported without a unit.   Meter realtime data."""
+    __slots__ = _fields = ('Value', 'lastupdated')
+
+    def __init__(self):
+        self.Value = None
+        self.lastupdated = None
+
+
+class LEDInfo(_Record):
+    """State of one of the Datamanager's LEDs."""
+    __slots__ = _fields = ('Color', 'State', 'lastupdated')
+
+    def __init__(self):
+        self.Color = None
+        self.State = None
+        self.lastupdated = None
+
+
+class DeviceStatus(_Record):
+    """DeviceStatus of the CommonInverterData collection."""
+    __slots__ = _fields = ('ErrorCode', 'LEDColor', 'LEDState', 'MgmtTimerRemainingTime', 'StateToReset', 'StatusCode',
+                           'lastupdated')
+
+
+class InverterInfoRecord(_Record):
+    """GetInverterInfo.cgi"""
+    __slots__ = _fields = ('CustomName', 'DT', 'ErrorCode', 'PVPower', 'Show', 'StatusCode', 'UniqueID')
+
+
+class LoggerInfoRecord(_Record):
+    """GetLoggerInfo.cgi"""
+    __slots__ = _fields = ('C02Factor', 'CO2Unit', 'CashCurrency', 'CashFactor', 'DefaultLanguage', 'DeliveryFactor',
+                           'HWVersion', 'PlatformID', 'ProductID', 'SWVersion', 'TimezoneLocation', 'TimezoneName',
+                           'UTCOffset', 'UniqueID', 'lastupdated')
+
+
+class InverterStatusLEDsRecord(_Record):
+    """GetLoggerLEDInfo.cgi"""
+    __slots__ = _fields = ('powerLED', 'SolarNetLED', 'SolarWebLED', 'WLANLED')
+    _cells = dict.fromkeys(_fields, LEDInfo)
+
+
+class CommonInverterRecord(_Record):
+    """GetInverterRealtimeData.cgi - CommonInverterData"""
+    __slots__ = _fields = ('PAC', 'SAC', 'IAC', 'VAC', 'FAC', 'IDC', 'VDC', 'Day_Energy', 'Year_Energy', 'Total_Energy',
+                           'DeviceStatus')
+    _cells = dict.fromkeys(_fields, UnitValue)
+    _cells['DeviceStatus'] = DeviceStatus
+
+
+class ThreePhaseInverterRecord(_Record):
+    """GetInverterRealtimeData.cgi - 3PInverterData"""
+    __slots__ = _fields = ('IAC_L1', 'IAC_L2', 'IAC_L3', 'VAC_PH1', 'VAC_PH2', 'VAC_PH3', 'T_Ambient',
+                           'Rotation_Speed_Fan_FL', 'Rotation_Speed_Fan_FR', 'Rotation_Speed_Fan_BL',
+                           'Rotation_Speed_Fan_BR')
+    _cells = dict.fromkeys(_fields, UnitValue)
+
+
+class MinMaxInverterRecord(_Record):
+    """GetInverterRealtimeData.cgi - MinMaxInverterData"""
+    __slots__ = _fields = ('Day_PMAX', 'Day_VACMAX', 'Day_VACMNIN', 'Day_VDCMax', 'Year_PMAX', 'Year_VACMAX',
+                           'Year_VACMNIN', 'Year_VDCMax', 'Total_PMAX', 'Total_VACMAX', 'Total_VACMNIN', 'Total_VDCMax')
+    _cells = dict.fromkeys(_fields, UnitValue)
+
+
+class MeterRealTimeRecord(_Record):
+    """GetMeterRealtimeData.cgi"""
+    __slots__ = _fields = ('Current_AC_Phase_1', 'Current_AC_Phase_2', 'Current_AC_Phase_3', 'Serial', 'Enable',
+                           'EnergyReactive_VArAC_Sum_Consumed', 'EnergyReactive_VArAC_Sum_Produced',
+                           'EnergyReal_WAC_Minus_Absolute', 'EnergyReal_WAC_Plus_Absolute',
+                           'EnergyReal_WAC_Sum_Consumed', 'EnergyReal_WAC_Sum_Produced', 'Frequency_Phase_Average',
+                           'Meter_Location_Current', 'PowerApparent_S_Phase_1', 'PowerApparent_S_Phase_2',
+                           'PowerApparent_S_Phase_3', 'PowerApparent_S_Sum', 'PowerFactor_Phase_1',
+                           'PowerFactor_Phase_2', 'PowerFactor_Phase_3', 'PowerFactor_Sum', 'PowerReactive_Q_Phase_1',
+                           'PowerReactive_Q_Phase_2', 'PowerReactive_Q_Phase_3', 'PowerReactive_Q_Sum',
+                           'PowerReal_P_Phase_1', 'PowerReal_P_Phase_2', 'PowerReal_P_Phase_3', 'PowerReal_P_Sum',
+                           'TimeStamp', 'Visible', 'Voltage_AC_PhaseToPhase_12', 'Voltage_AC_PhaseToPhase_23',
+                           'Voltage_AC_PhaseToPhase_31', 'Voltage_AC_Phase_1', 'Voltage_AC_Phase_2',
+                           'Voltage_AC_Phase_3', 'Details', 'Manufacturer', 'Model')
+    _cells = dict.fromkeys(_fields, MeterValue)
+
+
+class PowerFlowRealtimeSiteRecord(_Record):
+    """GetPowerFlowRealtimeData.fcgi - Site"""
+    __slots__ = _fields = ('BatteryStandby', 'Energy_Day', 'Energy_Total', 'Energy_Year', 'Meter_Location', 'Mode',
+                           'Power_Akku', 'Power_Grid', 'Power_Load', 'Power_PV', 'Rel_Autonomy', 'Rel_SelfConsumption',
+                           'lastupdated')
+
+
+#   Where each value of a collection is found in its response and where it is stored.
+#       key         Key of the value in the collection's data.   A tuple of keys for a value nested further down
+#       field       Field of the collection's record the value is stored in
+#       kind        'value'     stored in the field itself
+#                   'cell'      stored as the Value of the MeterValue cell in the field
+#                   'unit'      an object with a Value and a Unit,  stored in the UnitValue cell in the field
+#                   'group'     an object whose members named in subfields are copied to the cell in the field
+#       default     Stored instead of the value when the response does not include it.   The lastupdated of a cell
+#                   that is not reported is None.
+#       subfields   Members copied by a 'group'
+FieldMap = namedtuple('FieldMap', ['key', 'field', 'kind', 'default', 'subfields'])
+FieldMap.__new__.__defaults__ = (None, None)
+
+#   How each collection is stored.
+#       path            Keys leading from the response to the collection's data.   INVERTERNUMBER stands for the
+#                       number of the inverter being read (Fronius.inverternumber)
+#       fields          FieldMaps of the values in the data
+#       resetOnError    Store every default when the unit reports an error instead of keeping the last values
+#   A record with a lastupdated field of its own has it set to the time of every response stored.
+CollectionMap = namedtuple('CollectionMap', ['path', 'fields', 'resetOnError'])
+INVERTERNUMBER = None
+
+#   Note: the U for voltage is German.  U = Unterschied which stands for Difference.  Voltage is a Difference.
+#   The records use V for Voltage.
+COLLECTIONFIELDS = {
+    'InverterInfo': CollectionMap(
+        ('Body', 'Data', INVERTERNUMBER),
+        tuple(FieldMap(name, name, 'value') for name in InverterInfoRecord._fields),
+        False),
+
+    'LoggerInfo': CollectionMap(
+        ('Body', 'LoggerInfo'),
+        (FieldMap('CO2Factor', 'C02Factor', 'value', 0),) +
+        tuple(FieldMap(name, name, 'value', 0) for name in LoggerInfoRecord._fields[1:] if name != 'lastupdated'),
+        False),
+
+    'LoggerLEDInfo': CollectionMap(
+        ('Body', 'Data'),
+        (FieldMap('PowerLED', 'powerLED', 'group', 0, ('Color', 'State')),
+         FieldMap('SolarNetLED', 'SolarNetLED', 'group', 0, ('Color', 'State')),
+         FieldMap('SolarWebLED', 'SolarWebLED', 'group', 0, ('Color', 'State')),
+         FieldMap('WLANLED', 'WLANLED', 'group', 0, ('Color', 'State'))),
+        True),
+
+    'PowerFlowRealtimeData': CollectionMap(
+        ('Body', 'Data', 'Site'),
+        (FieldMap('BatteryStandby', 'BatteryStandby', 'value', False),
+         FieldMap('E_Day', 'Energy_Day', 'value', False),
+         FieldMap('E_Total', 'Energy_Total', 'value', False),
+         FieldMap('E_Year', 'Energy_Year', 'value', False),
+         FieldMap('Meter_Location', 'Meter_Location', 'value', False),
+         FieldMap('Mode', 'Mode', 'value', False),
+         FieldMap('P_Akku', 'Power_Akku', 'value', False),
+         FieldMap('P_Grid', 'Power_Grid', 'value', False),
+         FieldMap('P_Load', 'Power_Load', 'value', False),
+         FieldMap('P_PV', 'Power_PV', 'value', False),
+         FieldMap('rel_Autonomy', 'Rel_Autonomy', 'value', False),
+         FieldMap('rel_SelfConsumption', 'Rel_SelfConsumption', 'value', False)),
+        False),
+
+    'MeterRealtimeData': CollectionMap(
+        ('Body', 'Data'),
+        (FieldMap(('Details', 'Manufacturer'), 'Manufacturer', 'cell', 0),
+         FieldMap(('Details', 'Model'), 'Model', 'cell', 0),
+         FieldMap(('Details', 'Serial'), 'Serial', 'cell', 0)) +
+        tuple(FieldMap(name, name, 'cell', 0) for name in MeterRealTimeRecord._fields
+              if name not in ('Details', 'Manufacturer', 'Model', 'Serial')),
+        False),
+
+    'CommonInverterData': CollectionMap(
+        ('Body', 'Data'),
+        (FieldMap('PAC', 'PAC', 'unit', 0),
+         FieldMap('SAC', 'SAC', 'unit', 0),
+         FieldMap('IAC', 'IAC', 'unit', 0),
+         FieldMap('UAC', 'VAC', 'unit', 0),
+         FieldMap('FAC', 'FAC', 'unit', 0),
+         FieldMap('IDC', 'IDC', 'unit', 0),
+         FieldMap('UDC', 'VDC', 'unit', 0),
+         FieldMap('DAY_ENERGY', 'Day_Energy', 'unit', 0),
+         FieldMap('YEAR_ENERGY', 'Year_Energy', 'unit', 0),
+         FieldMap('TOTAL_ENERGY', 'Total_Energy', 'unit', 0),
+         FieldMap('DeviceStatus', 'DeviceStatus', 'group', None, DeviceStatus._fields[:-1])),
+        False),
+
+    #   T_Ambient and the fan speeds do not appear to be available on the Fronius Hybrid system.
+    '3PInverterData': CollectionMap(
+        ('Body', 'Data'),
+        (FieldMap('IAC_L1', 'IAC_L1', 'unit', 0),
+         FieldMap('IAC_L2', 'IAC_L2', 'unit', 0),
+         FieldMap('IAC_L3', 'IAC_L3', 'unit', 0),
+         FieldMap('UAC_L1', 'VAC_PH1', 'unit', 0),
+         FieldMap('UAC_L2', 'VAC_PH2', 'unit', 0),
+         FieldMap('UAC_L3', 'VAC_PH3', 'unit', 0),
+         FieldMap('T_Ambient', 'T_Ambient', 'unit', 0),
+         FieldMap('Rotation_Speed_Fan_FL', 'Rotation_Speed_Fan_FL', 'unit', 0),
+         FieldMap('Rotation_Speed_Fan_FR', 'Rotation_Speed_Fan_FR', 'unit', 0),
+         FieldMap('Rotation_Speed_Fan_BL', 'Rotation_Speed_Fan_BL', 'unit', 0),
+         FieldMap('Rotation_Speed_Fan_BR', 'Rotation_Speed_Fan_BR', 'unit', 0)),
+        False),
+
+    #   Not Supported for Hybrid Systems
+    'MinMaxInverterData': CollectionMap(
+        ('Body', 'Data'),
+        (FieldMap('DAY_PMAX', 'Day_PMAX', 'unit', 0),
+         FieldMap('DAY_UACMAX', 'Day_VACMAX', 'unit', 0),
+         FieldMap('DAY_UACMIN', 'Day_VACMNIN', 'unit', 0),
+         FieldMap('DAY_UDCMAX', 'Day_VDCMax', 'unit', 0),
+         FieldMap('YEAR_PMAX', 'Year_PMAX', 'unit', 0),
+         FieldMap('YEAR_UACMAX', 'Year_VACMAX', 'unit', 0),
+         FieldMap('YEAR_UACMIN', 'Year_VACMNIN', 'unit', 0),
+         FieldMap('YEAR_UDCMAX', 'Year_VDCMax', 'unit', 0),
+         FieldMap('TOTAL_PMAX', 'Total_PMAX', 'unit', 0),
+         FieldMap('TOTAL_UACMAX', 'Total_VACMAX', 'unit', 0),
+         FieldMap('TOTAL_UACMIN', 'Total_VACMNIN', 'unit', 0),
+         FieldMap('TOTAL_UDCMAX', 'Total_VDCMax', 'unit', 0)),
+        True)}
+
+_MISSING = object()
+
+
+def compileExtractor(fieldmaps):
     """
-    Interface to communicate with the Fronius Symo over http / JSON
+    Turn the FieldMaps of a collection into one function that stores its data.
+    The maps are sorted by kind here,  once,  so that storing a response looks each key up only once.
+    :param fieldmaps:
+    :return:    extract(record, data, now).   An empty data stores every default
+    """
+    values = []
+    cells = []
+    units = []
+    groups = []
+    nested = {}
+    for fieldmap in fieldmaps:
+        key = fieldmap.key
+        if isinstance(key, tuple):
+            #   Values further down are stored by an extractor of their own given the object they are in
+            if len(key) > 1:
+                nested.setdefault(key[0], []).append(fieldmap._replace(key=key[1:] if len(key) > 2 else key[1]))
+                continue
+            key = key[0]
+        if fieldmap.kind == 'value':
+            values.append((key, fieldmap.field, fieldmap.default))
+        elif fieldmap.kind == 'cell':
+            cells.append((key, fieldmap.field, fieldmap.default))
+        elif fieldmap.kind == 'unit':
+            units.append((key, fieldmap.field, fieldmap.default))
+        elif fieldmap.kind == 'group':
+            groups.append((key, fieldmap.field, fieldmap.default, tuple(fieldmap.subfields)))
+        else:
+            raise ValueError('Unknown kind of field {0}'.format(fieldmap.kind))
+    nested = [(key, compileExtractor(maps)) for key, maps in nested.items()]
+
+    def extract(record, data, now):
+        get = data.get
+        for key, field, default in values:
+            setattr(record, field, get(key, default))
+
+        for key, field, default in cells:
+            cell = getattr(record, field)
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                cell.Value = default
+                cell.lastupdated = None
+            else:
+                cell.Value = value
+                cell.lastupdated = now
+
+        for key, field, default in units:
+            cell = getattr(record, field)
+            value = get(key)
+            if value is None:
+                cell.Value = default
+                cell.Unit = default
+                cell.lastupdated = None
+            else:
+                cell.Value = value.get('Value', default)
+                cell.Unit = value.get('Unit', default)
+                cell.lastupdated = now
+
+        for key, field, default, subfields in groups:
+            cell = getattr(record, field)
+            value = get(key)
+            if value is None:
+                for subfield in subfields:
+                    setattr(cell, subfield, default)
+                cell.lastupdated = None
+            else:
+                for subfield in subfields:
+                    setattr(cell, subfield, value.get(subfield, default))
+                cell.lastupdated = now
+
+        for key, extractNested in nested:
+            extractNested(record, get(key) or {}, now)
+
+    return extract
+
+
+#   One compiled extractor per collection
+EXTRACTORS = {collection: compileExtractor(collectionmap.fields) for collection, collectionmap in COLLECTIONFIELDS.items()}
+
+#   Default decoder for response bodies.   Any callable taking the raw bytes and returning the decoded JSON will do,
+#   see the jsonDecoder argument of Fronius.
+def decodeJSONStdlib(content):
+    """
+    Standard library decoding of a response body.
+    Given bytes json.loads has to work out the encoding first.   The Datamanager always sends UTF-8,  decoding straight
+    to text is quicker.
+    :param content:     Raw bytes of the response body
+    :return:    The decoded JSON
+    """
+    return jsonlib.loads(content.decode('utf-8'))
+
+
+if orjson is not None:
+    decodeJSON = orjson.loads
+    JSONDECODER = 'orjson'
+else:
+    decodeJSON = decodeJSONStdlib
+    JSONDECODER = 'json'
+
+#   Collections that change from second to second.   Polled by poll() when none are named.
+REALTIMECOLLECTIONS = ['CommonInverterData', '3PInverterData', 'MinMaxInverterData', 'CumulationInverterData',
+                       'MeterRealtimeData', 'PowerFlowRealtimeData']
+
+#   A property value with its age.   Returned by Fronius.read()
+AgedValue = namedtuple('AgedValue', ['value', 'age', 'stale', 'error'], defaults=[None])
+
+#   Time taken to populate a new instance.
+#   wallclock is the elapsed time,  requests is the sum of the time spent in each individual request.
+InitialRunTime = namedtuple('InitialRunTime', ['wallclock', 'requests'])
+
+#   Meaning of the inverter's DeviceStatus.StatusCode.   0 to 6 are all stages of starting up.
+INVERTERSTATUSCODES = {0: 'Startup', 1: 'Startup', 2: 'Startup', 3: 'Startup', 4: 'Startup', 5: 'Startup', 6: 'Startup',
+                       7: 'Running', 8: 'Standby', 9: 'Bootloading', 10: 'Error'}
+
+#   Status codes of the Common Response Header (CRH),  as listed in the API documentation.
+#   Note that the messages returned by the API are actually different to the messages provided in the API documentation
+CRHStatusCode = namedtuple('CRHStatusCode', ['value', 'status', 'description'])
+CRHSTATUSCODES = {0: CRHStatusCode(0, 'OKAY', 'Request successfully finished, Data are valid'),
+                  1: CRHStatusCode(1, 'NotImplemented', 'The request or a part of the request is not implemented yet'),
+                  2: CRHStatusCode(2, 'Uninitialized', 'Instance of APIRequest created, but not yet configured'),
+                  3: CRHStatusCode(3, 'Initialized', 'Request is configured and ready to be sent'),
+                  4: CRHStatusCode(4, 'Running', 'Request is currently being processed (waiting for response)'),
+                  5: CRHStatusCode(5, 'Timeout', 'Response was not received within desired time'),
+                  6: CRHStatusCode(6, 'Argument Error', 'Invalid arguments/combination of arguments or missing arguments'),
+                  7: CRHStatusCode(7, 'LNRequestError', 'Something went wrong during sending/receiving of LN-message'),
+                  8: CRHStatusCode(8, 'LNRequestTimeout', 'LN-request timed out'),
+                  9: CRHStatusCode(9, 'LNParseError', 'Something went wrong during parsing of successfully received LN-message'),
+                  10: CRHStatusCode(10, 'ConfigIOError', 'Something went wrong while reading settings from local config'),
+                  11: CRHStatusCode(11, 'NotSupported', 'The operation/feature or whatever is not supported'),
+                  12: CRHStatusCode(12, 'DeviceNotAvailable', 'The device is not available'),
+                  255: CRHStatusCode(255, 'UnknownError', 'undefined runtime error')}
+
+#   Common Response Header of the last response.   Replaced as a whole by every response so a reader never sees the
+#   code of one response next to the reason of another.
+UnitStatus = namedtuple('UnitStatus', ['TimeStamp', 'code', 'status', 'description', 'reason', 'usermessage'])
+NOUNITSTATUS = UnitStatus(None, None, None, None, None, None)
+
+
+def crhStatusCode(code):
+    """
+    Look up a Common Response Header status code.
+    :param code:    Head.Status.Code of a response
+    :return:    CRHStatusCode.   Codes missing from the API documentation are reported as unknown rather than raising
+    """
+    known = CRHSTATUSCODES.get(code)
+    if known is None:
+        return CRHStatusCode(code, 'Unknown', 'Status code {0} is not in the API documentation'.format(code))
+    return known
+
+#   Seconds between polls of each collection while the inverter is producing.
+DAYPOLLINTERVALS = {'CommonInverterData': 10, '3PInverterData': 10, 'CumulationInverterData': 30,
+                    'MinMaxInverterData': 300, 'PowerFlowRealtimeData': 5, 'MeterRealtimeData': 5,
+                    'LoggerLEDInfo': 60, 'InverterInfo': 3600, 'LoggerInfo': 3600, 'ActiveDeviceInfo': 3600}
+
+#   Collections that only change while the inverter is producing.   These are the ones that are backed off.
+#   The meter and the power flow keep being polled at the day rate as the site still consumes power at night.
+PRODUCTIONCOLLECTIONS = ['CommonInverterData', '3PInverterData', 'CumulationInverterData', 'MinMaxInverterData',
+                         'LoggerLEDInfo']
+
+
+class _Flight:
+    """
+    A request in progress.   Threads asking for the same thing wait on done and share result (or error).
+    """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+#   Seconds a fetched collection is served from the cache before a property read fetches it again.
+COLLECTIONTTLS = {'PowerFlowRealtimeData': 2, 'MeterRealtimeData': 2, 'CommonInverterData': 10, '3PInverterData': 10,
+                  'CumulationInverterData': 10, 'LoggerLEDInfo': 10, 'MinMaxInverterData': 86400,
+                  'InverterInfo': 6 * 3600, 'LoggerInfo': 6 * 3600, 'ActiveDeviceInfo': 6 * 3600}
+
+#   Cache counters of one collection.   age is None if it has never been fetched.
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'age', 'ttl'])
+
+
+class CollectionCache:
+    """
+    When each collection was last fetched (time.monotonic()) and how long it stays fresh.
+    The values themselves stay in the records of the Fronius instance.
     Attributes:
-        host        The ip/domain of the Fronius device
-        useHTTPS    Use HTTPS instead of HTTP :  Froinus API V1 only supports HTTP
-        timeout     HTTP timeout in seconds
+        ttls        Dict of collection to seconds it stays fresh.  Defaults to COLLECTIONTTLS
+        defaultTTL  Seconds for a collection not in ttls
+    """
 
-        https://thomas-cokelaer.info/tutorials/sphinx/docstring_python.html
+    def __init__(self, ttls=None, defaultTTL=90):
+        if ttls is None:
+            ttls = COLLECTIONTTLS
+        self.ttls = dict(ttls)
+        self.defaultTTL = defaultTTL
+
+        self.fetched = {}
+        self.hits = {}
+        self.misses = {}
+        self._lock = threading.Lock()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def ttl(self, collection):
+        return self.ttls.get(collection, self.defaultTTL)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def age(self, collection):
+        """
+        :param collection:
+        :return:    Seconds since the collection was last fetched,  None if it never has been
+        """
+        fetched = self.fetched.get(collection)
+        if fetched is None:
+            return None
+        return time.monotonic() - fetched
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def stored(self, collection, age=0):
+        """
+        Record that a collection has been fetched.
+        :param collection:
+        :param age:     Seconds ago it was fetched.   Only used for values loaded from somewhere else
+        :return:
+        """
+        self.fetched[collection] = time.monotonic() - age
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def invalidate(self, collection=None):
+        """
+        Make a collection (or every collection) stale so that the next read fetches it.
+        :param collection:
+        :return:
+        """
+        if collection is None:
+            self.fetched.clear()
+        else:
+            self.fetched.pop(collection, None)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def lookup(self, collection, ttl=None):
+        """
+        Check if a collection can be served from the cache and count the hit or miss.
+        :param collection:
+        :param ttl:     Defaults to the TTL of the collection
+        :return:    True if it is fresh
+        """
+        if ttl is None:
+            ttl = self.ttls.get(collection, self.defaultTTL)
+        fetched = self.fetched.get(collection)
+        fresh = fetched is not None and time.monotonic() - fetched <= ttl
+
+        counters = self.hits if fresh else self.misses
+        with self._lock:
+            counters[collection] = counters.get(collection, 0) + 1
+        return fresh
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def stats(self):
+        """
+        :return:    Dict of collection to CacheStats for every collection that has been looked up or fetched
+        """
+        collections = set(self.fetched) | set(self.hits) | set(self.misses)
+        return {collection: CacheStats(self.hits.get(collection, 0), self.misses.get(collection, 0),
+                                       self.age(collection), self.ttl(collection))
+                for collection in sorted(collections)}
+
+
+class AdaptivePollingSchedule:
+    """
+    How often each collection should be polled,  based on what the inverter is doing.
+    At night and while the inverter is in standby it reports no PAC, IDC etc. and nothing worth polling for changes,
+    so the production collections are polled far less often.
+    Attributes:
+        dayIntervals    Dict of collection to seconds between polls while producing.  Defaults to DAYPOLLINTERVALS
+        defaultInterval Seconds between polls of a collection not in dayIntervals
+        standbyFactor   Intervals are multiplied by this while the inverter is in standby or reports no PAC
+        nightFactor     Intervals are multiplied by this at night
+        maxInterval     No collection is left longer than this
+        dayStart        Local hour the day starts,  taken from the logger's UTCOffset
+        dayEnd          Local hour the night starts
+    """
+
+    def __init__(self, dayIntervals=None, defaultInterval=90, standbyFactor=6, nightFactor=30, maxInterval=900, dayStart=5, dayEnd=21):
+        if dayIntervals is None:
+            dayIntervals = DAYPOLLINTERVALS
+        self.dayIntervals = dict(dayIntervals)
+        self.defaultInterval = defaultInterval
+        self.standbyFactor = standbyFactor
+        self.nightFactor = nightFactor
+        self.maxInterval = maxInterval
+        self.dayStart = dayStart
+        self.dayEnd = dayEnd
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def localHour(self, fronius):
+        """
+        The hour of the day where the inverter is.
+        Uses the UTCOffset reported by the logger.   If LoggerInfo has not been fetched the local time of this machine is used.
+        :param fronius:
+        :return:    Hour 0 - 23
+        """
+        utcoffset = fronius.LoggerInfo.UTCOffset
+        if isinstance(utcoffset, (int, float)):
+            return time.gmtime(time.time() + utcoffset).tm_hour
+        return time.localtime().tm_hour
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def state(self, fronius):
+        """
+        What the inverter is doing from the values already held.   Nothing is fetched.
+        :param fronius:
+        :return:    'Night' | 'Standby' | 'Day'
+        """
+        hour = self.localHour(fronius)
+        if not self.dayStart <= hour < self.dayEnd:
+            return 'Night'
+
+        statuscode = fronius.CommonInverterValues.DeviceStatus.StatusCode
+        if INVERTERSTATUSCODES.get(statuscode) == 'Standby':
+            return 'Standby'
+
+        #   The parser clears lastupdated of PAC when the inverter stops reporting it.
+        #   Until CommonInverterData has been fetched at all it is None as well.
+        if fronius.CommonInverterValues.PAC.lastupdated is None and fronius.cache.age('CommonInverterData') is not None:
+            return 'Standby'
+
+        return 'Day'
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def interval(self, fronius, collection):
+        """
+        Seconds to leave between polls of a collection.
+        :param fronius:
+        :param collection:  Any collection name understood by Fronius._refreshCollection
+        :return:
+        """
+        interval = self.dayIntervals.get(collection, self.defaultInterval)
+        if collection not in PRODUCTIONCOLLECTIONS:
+            return interval
+
+        state = self.state(fronius)
+        if state == 'Night':
+            interval = interval * self.nightFactor
+        elif state == 'Standby':
+            interval = interval * self.standbyFactor
+        return min(interval, max(self.maxInterval, self.dayIntervals.get(collection, 0)))
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a Datamanager that is not answering.
+    Closed:     requests go through.  failureThreshold consecutive failures open the circuit.
+    Open:       requests fail straight away for cooldown seconds.
+    HalfOpen:   one probe request is let through.  Success closes the circuit,  failure opens it again with the cooldown
+                doubled (up to maxCooldown).
+    Attributes:
+        failureThreshold    Consecutive failures that open the circuit
+        cooldown            Seconds the circuit stays open the first time
+        maxCooldown         Longest the circuit stays open
+    """
+
+    def __init__(self, failureThreshold=3, cooldown=5, maxCooldown=300):
+        self.failureThreshold = failureThreshold
+        self.cooldown = cooldown
+        self.maxCooldown = maxCooldown
+
+        self.state = 'Closed'
+        self.failures = 0
+        self.opentime = None
+        self.currentCooldown = cooldown
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def allowRequest(self):
+        """
+        :return:    True if a request may be sent now
+        """
+        with self._lock:
+            if self.state == 'Closed':
+                return True
+            if self.state == 'Open' and time.monotonic() - self.opentime >= self.currentCooldown:
+                #   Let this one request through as the probe.   Everyone else keeps failing fast until it is back.
+                self.state = 'HalfOpen'
+                return True
+            self.rejected += 1
+            return False
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def recordSuccess(self):
+        with self._lock:
+            self.state = 'Closed'
+            self.failures = 0
+            self.currentCooldown = self.cooldown
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def recordFailure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'HalfOpen':
+                self.currentCooldown = min(self.currentCooldown * 2, self.maxCooldown)
+            elif self.failures < self.failureThreshold:
+                return
+            self.state = 'Open'
+            self.opentime = time.monotonic()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def recordResponse(self, status_code):
+        """
+        Record a request that got an HTTP response.   A server error counts as a failure,  anything else as a success.
+        :param status_code:
+        :return:
+        """
+        if status_code >= 500:
+            self.recordFailure()
+        else:
+            self.recordSuccess()
+
+
+#   One circuit breaker per host and settings,  shared by every instance talking to that host with those settings.
+_circuitbreakers = {}
+_circuitbreakerslock = threading.Lock()
+
+
+def circuitBreaker(host, failureThreshold=3, cooldown=5, maxCooldown=300):
+    """
+    The circuit breaker of a host.   Instances asking for different settings get a breaker of their own,  so the
+    settings of one are never silently replaced by those of another created earlier.
+    :param host:
+    :return:    CircuitBreaker
+    """
+    key = (host, failureThreshold, cooldown, maxCooldown)
+    with _circuitbreakerslock:
+        if key not in _circuitbreakers:
+            _circuitbreakers[key] = CircuitBreaker(failureThreshold, cooldown, maxCooldown)
+        return _circuitbreakers[key]
+
+
+def _singleflight(method):
     """
+    Coalesce concurrent calls of an endpoint method.
+    Calls with the same method name and arguments (endpoint, scope, device, collection) made while one is already in
+    flight do not send their own request.   They wait for the outstanding one and return its result.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+
+        with self._flightlock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = method(self, *args, **kwargs)
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self._flightlock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    return wrapper
 
-    def __init__(self, host, useHTTPS=False, HTTPtimeout=10):
 
+class FroniusData:
+    """
+    The records of one Fronius unit and everything that reads them or stores responses in them.   Nothing here talks
+    to the unit:  Fronius fetches with blocking requests and asyncfrosolar.AsyncFronius on the asyncio event loop.
+    See Fronius for the attributes.
+    """
+
+    def _initialiseSettings(self, host, useHTTPS=False, HTTPtimeout=10, connectTimeout=None, readTimeout=None, poolSize=4, maxParallelRequests=4, pollingSchedule=None, failureThreshold=3, breakerCooldown=5, maxBreakerCooldown=300, jsonDecoder=None, cacheTTLs=None, metadataCache=None, history=None):
+        """
+        Set up everything an instance holds apart from its connection to the unit,  then create the empty records.
+        Shared by Fronius and AsyncFronius so that both start from the same state without fetching anything.
+        See the class docstring for the parameters.
+        :return:
+        """
         #   Hostname or IP address of the target Inverter being interrogated.
         self.host = host
 
         #   HTTP timeout.   How long to give the request to the Fronius unit before it times out and returns an error.
         self.HTTPtimeout = HTTPtimeout
 
+        #   Connecting and reading are timed out separately.   A dead host should be given up on quickly while a live
+        #   but busy Datamanager can take a while to put its response together.
+        if connectTimeout is None:
+            connectTimeout = HTTPtimeout
+        if readTimeout is None:
+            readTimeout = HTTPtimeout
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+
+        #   Most connections kept open to the Datamanager.
+        self.poolSize = poolSize
+
+        #   Response bodies are decoded straight from the raw bytes,  there is no need to decode the text first.
+        if jsonDecoder is None:
+            jsonDecoder = decodeJSON
+        self.jsonDecoder = jsonDecoder
+
+        #   Requests to a host that keeps failing are cut short for a while rather than each waiting out the timeout.
+        #   Shared by every instance talking to the same host with the same breaker settings.
+        self.breaker = circuitBreaker(host, failureThreshold, breakerCooldown, maxBreakerCooldown)
+
         #   Future Proof check.  currently the Fronius only accepts HTTP connections.  Does not support HTTPS.
         if useHTTPS:
             self.protocol = "https"
@@ -62,6 +903,7 @@ class Fronius:
 
         #   Define what is considered an ideal time currency.  ANything older than 90 seconds is NOT fresh from the system
         #   Currently set to 90 seconds but can be adjusted depending on network etc.
+        #   Only used for collections without their own TTL in COLLECTIONTTLS.
         self.datatimeoutseconds = 90
 
         #   Default scope incase not provided
@@ -73,6 +915,77 @@ class Fronius:
         #   Default Inverter Number
         self.inverternumber = 1
 
+        #   How many requests can be in flight at the same time.
+        self.maxParallelRequests = maxParallelRequests
+
+        #   Time taken to populate the initial data.   None until it has been.
+        self.initialRunTime = None
+
+        #   The instance may be shared between threads.   _lock guards the shared status records.
+        self._lock = threading.RLock()
+
+        #   When each collection was last fetched and how long it stays fresh.   A polling schedule overrides the TTLs.
+        self.cache = CollectionCache(cacheTTLs, self.datatimeoutseconds)
+        self.pollingSchedule = pollingSchedule
+
+        #   The collection of the last read and the exception raised by the last background refresh of each
+        #   collection,  see read().
+        self._readinfo = threading.local()
+        self.revalidationErrors = {}
+
+        #   Head.Timestamp of the last response stored for each (collection, url) and how many parses that has saved
+        self._lasttimestamps = {}
+        self.skippedParses = 0
+
+        #   Recent values of selected fields.   Only kept if asked for.
+        self.history = history
+
+        #   Responses describing the unit are kept on disk,  if asked for.
+        self.metadataCache = metadataCache
+
+        #   Create the storage for every collection the unit reports.
+        self._initialiseStorage()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _loadMetadata(self, liveAPIVersion=None):
+        """
+        Take the API version and the other metadata collections from the metadata cache.
+        :param liveAPIVersion:  GetAPIVersion response fetched from the unit.   Required for validateAPIVersion
+        :return:    True if the API version was loaded,  False if it still has to be fetched
+        """
+        if self.metadataCache is None:
+            return False
+        metadata = self.metadataCache.load(self.host)
+        if metadata is None:
+            return False
+
+        #   Only the API version is asked for.   If it has changed nothing else stored can be trusted either.
+        if self.metadataCache.validateAPIVersion:
+            json = liveAPIVersion
+            if json is None:
+                raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(self.host))
+            if json != metadata.responses['APIVersion']:
+                self.metadataCache.discard(self.host)
+                self._parseAPIVersion(json)
+                self.metadataCache.store(self.host, 'APIVersion', json)
+                return True
+
+        self._parseAPIVersion(metadata.responses['APIVersion'])
+        for collection in METADATACOLLECTIONS[1:]:
+            if collection in metadata.responses:
+                self._parseCollection(collection, metadata.responses[collection], self._collectionURL(collection),
+                                      cached=True)
+                self.cache.stored(collection, metadata.age)
+        return True
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _initialiseStorage(self):
+        """
+        Create the empty records that hold the data for each collection.
+        Kept out of __init__ so that AsyncFronius can build the same data model without fetching anything.
+        The record types are defined once at module level,  see _Record.
+        :return:
+        """
 
         """
         Storage for Fronius Solar API version Information
@@ -89,24 +1002,16 @@ class Fronius:
         """
         #   Note: No need for a lastupdate status stamp here as CRH shoudl be retrieved with EVERY query.   THe results
         #   From here are effectivly the global timestamp
-        UnitStatusFields = ['TimeStamp', 'code', 'status', 'description', 'reason', 'usermessage']
-        self.UnitStatus = namedtuple('InverterInfo', UnitStatusFields)
-        self.UnitStatus.__new__.__defaults__ = (None,) * len(self.UnitStatus._fields)
+        self.UnitStatus = NOUNITSTATUS
 
 
-
-        #   TODO : Named Tuples with lastupdate for each record should be placed here.
         """
         Storage for Inverter Information
         http://<hostname>/solar_api/v1/GetInverterInfo.cgi
         """
-        InverterInfoFields = ['CustomName','DT','ErrorCode','PVPower','Show','StatusCode','UniqueID']
-        self.InverterInfo = namedtuple('InverterInfo',InverterInfoFields)
-        self.InverterInfo.__new__.__defaults__ = (None,) * len(self.InverterInfo._fields)
-
+        self.InverterInfo = InverterInfoRecord()
 
 
-        #   TODO : Named Tuples with lastupdate for each record should be placed here.
         """
         Storage for Information about devices currently online
         http://<hostname>/solar_api/v1/GetActiveDeviceInfo.cgi?DeviceClass=System
@@ -116,16 +1021,11 @@ class Fronius:
         #   The only way to obtain them is to actually run the code against a systme.
 
 
-
-        #   TODO : Named Tuples with lastupdate for each record should be placed here.
         """
         Storage for Logger Informtation
         http://<hostname>/solar_api/v1/GetLoggerInfo.cgi
         """
-        LoggerInfoFields = ['C02Factor','CO2Unit','CashCurrency','CashFactor','DefaultLanguage','DeliveryFactor','HWVersion','PlatformID','ProductID','SWVersion','TimezoneLocation','TimezoneName','UTCOffset','UniqueID']
-        self.LoggerInfo = namedtuple('LoggerInfo', LoggerInfoFields)
-        self.LoggerInfo.__new__.__defaults__ = (None,) * len(self.LoggerInfo._fields)
-
+        self.LoggerInfo = LoggerInfoRecord()
 
 
         """
@@ -133,18 +1033,7 @@ class Fronius:
         Current status of the Inverter LEDS
         http://<hostname>solar_api/v1/GetLoggerLEDInfo.cgi
         """
-        InverterStatusLEDFields = ['powerLED','SolarNetLED','SolarWebLED','WLANLED']
-        LEDinfoFields = ['Color','State','lastupdated']
-        self.InverterStatusLEDs = namedtuple('InverterStatusLEDs',InverterStatusLEDFields)
-        self.InverterStatusLEDs.powerLED = namedtuple('powerLED',LEDinfoFields)       # GetLoggerLEDInfo.cgi - PowerLED
-        self.InverterStatusLEDs.powerLED.__new__.__defaults__ = (None,) * len(self.InverterStatusLEDs.powerLED._fields)
-        self.InverterStatusLEDs.SolarNetLED = namedtuple('SolarNetLED',LEDinfoFields)    # GetLoggerLEDInfo.cgi - SolarNetLED
-        self.InverterStatusLEDs.SolarNetLED.__new__.__defaults__ = (None,) * len(self.InverterStatusLEDs.SolarNetLED._fields)
-        self.InverterStatusLEDs.SolarWebLED = namedtuple('SolarWebLED',LEDinfoFields)    # GetLoggerLEDInfo.cgi - SolarWebLED
-        self.InverterStatusLEDs.SolarWebLED.__new__.__defaults__ = (None,) * len(self.InverterStatusLEDs.SolarWebLED._fields)
-        self.InverterStatusLEDs.WLANLED = namedtuple('WLANLED',LEDinfoFields)        # GetLoggerLEDInfo.cgi - WLANLED
-        self.InverterStatusLEDs.WLANLED.__new__.__defaults__ = (None,) * len(self.InverterStatusLEDs.WLANLED._fields)
-
+        self.InverterStatusLEDs = InverterStatusLEDsRecord()
 
 
         """
@@ -157,252 +1046,36 @@ class Fronius:
         #   http://<hostname>/solar_api/v1/GetInverterRealtimeData.cgi?Scope=System&DeviceID=0&DataCollection=CommonInvertData
         #   Note: the U for voltage is German.  U = Unterschied which stands for Difference.  Voltage is a Difference.
         #   I COULD convert it to V for Voltage.   It would probably make this tool slightly more functional for English speakers.
-        #
-        CommonInverterFields = ['PAC','SAC','IAC','VAC','FAC','IDC','VDC','Day_Energy','Year_Energy','Total_Energy','DeviceStatus']
-        CommonDeviceStatusFields = ['ErrorCode','LEDColor','LEDState','MgmtTimerRemainingTime','StateToReset','StatusCode','lastupdated']
-        CommonInverterValuesUnitValues = ['Value','Unit','lastupdated']
-        self.CommonInverterValues = namedtuple('CommonInverterValues',CommonInverterFields)
-        self.CommonInverterValues.PAC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)  #   THIS IS COMMON!  so all records will use this one.
-        self.CommonInverterValues.PAC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.PAC._fields)
-        self.CommonInverterValues.SAC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.SAC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.SAC._fields)
-        self.CommonInverterValues.IAC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.IAC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.IAC._fields)
-        self.CommonInverterValues.VAC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.VAC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.VAC._fields)
-        self.CommonInverterValues.FAC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.FAC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.FAC._fields)
-        self.CommonInverterValues.IDC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.IDC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.IDC._fields)
-        self.CommonInverterValues.VDC = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)
-        self.CommonInverterValues.VDC.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.VDC._fields)
-        self.CommonInverterValues.Day_Energy = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)       #   THIS IS COMMON!  so all records will use this one.
-        self.CommonInverterValues.Day_Energy.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.Day_Energy._fields)
-        self.CommonInverterValues.Year_Energy = namedtuple('CommonInverterValuesUnitValues',CommonInverterValuesUnitValues)      #   THIS IS COMMON!  so all records will use this one.
-        self.CommonInverterValues.Year_Energy.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.Year_Energy._fields)
-        self.CommonInverterValues.Total_Energy = namedtuple('CommonInverterValuesUnitValues', CommonInverterValuesUnitValues)    #   THIS IS COMMON!  so all records will use this one.
-        self.CommonInverterValues.Total_Energy.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.Total_Energy._fields)
-        self.CommonInverterValues.DeviceStatus = namedtuple('CommonDeviceStatusFields', CommonDeviceStatusFields)
-        self.CommonInverterValues.DeviceStatus.__new__.__defaults__ = (None,) * len(self.CommonInverterValues.DeviceStatus._fields)
+        self.CommonInverterValues = CommonInverterRecord()
 
         #   3 Phase Inverter Data
         #   http://<hostname>/solar_api/v1/GetInverterRealtimeData.cgi?Scope=System&DeviceID=0&DataCollection=3PInverterData
-        #
-        ThreePhaseinverterFields = ['IAC_L1','IAC_L2','IAC_L3','VAC_PH1','VAC_PH2','VAC_PH3','T_Ambient','Rotation_Speed_Fan_FL','Rotation_Speed_Fan_FR','Rotation_Speed_Fan_BL','Rotation_Speed_Fan_BR']
-        ThreePhaseinverterUnitValues = ['Value','Unit','lastupdated']
-        self.ThreePhaseinverterValues = namedtuple('ThreePhaseinverterValues',ThreePhaseinverterFields)
-        self.ThreePhaseinverterValues.IAC_L1 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.IAC_L1.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.IAC_L1._fields)
-        self.ThreePhaseinverterValues.IAC_L2 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.IAC_L2.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.IAC_L2._fields)
-        self.ThreePhaseinverterValues.IAC_L3 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.IAC_L3.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.IAC_L2._fields)
-        self.ThreePhaseinverterValues.VAC_PH1 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.VAC_PH1.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.VAC_PH1._fields)
-        self.ThreePhaseinverterValues.VAC_PH2 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.VAC_PH2.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.VAC_PH2._fields)
-        self.ThreePhaseinverterValues.VAC_PH3 = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.VAC_PH3.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.VAC_PH3._fields)
-
-        #   The following data do not appear to be available on the Fronius Hybrid system.  Certainly not on the unit I have.
-        #   These values MIGHT not be correctly retrieved from the system.
-        self.ThreePhaseinverterValues.T_Ambient = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.T_Ambient.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.T_Ambient._fields)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR._fields)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL._fields)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR._fields)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL = namedtuple('ThreePhaseinverterUnitValues',ThreePhaseinverterUnitValues)
-        self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.__new__.__defaults__ = (None,) * len(self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL._fields)
-
+        #   T_Ambient and the fan speeds do not appear to be available on the Fronius Hybrid system.
+        self.ThreePhaseinverterValues = ThreePhaseInverterRecord()
 
         #   MinMaxInverterData   ----   Not Supported for Hybrid Systems
         #   http://<hostname>/solar_api/v1/GetInverterRealtimeData.cgi?Scope=System&DeviceID=0&DataCollection=MinMaxInverterData
         #
         #   TODO need to test this against an inverter that has these parameters
-        #   One of the problem is that the API doesnt define or provide full examples of some of the less used fields in the system.
-        #   The only way to obtain them is to actually run the code against a systme.
+        self.MinMaxInverterDatavalues = MinMaxInverterRecord()
 
-        MinMaxInverterDataFields = ['Day_PMAX','Day_VACMAX','Day_VACMNIN','Day_VDCMax','Year_PMAX','Year_VACMAX','Year_VACMNIN','Year_VDCMax','Total_PMAX','Total_VACMAX','Total_VACMNIN','Total_VDCMax']
-        MinMaxInverterDataUnitValues = ['Value','Unit','lastupdated']
-
-        self.MinMaxInverterDatavalues = namedtuple('MinMaxInverterDataFields',MinMaxInverterDataFields)
-
-        self.MinMaxInverterDatavalues.Day_PMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)        # Maximum AC Power of Current Day
-        self.MinMaxInverterDatavalues.Day_PMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Day_PMAX._fields)
-        self.MinMaxInverterDatavalues.Day_VACMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)      # Day_UACMAX - Maximum AC Voltage of Current Day
-        self.MinMaxInverterDatavalues.Day_VACMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Day_VACMAX._fields)
-        self.MinMaxInverterDatavalues.Day_VACMNIN = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)     # Day_UACMNIN - Minimum AC Voltage of Current Day
-        self.MinMaxInverterDatavalues.Day_VACMNIN.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Day_VACMNIN._fields)
-        self.MinMaxInverterDatavalues.Day_VDCMax = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)      # UDCMax - Maximum DC Voltage Current Day
-        self.MinMaxInverterDatavalues.Day_VDCMax.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Day_VDCMax._fields)
-
-        self.MinMaxInverterDatavalues.Year_PMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)       # Maximum AC Power of Current Year
-        self.MinMaxInverterDatavalues.Year_PMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Year_PMAX._fields)
-        self.MinMaxInverterDatavalues.Year_VACMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)     # Year_UACMAX - Maximum AC Voltage of Current Year
-        self.MinMaxInverterDatavalues.Year_VACMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Year_VACMAX._fields)
-        self.MinMaxInverterDatavalues.Year_VACMNIN = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)    # Year_UACMNIN - Minimum AC Voltage of Current Year
-        self.MinMaxInverterDatavalues.Year_VACMNIN.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Year_VACMNIN._fields)
-        self.MinMaxInverterDatavalues.Year_VDCMax = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)     # Year_UDCMax -  Maximum DC Voltage Current Year
-        self.MinMaxInverterDatavalues.Year_VDCMax.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Year_VDCMax._fields)
-
-        self.MinMaxInverterDatavalues.Total_PMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)      # Maximum AC Power overall
-        self.MinMaxInverterDatavalues.Total_PMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Total_PMAX._fields)
-        self.MinMaxInverterDatavalues.Total_VACMAX = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)    # Total_UACMAX - Maximum AC Voltage overall
-        self.MinMaxInverterDatavalues.Total_VACMAX.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Total_VACMAX._fields)
-        self.MinMaxInverterDatavalues.Total_VACMNIN = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)   # Total_UACMNIN - Minimum AC Voltage overall
-        self.MinMaxInverterDatavalues.Total_VACMNIN.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Total_VACMNIN._fields)
-        self.MinMaxInverterDatavalues.Total_VDCMax = namedtuple('MinMaxInverterDataUnitValues',MinMaxInverterDataUnitValues)    # Total_UDCMax - Maximum DC Voltage overall
-        self.MinMaxInverterDatavalues.Total_VDCMax.__new__.__defaults__ = (None,) * len(self.MinMaxInverterDatavalues.Total_VDCMax._fields)
 
         """
         Storage for MeterReraltimeData Information
         http://<hostname>/solar_api/v1/GetMeterRealtimeData.cgi?Scope=Device&DeviceID=1
         """
-        MeterRealTimeDataFields = ['Current_AC_Phase_1','Current_AC_Phase_2','Current_AC_Phase_3','Serial', 'Enable',
-                                    'EnergyReactive_VArAC_Sum_Consumed','EnergyReactive_VArAC_Sum_Produced',
-                                    'EnergyReal_WAC_Minus_Absolute', 'EnergyReal_WAC_Plus_Absolute',
-                                    'EnergyReal_WAC_Sum_Consumed', 'EnergyReal_WAC_Sum_Produced',
-                                    'Frequency_Phase_Average', 'Meter_Location_Current','PowerApparent_S_Phase_1',
-                                    'PowerApparent_S_Phase_2', 'PowerApparent_S_Phase_3', 'PowerApparent_S_Sum',
-                                    'PowerFactor_Phase_1', 'PowerFactor_Phase_2', 'PowerFactor_Phase_3',
-                                    'PowerFactor_Sum','PowerReactive_Q_Phase_1','PowerReactive_Q_Phase_2',
-                                    'PowerReactive_Q_Phase_3','PowerReactive_Q_Sum', 'PowerReal_P_Phase_1',
-                                    'PowerReal_P_Phase_2','PowerReal_P_Phase_3', 'PowerReal_P_Sum', 'TimeStamp',
-                                    'Visible', 'Voltage_AC_PhaseToPhase_12', 'Voltage_AC_PhaseToPhase_23',
-                                    'Voltage_AC_PhaseToPhase_31', 'Voltage_AC_Phase_1', 'Voltage_AC_Phase_2',
-                                    'Voltage_AC_Phase_3', 'Details', 'Manufacturer','Model']
-        MeterRealTimeDataUnitFields = ['Value', 'lastupdated']
-        self.MeterRealTimeData = namedtuple('MeterRealTimeDataFields',MeterRealTimeDataFields)
-
-        self.MeterRealTimeData.Current_AC_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Current_AC_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Current_AC_Phase_1._fields)
-        self.MeterRealTimeData.Current_AC_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Current_AC_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Current_AC_Phase_2._fields)
-        self.MeterRealTimeData.Current_AC_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Current_AC_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Current_AC_Phase_3._fields)
-        self.MeterRealTimeData.Serial = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Serial.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Serial._fields)
-        self.MeterRealTimeData.Enable = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Enable.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Enable._fields)
-        self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed._fields)
-        self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced._fields)
-        self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute._fields)
-        self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute._fields)
-        self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed._fields)
-        self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced._fields)
-        self.MeterRealTimeData.Frequency_Phase_Average = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Frequency_Phase_Average.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Frequency_Phase_Average._fields)
-        self.MeterRealTimeData.Meter_Location_Current = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Meter_Location_Current.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Meter_Location_Current._fields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerApparent_S_Phase_1._fields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerApparent_S_Phase_2._fields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerApparent_S_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerApparent_S_Phase_3._fields)
-        self.MeterRealTimeData.PowerApparent_S_Sum = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerApparent_S_Sum.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerApparent_S_Sum._fields)
-        self.MeterRealTimeData.PowerFactor_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerFactor_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerFactor_Phase_1._fields)
-        self.MeterRealTimeData.PowerFactor_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerFactor_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerFactor_Phase_2._fields)
-        self.MeterRealTimeData.PowerFactor_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerFactor_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerFactor_Phase_3._fields)
-        self.MeterRealTimeData.PowerFactor_Sum = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerFactor_Sum.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerFactor_Sum._fields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReactive_Q_Phase_1._fields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReactive_Q_Phase_2._fields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReactive_Q_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReactive_Q_Phase_3._fields)
-        self.MeterRealTimeData.PowerReactive_Q_Sum = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReactive_Q_Sum.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReactive_Q_Sum._fields)
-        self.MeterRealTimeData.PowerReal_P_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReal_P_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReal_P_Phase_1._fields)
-        self.MeterRealTimeData.PowerReal_P_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReal_P_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReal_P_Phase_2._fields)
-        self.MeterRealTimeData.PowerReal_P_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReal_P_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReal_P_Phase_3._fields)
-        self.MeterRealTimeData.PowerReal_P_Sum = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.PowerReal_P_Sum.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.PowerReal_P_Sum._fields)
-        self.MeterRealTimeData.TimeStamp = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.TimeStamp.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.TimeStamp._fields)
-        self.MeterRealTimeData.Visible = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Visible.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Visible._fields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12._fields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23._fields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31._fields)
-        self.MeterRealTimeData.Voltage_AC_Phase_1 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_Phase_1.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_Phase_1._fields)
-        self.MeterRealTimeData.Voltage_AC_Phase_2 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_Phase_2.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_Phase_2._fields)
-        self.MeterRealTimeData.Voltage_AC_Phase_3 = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Voltage_AC_Phase_3.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Voltage_AC_Phase_3._fields)
-        self.MeterRealTimeData.Details = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Details.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Details._fields)
-        self.MeterRealTimeData.Manufacturer = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Manufacturer.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Manufacturer._fields)
-        self.MeterRealTimeData.Model = namedtuple('MeterRealTimeDataUnitFields', MeterRealTimeDataUnitFields)
-        self.MeterRealTimeData.Model.__new__.__defaults__ = (None,) * len(self.MeterRealTimeData.Model._fields)
+        self.MeterRealTimeData = MeterRealTimeRecord()
 
 
         """
         Storage for PowerFlowRealtimeData Information
         http://<hostname>/Solar_api/v1/GetPowerFlowRealtimeData.fcgi 
         """
-        #TODO add a last updated field here
         #TODO We need to set this up so we can add multiple inverters if they exist.
         # eg: PowerFlowRealtion inverters ---Inverter 1
         #                                  ---Inverter 2
         #                       site
-        PowerFlowRealtimeSiteFields = ['BatteryStandby','Energy_Day','Energy_Total','Energy_Year','Meter_Location','Mode','Power_Akku','Power_Grid','Power_Load','Power_PV','Rel_Autonomy','Rel_SelfConsumption']
-        self.PowerFlowRealtimeSite = namedtuple('PowerFlowRealtimeSiteFields',PowerFlowRealtimeSiteFields)
-        self.PowerFlowRealtimeSite.__new__.__defaults__ = (None,) * len(self.PowerFlowRealtimeSite._fields)
-
-
-        #   The Version of the Fronius API as understood and returned by itself.  If it's not version 1 then we need to stop as this code only supports API V1.
-        #   Understanding is that API Version 0 is actually very old and quiote obsolete.   (The API PDF available from Fronius has the API dated at 06 August 2013.)
-        #   Woudl be interesting to understand which units out there are still on API V0 if any. I suspect they all upgrade to the latest version
-        self._fetch_APIVersion()
-        if self.APIVersion != 1:
-            raise ValueError('Wrong API Version.  Version {} not supported'.format(self.APIVersion))
-
-        #   Execute each of the data collection methods to populate the initial set of data on first run of class.
-        #   This can take several seconds.
-        #
-        #   Could put a loop for one of the methods that does the same thing with different datacollections but
-        #   its easier / neater /  just more obvious to call the method 4 times outside a loop.
-
-
-
-        self.initialstarttime = datetime.datetime.utcnow().timestamp()
-        #TODO put a time start and time end for running all methods.   Just for interests sake.
-        self._getInverterinfo()
-        self._getLoggerInfo()
-        self._getPowerFlowRealtimeData()
-        self._GetMeterRealtimeData()
-        self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CumulationInverterData')
-        self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-        self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-        self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-
-        self._GetActiveDeviceInfo()
-        self._GetMeterRealtimeData()
-
-        self.initialRunTime = datetime.datetime.utcnow().timestamp() - self.initialstarttime
+        self.PowerFlowRealtimeSite = PowerFlowRealtimeSiteRecord()
 
     #-------------------------------------------------------------------------------------------------------------------
     """
@@ -418,682 +1091,898 @@ class Fronius:
 
     @property
     def ACPower(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.PAC)):
-            return self.CommonInverterValues.PAC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.PAC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.PAC.Value
 
     @property
     def Day_Energy(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.Day_Energy)):
-            return self.CommonInverterValues.Day_Energy.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.Day_Energy.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.Day_Energy.Value
 
     @property
     def Year_Energy(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.Year_Energy)):
-            return self.CommonInverterValues.Year_Energy.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.Year_Energy.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.Year_Energy.Value
 
     @property
     def Total_Energy(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.Total_Energy)):
-            return self.CommonInverterValues.Total_Energy.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.Total_Energy.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.Total_Energy.Value
 
     @property
     def ACCurrent(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.IAC)):
-            return self.CommonInverterValues.IAC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.IAC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.IAC.Value
 
     @property
     def ACVoltage(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.VAC)):
-            return self.CommonInverterValues.VAC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.VAC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.VAC.Value
 
     @property
     def ACFrequency(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.FAC)):
-            return self.CommonInverterValues.FAC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.FAC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.FAC.Value
 
     @property
     def DCCurrent(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.IDC)):
-            return self.CommonInverterValues.IDC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.IDC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.IDC.Value
 
     @property
     def DCVoltage(self):
-        if (self._checkdatacurrency(self.CommonInverterValues.VDC)):
-            return self.CommonInverterValues.VDC.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'CommonInverterData')
-            return self.CommonInverterValues.VDC.Value
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.VDC.Value
 
 
     #-------------------------------------------------------------------------------------------------------------------
     @property
     def ACcurrentPH1(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.IAC_L1)):
-            return self.ThreePhaseinverterValues.IAC_L1.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.IAC_L1.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.IAC_L1.Value
 
     @property
     def ACcurrentPH2(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.IAC_L2)):
-            return self.ThreePhaseinverterValues.IAC_L2.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.IAC_L2.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.IAC_L2.Value
 
     @property
     def ACcurrentPH3(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.IAC_L3)):
-            return self.ThreePhaseinverterValues.IAC_L3.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.IAC_L3.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.IAC_L3.Value
 
     @property
     def ACVoltsPH1(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.VAC_PH1)):
-            return self.ThreePhaseinverterValues.VAC_PH1.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.VAC_PH1.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.VAC_PH1.Value
 
     @property
     def ACVoltsPH2(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.VAC_PH2)):
-            return self.ThreePhaseinverterValues.VAC_PH2.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.VAC_PH2.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.VAC_PH2.Value
 
     @property
-    def ACVoltsPH1(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.VAC_PH3)):
-            return self.ThreePhaseinverterValues.VAC_PH3.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.VAC_PH3.Value
+    def ACVoltsPH3(self):
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.VAC_PH3.Value
 
     @property
     def AmbientTemp(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.T_Ambient)):
-            return self.ThreePhaseinverterValues.T_Ambient.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.T_Ambient.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.T_Ambient.Value
 
     @property
     def Rotation_Speed_Fan_FR(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR)):
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Value
 
     @property
     def Rotation_Speed_Fan_FL(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL)):
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Value
 
     @property
     def Rotation_Speed_Fan_BR(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR)):
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Value
 
     @property
     def Rotation_Speed_Fan_BL(self):
-        if (self._checkdatacurrency(self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL)):
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, '3PInverterData')
-            return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Value
+        self._ensureCurrent('3PInverterData')
+        return self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Value
 
     #-------------------------------------------------------------------------------------------------------------------
     @property
     def Day_PowerMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Day_PMAX)):
-            return self.MinMaxInverterDatavalues.Day_PMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Day_PMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Day_PMAX.Value
 
     @property
     def Day_VoltageACMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Day_VACMAX)):
-            return self.MinMaxInverterDatavalues.Day_VACMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Day_VACMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Day_VACMAX.Value
 
     @property
     def Day_VoltageACMIN(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Day_VACMNIN)):
-            return self.MinMaxInverterDatavalues.Day_VACMNIN.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Day_VACMNIN.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Day_VACMNIN.Value
 
     @property
     def Day_VoltageDCMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Day_VDCMax)):
-            return self.MinMaxInverterDatavalues.Day_VDCMax.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Day_VDCMax.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Day_VDCMax.Value
 
     @property
     def Year_PowerMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Year_PMAX)):
-            return self.MinMaxInverterDatavalues.Year_PMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Year_PMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Year_PMAX.Value
 
     @property
     def Year_VoltageACMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Year_VACMAX)):
-            return self.MinMaxInverterDatavalues.Year_VACMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Year_VACMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Year_VACMAX.Value
 
     @property
     def Year_VoltageACMIN(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Year_VACMNIN)):
-            return self.MinMaxInverterDatavalues.Year_VACMNIN.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Year_VACMNIN.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Year_VACMNIN.Value
 
     @property
     def Year_VoltageDCMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Year_VDCMax)):
-            return self.MinMaxInverterDatavalues.Year_VDCMax.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Year_VDCMax.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Year_VDCMax.Value
 
     @property
     def Total_PowerMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Total_PMAX)):
-            return self.MinMaxInverterDatavalues.Total_PMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Total_PMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Total_PMAX.Value
 
     @property
     def Total_VoltageACMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Total_VACMAX)):
-            return self.MinMaxInverterDatavalues.Total_VACMAX.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Total_VACMAX.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Total_VACMAX.Value
 
     @property
     def Total_VoltageACMIN(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Total_VACMNIN)):
-            return self.MinMaxInverterDatavalues.Total_VACMNIN.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Total_VACMNIN.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Total_VACMNIN.Value
 
     @property
     def Total_VoltageDCMAX(self):
-        if (self._checkdatacurrency(self.MinMaxInverterDatavalues.Total_VDCMax)):
-            return self.MinMaxInverterDatavalues.Total_VDCMax.Value
-        else:
-            self._GetInverterRealtimeData(self.scope, self.DeviceID, 'MinMaxInverterData')
-            return self.MinMaxInverterDatavalues.Total_VDCMax.Value
+        self._ensureCurrent('MinMaxInverterData')
+        return self.MinMaxInverterDatavalues.Total_VDCMax.Value
 
 
     #-------------------------------------------------------------------------------------------------------------------
     @property
     def Current_AC_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Current_AC_Phase_1)):
-            return self.MeterRealTimeData.Current_AC_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Current_AC_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Current_AC_Phase_1.Value
 
     @property
     def Current_AC_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Current_AC_Phase_2)):
-            return self.MeterRealTimeData.Current_AC_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Current_AC_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Current_AC_Phase_2.Value
 
     @property
     def Current_AC_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Current_AC_Phase_3)):
-            return self.MeterRealTimeData.Current_AC_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Current_AC_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Current_AC_Phase_3.Value
 
     @property
     def Serial(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Serial)):
-            return self.MeterRealTimeData.Serial.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Serial.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Serial.Value
 
     @property
     def Enable(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Enable)):
-            return self.MeterRealTimeData.Enable.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Enable.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Enable.Value
 
     @property
     def EnergyReactive_VArAC_Sum_Consumed(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed)):
-            return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.Value
 
     @property
     def EnergyReactive_VArAC_Sum_Produced(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced)):
-            return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.Value
 
     @property
     def EnergyReal_WAC_Minus_Absolute(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute)):
-            return self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.Value
 
     @property
     def EnergyReal_WAC_Plus_Absolute(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute)):
-            return self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.Value
 
     @property
     def EnergyReal_WAC_Sum_Consumed(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed)):
-            return self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.Value
 
     @property
     def EnergyReal_WAC_Sum_Produced(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced)):
-            return self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.Value
 
     @property
     def Frequency_Phase_Average(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Frequency_Phase_Average)):
-            return self.MeterRealTimeData.Frequency_Phase_Average.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Frequency_Phase_Average.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Frequency_Phase_Average.Value
 
     @property
     def Meter_Location_Current(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Meter_Location_Current)):
-            return self.MeterRealTimeData.Meter_Location_Current.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Meter_Location_Current.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Meter_Location_Current.Value
 
     @property
     def PowerApparent_S_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerApparent_S_Phase_1)):
-            return self.MeterRealTimeData.PowerApparent_S_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerApparent_S_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerApparent_S_Phase_1.Value
 
     @property
     def PowerApparent_S_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerApparent_S_Phase_2)):
-            return self.MeterRealTimeData.PowerApparent_S_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerApparent_S_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerApparent_S_Phase_2.Value
 
     @property
     def PowerApparent_S_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerApparent_S_Phase_3)):
-            return self.MeterRealTimeData.PowerApparent_S_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerApparent_S_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerApparent_S_Phase_3.Value
 
     @property
     def PowerApparent_S_Sum(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerApparent_S_Sum)):
-            return self.MeterRealTimeData.PowerApparent_S_Sum.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerApparent_S_Sum.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerApparent_S_Sum.Value
 
     @property
     def PowerFactor_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerFactor_Phase_1)):
-            return self.MeterRealTimeData.PowerFactor_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerFactor_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerFactor_Phase_1.Value
 
     @property
     def PowerFactor_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerFactor_Phase_2)):
-            return self.MeterRealTimeData.PowerFactor_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerFactor_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerFactor_Phase_2.Value
 
     @property
     def PowerFactor_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerFactor_Phase_3)):
-            return self.MeterRealTimeData.PowerFactor_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerFactor_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerFactor_Phase_3.Value
 
     @property
     def PowerFactor_Sum(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerFactor_Sum)):
-            return self.MeterRealTimeData.PowerFactor_Sum.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerFactor_Sum.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerFactor_Sum.Value
 
     @property
     def PowerReactive_Q_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReactive_Q_Phase_1)):
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReactive_Q_Phase_1.Value
 
     @property
     def PowerReactive_Q_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReactive_Q_Phase_2)):
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReactive_Q_Phase_2.Value
 
     @property
     def PowerReactive_Q_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReactive_Q_Phase_3)):
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReactive_Q_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReactive_Q_Phase_3.Value
 
     @property
     def PowerReactive_Q_Sum(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReactive_Q_Sum)):
-            return self.MeterRealTimeData.PowerReactive_Q_Sum.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReactive_Q_Sum.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReactive_Q_Sum.Value
 
     @property
     def PowerReal_P_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReal_P_Phase_1)):
-            return self.MeterRealTimeData.PowerReal_P_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReal_P_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReal_P_Phase_1.Value
 
     @property
     def PowerReal_P_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReal_P_Phase_2)):
-            return self.MeterRealTimeData.PowerReal_P_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReal_P_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReal_P_Phase_2.Value
 
     @property
     def PowerReal_P_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReal_P_Phase_3)):
-            return self.MeterRealTimeData.PowerReal_P_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReal_P_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReal_P_Phase_3.Value
 
     @property
     def PowerReal_P_Sum(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.PowerReal_P_Sum)):
-            return self.MeterRealTimeData.PowerReal_P_Sum.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.PowerReal_P_Sum.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.PowerReal_P_Sum.Value
 
     @property
     def TimeStamp(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.TimeStamp)):
-            return self.MeterRealTimeData.TimeStamp.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.TimeStamp.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.TimeStamp.Value
 
     @property
     def Visible(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Visible)):
-            return self.MeterRealTimeData.Visible.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Visible.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Visible.Value
 
     @property
     def Voltage_AC_PhaseToPhase_12(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12)):
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.Value
 
     @property
     def Voltage_AC_PhaseToPhase_23(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23)):
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.Value
 
     @property
     def Voltage_AC_PhaseToPhase_31(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31)):
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.Value
 
     @property
     def Voltage_AC_Phase_1(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_Phase_1)):
-            return self.MeterRealTimeData.Voltage_AC_Phase_1.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_Phase_1.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_Phase_1.Value
 
     @property
     def Voltage_AC_Phase_2(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_Phase_2)):
-            return self.MeterRealTimeData.Voltage_AC_Phase_2.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_Phase_2.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_Phase_2.Value
 
     @property
     def Voltage_AC_Phase_3(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Voltage_AC_Phase_3)):
-            return self.MeterRealTimeData.Voltage_AC_Phase_3.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Voltage_AC_Phase_3.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Voltage_AC_Phase_3.Value
 
     @property
     def Manufacturer(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Manufacturer)):
-            return self.MeterRealTimeData.Manufacturer.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Manufacturer.Value
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Manufacturer.Value
 
     @property
     def Model(self):
-        if (self._checkdatacurrency(self.MeterRealTimeData.Model)):
-            return self.MeterRealTimeData.Model.Value
-        else:
-            self._GetMeterRealtimeData()
-            return self.MeterRealTimeData.Model.Value
-
+        self._ensureCurrent('MeterRealtimeData')
+        return self.MeterRealTimeData.Model.Value
 
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _checkdatacurrency(self, parameter):
-        """
-        check to make sure the data has not gone stale.
-        :return:    If data is current then return true else return false.
-        A Preproduction testing version to check data currency.
-        """
+    @property
+    def BatteryStandby(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.BatteryStandby
 
-        #   If it has lastupdated attribute then use that to check the timing.
-        #   If it doesnt then simply go on the global lastupdated attribute.
+    @property
+    def Energy_Day(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Energy_Day
 
-        if hasattr(parameter, 'lastupdated') and parameter.lastupdated is not None:
-            timedifference = (datetime.datetime.utcnow().timestamp() - parameter.lastupdated)
-            if timedifference <= self.datatimeoutseconds:
-                return True
-            else:
-                return False
+    @property
+    def Energy_Total(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Energy_Total
 
-        #   The following check is to catch properties that have not been migrated to individual method of
-        #   checking for data currency.
-        #   It uses the global lastupodated parameter.
-        #   Eventually this should be obsolete. but until then......
-        else:
-            if (datetime.datetime.utcnow().timestamp() - self.lastSuccessfullResponseTime) <= self.datatimeoutseconds:
-                return True
-            else:
-                return False
+    @property
+    def Energy_Year(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Energy_Year
+
+    @property
+    def Meter_Location(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Meter_Location
+
+    @property
+    def Mode(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Mode
+
+    @property
+    def Power_Akku(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Power_Akku
+
+    @property
+    def Power_Grid(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Power_Grid
+
+    @property
+    def Power_Load(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Power_Load
+
+    @property
+    def Power_PV(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Power_PV
+
+    @property
+    def Rel_Autonomy(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Rel_Autonomy
+
+    @property
+    def Rel_SelfConsumption(self):
+        self._ensureCurrent('PowerFlowRealtimeData')
+        return self.PowerFlowRealtimeSite.Rel_SelfConsumption
 
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _fetchDataFromAPI(self, url):
+    @property
+    def CO2Factor(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.C02Factor
+
+    @property
+    def CO2Unit(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.CO2Unit
+
+    @property
+    def CashCurrency(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.CashCurrency
+
+    @property
+    def CashFactor(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.CashFactor
+
+    @property
+    def DefaultLanguage(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.DefaultLanguage
+
+    @property
+    def DeliveryFactor(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.DeliveryFactor
+
+    @property
+    def HWVersion(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.HWVersion
+
+    @property
+    def PlatformID(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.PlatformID
+
+    @property
+    def ProductID(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.ProductID
+
+    @property
+    def SWVersion(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.SWVersion
+
+    @property
+    def TimezoneLocation(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.TimezoneLocation
+
+    @property
+    def TimezoneName(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.TimezoneName
+
+    @property
+    def UTCOffset(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.UTCOffset
+
+    @property
+    def LoggerUniqueID(self):
+        self._ensureCurrent('LoggerInfo')
+        return self.LoggerInfo.UniqueID
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def DeviceStatusCode(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.StatusCode
+
+    @property
+    def DeviceErrorCode(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.ErrorCode
+
+    @property
+    def DeviceLEDColor(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.LEDColor
+
+    @property
+    def DeviceLEDState(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.LEDState
+
+    @property
+    def DeviceMgmtTimerRemainingTime(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.MgmtTimerRemainingTime
+
+    @property
+    def DeviceStateToReset(self):
+        self._ensureCurrent('CommonInverterData')
+        return self.CommonInverterValues.DeviceStatus.StateToReset
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def InverterCustomName(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.CustomName
+
+    @property
+    def InverterDT(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.DT
+
+    @property
+    def InverterErrorCode(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.ErrorCode
+
+    @property
+    def InverterPVPower(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.PVPower
+
+    @property
+    def InverterShow(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.Show
+
+    @property
+    def InverterStatusCode(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.StatusCode
+
+    @property
+    def InverterUniqueID(self):
+        self._ensureCurrent('InverterInfo')
+        return self.InverterInfo.UniqueID
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def PowerLEDColor(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.powerLED.Color
+
+    @property
+    def PowerLEDState(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.powerLED.State
+
+    @property
+    def SolarNetLEDColor(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.SolarNetLED.Color
+
+    @property
+    def SolarNetLEDState(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.SolarNetLED.State
+
+    @property
+    def SolarWebLEDColor(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.SolarWebLED.Color
+
+    @property
+    def SolarWebLEDState(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.SolarWebLED.State
+
+    @property
+    def WLANLEDColor(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.WLANLED.Color
+
+    @property
+    def WLANLEDState(self):
+        self._ensureCurrent('LoggerLEDInfo')
+        return self.InverterStatusLEDs.WLANLED.State
+
+
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def collectionValues(self, collection):
         """
-        Performs the http query to Fronius unit.
-        Returns a json text strong
+        The values currently held for a collection as a plain dict.   Nothing is fetched.
+        :param collection:  Any collection name in COLLECTIONRECORDS
+        :return:    dict of field name to value.   Fields holding a Value/Unit record give just the value,
+                    other nested records (DeviceStatus, LEDs) give a dict of their own fields.
+        """
+        record = getattr(self, COLLECTIONRECORDS[collection])
+        values = {}
+        for field in record._fields:
+            if field == 'lastupdated':
+                continue
+            value = getattr(record, field)
+            if isinstance(value, _Record):
+                if 'Value' in value._fields:
+                    value = value.Value
+                else:
+                    value = {name: getattr(value, name) for name in value._fields if name != 'lastupdated'}
+            values[field] = value
+        return values
 
-        :param url:    The Target URL of the Fronius system.  See STATIC definitions
-        :return:    Return the JSON text block containing queried data
+    #-------------------------------------------------------------------------------------------------------------------
+    def snapshot(self, collections=None):
         """
-        json = None
-        #   Try to retrieve the WEB API response from the Fronius unit and handle common errors
-        try:
-            response = requests.get(url, timeout = self.HTTPtimeout)
+        Every value of the collections at one moment.
+        Each collection is refreshed at most once (only if it is stale) and the values are then read straight from the
+        records,  so nothing can be fetched again half way through as happens when reading property after property.
+        :param collections:     Any of the collections in SNAPSHOTPROPERTIES.  Defaults to all of them
+        :return:    Snapshot.   Values of collections that were not asked for are None
+        """
+        if collections is None:
+            collections = list(SNAPSHOTPROPERTIES)
+        for collection in collections:
+            if collection not in SNAPSHOTPROPERTIES:
+                raise ValueError('Collection {0} can not be included in a snapshot'.format(collection))
+
+        for collection in collections:
+            self._ensureCurrent(collection)
+
+        now = time.time()
+        values = dict.fromkeys(Snapshot._fields)
+        fetched = dict.fromkeys(SnapshotTimes._fields)
+        for collection in collections:
+            held = self.collectionValues(collection)
+            for name in SNAPSHOTPROPERTIES[collection]:
+                field = PROPERTYFIELDS.get(name, name)
+                if isinstance(field, tuple):
+                    values[name] = held[field[0]][field[1]]
+                else:
+                    values[name] = held[field]
+            age = self.cache.age(collection)
+            if age is not None:
+                fetched[COLLECTIONRECORDS[collection]] = now - age
 
-        except requests.exceptions.ConnectTimeout:
-            print("Request Exception Timed Out")
+        values['fetched'] = SnapshotTimes(**fetched)
+        return Snapshot(**values)
 
-        except ConnectionError:
-            print("Connection Error")
+    #-------------------------------------------------------------------------------------------------------------------
+    def _ensureCurrent(self, collection):
+        """
+        Called by every property before it reads its collection.   Nothing is fetched here,  the collection is only
+        noted so read() can tell how old the value is.   Fronius refreshes the collection if it is stale.
+        :param collection:  Name of the collection about to be read from
+        :return:
+        """
+        self._readinfo.collection = collection
 
-        #   If the actual HTTP call works (no hard error exception)
-        #   then check if there's any soft errors returned from the Fronius API.
-        #   Handle any other response other then 200 and 201.
-        #   Generally none of the other errors should show up unless the Fronius Unit has ....
-        #   Done somethign inconsistent.
+    #-------------------------------------------------------------------------------------------------------------------
+    def read(self, name):
+        """
+        Read a property together with how old its value is.
+        With staleWhileRevalidate a property may return a stale value,  this says how stale.
+        :param name:    Property name,  eg 'ACPower'
+        :return:    AgedValue.   age is seconds since the collection was fetched,  None if it never has been.
+                    stale is True if the age is past the collection's TTL.   error is the exception raised by the
+                    last background refresh of the collection,  None if it succeeded or there has not been one
+        """
+        self._readinfo.collection = None
+        value = getattr(self, name)
+        collection = self._readinfo.collection
+        if collection is None:
+            return AgedValue(value, None, False)
 
-        #TODO check the errors being raised and make sure they make sense.
-        else:
-            if (response.status_code == 201) or (response.status_code == 200):
-                json = response.json()
+        age = self.cache.age(collection)
+        return AgedValue(value, age, age is None or age > self._collectionTTL(collection),
+                         self.revalidationErrors.get(collection))
 
-            elif response.status_code >= 500:
-                raise ValueError('[!] [{0}] Server Error'.format(response.status_code))
+    #-------------------------------------------------------------------------------------------------------------------
+    def _collectionTTL(self, collection):
+        """
+        Seconds a fetched collection stays fresh.   The polling schedule decides if there is one,  otherwise the cache TTLs.
+        :param collection:
+        :return:
+        """
+        if self.pollingSchedule is not None:
+            return self.pollingSchedule.interval(self, collection)
+        return self.cache.ttl(collection)
 
-            elif response.status_code == 404:
-                raise ValueError('[!] [{0}] URL not found: [{1}]'.format(response.status_code, url))
+    #-------------------------------------------------------------------------------------------------------------------
+    def _pollWait(self, collection):
+        """
+        Seconds until a collection is due to be polled again.
+        :param collection:
+        :return:    Zero or less if it is due now
+        """
+        age = self.cache.age(collection)
+        if age is None:
+            return 0
+        return self._collectionTTL(collection) - age
 
-            elif response.status_code == 401:
-                raise ValueError('[!] [{0}] Authentication Failed'.format(response.status_code))
+    #-------------------------------------------------------------------------------------------------------------------
+    def _collectionURL(self, collection, Scope=None, DeviceID=None, DeviceClass=None):
+        """
+        Build the URL that fetches a collection.
+        :param collection:  APIVersion or any collection name understood by _refreshCollection
+        :param Scope:       Defaults to the instance scope
+        :param DeviceID:    Defaults to the instance DeviceID
+        :param DeviceClass: ActiveDeviceInfo only.  Defaults to System
+        :return:    The URL
+        """
+        if Scope is None:
+            Scope = self.scope
+        if DeviceID is None:
+            DeviceID = self.DeviceID
+        if DeviceClass is None:
+            DeviceClass = "System"
 
-            elif response.status_code >= 300:
-                raise ValueError('[!] [{0}] Unexpected redirect.'.format(response.status_code))
+        if collection == 'APIVersion':
+            return "{protocol}://{host}/solar_api/GetAPIVersion.cgi".format(protocol = self.protocol, host = self.host)
+        elif collection == 'InverterInfo':
+            return "{protocol}://{host}/{baseurl}/GetInverterInfo.cgi".format(protocol = self.protocol, host = self.host, baseurl = self.BaseURL)
+        elif collection == 'LoggerInfo':
+            return "{protocol}://{host}/{baseurl}/GetLoggerInfo.cgi".format(protocol=self.protocol, host=self.host,baseurl=self.BaseURL)
+        elif collection == 'LoggerLEDInfo':
+            return "{protocol}://{host}/{baseurl}/GetLoggerLEDInfo.cgi".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL)
+        elif collection == 'PowerFlowRealtimeData':
+            return "{protocol}://{host}/{baseurl}/GetPowerFlowRealtimeData.fcgi".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL)
+        elif collection == 'MeterRealtimeData':
+            return "{protocol}://{host}/{baseurl}/GetMeterRealtimeData.cgi?Scope={Scope}&DeviceID={DeviceID}".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope=Scope, DeviceID=DeviceID)
+        elif collection == 'ActiveDeviceInfo':
+            return "{protocol}://{host}{baseurl}GetActiveDeviceInfo.cgi?DeviceClass={DeviceClass}".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, DeviceClass=DeviceClass)
+        else:
+            return "{protocol}://{host}/{baseurl}/GetInverterRealtimeData.cgi?Scope={Scope}&DeviceID={DeviceID}&DataCollection={DataCollection}".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope=Scope, DeviceID=DeviceID, DataCollection=collection)
 
-            else:
-                raise ValueError('[?] Unexpected Error: [HTTP {0}]: Content: {1}'.format(response.status_code, response.content))
-        return json
+    #-------------------------------------------------------------------------------------------------------------------
+    def _parseCollection(self, collection, json, url=None, cached=False):
+        """
+        Store an already fetched response for a collection.
+        The parsing is kept apart from the fetching so that AsyncFronius can share it.
+        :param collection:  Any collection name understood by _refreshCollection
+        :param json:        The decoded response
+        :param url:         The request the response is for.   Also used in error messages
+        :param cached:      The response was loaded from the metadata cache,  not fetched from the unit
+        :return:    The result of _storeCollection
+        """
+        #   Metadata is saved to disk as it is fetched.   If the logger's UniqueID has changed the unit behind the host
+        #   has been replaced and the rest of its metadata has to be fetched again.
+        #   Saving a response that came from the cache would stamp it as fresh without the unit having confirmed it.
+        if (self.metadataCache is not None and not cached and collection in METADATACOLLECTIONS and
+                self._responseOkay(json)):
+            if self.metadataCache.store(self.host, collection, json):
+                for other in METADATACOLLECTIONS[1:]:
+                    if other != collection:
+                        self.cache.invalidate(other)
+
+        #   The Datamanager only updates its values every few seconds.   A response with the same Head.Timestamp as the
+        #   last one stored for the same request holds the same values,  so only the freshness markers are updated.
+        if self._responseUnchanged(collection, json, url):
+            result = True
+        elif collection == 'ActiveDeviceInfo':
+            # TODO Process this data
+            result = None
+        else:
+            result = self._storeCollection(collection, json, url)
+            if self.history is not None and collection in self.history.collections and self._responseOkay(json):
+                self.history.record(collection, getattr(self, COLLECTIONRECORDS[collection]))
+
+            if self._responseOkay(json):
+                self._lasttimestamps[(collection, url)] = json['Head']['Timestamp']
+
+        #   Only a successful response makes the collection fresh.   After an error response it is asked for again as
+        #   soon as it is next read or due.   The metadata cache records the age of what it loads itself.
+        if not cached and self._responseOkay(json):
+            self.cache.stored(collection)
+        return result
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _fetch_APIVersion(self):
+    def _storeCollection(self, collection, json, url=None):
         """
-        The API Version JSON does not contain a standard status header etc like the other urls.   This has to be handled differently and seperatly.
-        :return:
+        Store the values of a response in the collection's record as laid out in COLLECTIONFIELDS.
+        Only values that are in the response are updated,  everything else is set to its default.
+        :param collection:
+        :param json:
+        :param url:     Only used in error messages
+        :return:        True.   Collections with nothing to store (CumulationInverterData) are accepted as they are
         """
+        collectionmap = COLLECTIONFIELDS.get(collection)
+        if collectionmap is None:
+            return True
+        record = getattr(self, COLLECTIONRECORDS[collection])
 
-        # TODO check the possible return and error cases here and plan for them.
-        # What happens when the expected results aren't returned?
+        #   One time stamp for every value in the response
+        now = datetime.datetime.utcnow().timestamp()
 
-        url = "{protocol}://{host}/solar_api/GetAPIVersion.cgi".format(protocol = self.protocol, host = self.host)
-        json = self._fetchDataFromAPI(url)
-        self.APIVersion = json['APIVersion']
-        self.BaseURL = json['BaseURL']
-        self.CompatibilityRange = json['CompatibilityRange']
+        if not self._responseOkay(json):
+            #   If error code returned then just populate the data with the defaults and mark as not up to date
+            if collectionmap.resetOnError:
+                EXTRACTORS[collection](record, {}, now)
+            return True
 
+        try:
+            data = json
+            for key in collectionmap.path:
+                data = data[str(self.inverternumber) if key is INVERTERNUMBER else key]
+        except (KeyError, TypeError):
+            raise ValueError('[{url}] Expected JSON KEY not available.  No Data Returned:'.format(url=url))
+
+        EXTRACTORS[collection](record, data, now)
+        if 'lastupdated' in record._fields:
+            record.lastupdated = now
+        return True
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _GetJSONData(self,url):
+    def _responseUnchanged(self, collection, json, url):
         """
-        Extract the JSON Body and Common Response Header from the API response and begin processing it.
+        Check whether a response is the same one that was last stored for the request.   If it is,  mark the values of
+        the collection as fresh and count the parse as skipped.
+        :param collection:
+        :param json:
         :param url:
+        :return:    True if there is no need to parse the response
+        """
+        if collection not in COLLECTIONRECORDS or not self._responseOkay(json):
+            return False
+        if self._lasttimestamps.get((collection, url)) != json['Head']['Timestamp']:
+            return False
+
+        #   Values the unit stopped reporting have lastupdated None and stay that way.
+        now = datetime.datetime.utcnow().timestamp()
+        record = getattr(self, COLLECTIONRECORDS[collection])
+        for field in record._fields:
+            value = getattr(record, field)
+            if field == 'lastupdated':
+                if isinstance(value, (int, float)):
+                    record.lastupdated = now
+            elif isinstance(value, _Record) and isinstance(getattr(value, 'lastupdated', None), (int, float)):
+                value.lastupdated = now
+
+        with self._lock:
+            self.skippedParses += 1
+        return True
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _decodeResponse(self, status_code, content, url):
+        """
+        Check the HTTP status of a response and decode its JSON body.
+        :param status_code:     HTTP status code
+        :param content:         Raw bytes of the response body
+        :param url:             Only used in error messages
+        :return:    The decoded JSON
+        """
+        if (status_code == 201) or (status_code == 200):
+            return self.jsonDecoder(content)
+
+        elif status_code >= 500:
+            raise ValueError('[!] [{0}] Server Error'.format(status_code))
+
+        elif status_code == 404:
+            raise ValueError('[!] [{0}] URL not found: [{1}]'.format(status_code, url))
+
+        elif status_code == 401:
+            raise ValueError('[!] [{0}] Authentication Failed'.format(status_code))
+
+        elif status_code >= 300:
+            raise ValueError('[!] [{0}] Unexpected redirect.'.format(status_code))
+
+        else:
+            raise ValueError('[?] Unexpected Error: [HTTP {0}]: Content: {1}'.format(status_code, content))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _parseAPIVersion(self, json):
+        """
+        Store the GetAPIVersion response.
+        :param json:
         :return:
         """
-        json = self._fetchDataFromAPI(url)
-        self._extractCRHData(json)
-        return json
+        self.APIVersion = json['APIVersion']
+        self.BaseURL = json['BaseURL']
+        self.CompatibilityRange = json['CompatibilityRange']
 
 
     #-------------------------------------------------------------------------------------------------------------------
@@ -1104,41 +1993,18 @@ class Fronius:
         :return:
         """
 
-        # Setting the Status code back to none ensures if a status update fails we dont get left with a "success" flag
-        self.UnitStatus.code = None
-
-        #   Common Response Header code and error messages
-        #   How do I offload these to another module.
-        #   TODO I really want to put these into a secondary file to reduce clutter.
-        CRHErrorCodeFields = ['value','status','description']
-        CRHErrorCodes = {0: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(0,'OKAY', 'Request successfully finished, Data are valid'),
-                      1: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(1,'NotImplemented', 'The request or a part of the request is not implemented yet'),
-                      2: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(2,'Uninitialized', 'Instance of APIRequest created, but not yet configured'),
-                      3: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(3,'Initialized', 'Request is configured and ready to be sent'),
-                      4: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(4,'Running', 'Request is currently being processed (waiting for response)'),
-                      5: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(5,'Timeout', 'Response was not received within desired time'),
-                      6: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(6,'Argument Error', 'Invalid arguments/combination of arguments or missing arguments'),
-                      7: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(7,'LNRequestError', 'Something went wrong during sending/receiving of LN-message'),
-                      8: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(8,'LNRequestTimeout', 'LN-request timed out'),
-                      9: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(9,'LNParseError', 'Something went wrong during parsing of successfully received LN-message'),
-                      10: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(10,'ConfigIOError', 'Something went wrong while reading settings from local config'),
-                      11: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(11,'NotSupported', 'The operation/feature or whatever is not supported'),
-                      12: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(12,'DeviceNotAvailable', 'The device is not available'),
-                      255: namedtuple('CRHErrorCodes',CRHErrorCodeFields)(255,'UnknownError', 'undefined runtime error')
-                      }
-
-        #   Note that the messages returned by the API are actually different to the messages provided in
-        #   the API documentation PDF
-        self.UnitStatus.timestamp = {'value': json['Head']['Timestamp']}
-        self.UnitStatus.code = CRHErrorCodes[json['Head']['Status']['Code']].value
-        self.UnitStatus.status = CRHErrorCodes[json['Head']['Status']['Code']].status
-        self.UnitStatus.description = CRHErrorCodes[json['Head']['Status']['Code']].description
-        self.UnitStatus.reason = json['Head']['Status']['Reason']
-        self.UnitStatus.usermessage = json['Head']['Status']['UserMessage']
+        #   The whole header is read before UnitStatus is replaced.   If the header is malformed the status is left
+        #   as NOUNITSTATUS rather than keeping the "success" of an earlier response.
+        self.UnitStatus = NOUNITSTATUS
+        head = json['Head']
+        status = head['Status']
+        known = crhStatusCode(status['Code'])
+        self.UnitStatus = UnitStatus(head['Timestamp'], known.value, known.status, known.description,
+                                     status.get('Reason'), status.get('UserMessage'))
 
         #   If the Unit responds with a 0 error code that means the Request was successfully finished.
         #   Record the timestamp as the last successfully response.
-        if self.UnitStatus.code == 0:
+        if known.value == 0:
             self.lastSuccessfullResponseTime = datetime.datetime.utcnow().timestamp()
             return True
 
@@ -1147,193 +2013,397 @@ class Fronius:
         return False
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _getInverterinfo(self):
+    def _responseOkay(self, json):
         """
-        Note:  At the moment this only supports the first (1) inverter in the system.   I need to obtain access to a ganged inverter array before I can properly test this code with multiple inverters.
-        :return:
+        Check the status code of a single response.
+        Used instead of self.UnitStatus.code as with parallel requests UnitStatus might already belong to another response.
+        :param json:
+        :return:    True if the Common Response Header reports success
         """
-        url = "{protocol}://{host}/{baseurl}/GetInverterInfo.cgi".format(protocol = self.protocol, host = self.host, baseurl = self.BaseURL)
-        json = self._GetJSONData(url)
+        return json['Head']['Status']['Code'] == 0
 
-        inverterNumber = str(self.inverternumber)
 
-        if 'CustomName' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.CustomName = json['Body']['Data'][inverterNumber]['CustomName']
-        else:
-            self.InverterInfo.CustomName = None
+class Fronius(FroniusData):
+    """
+    Interface to communicate with the Fronius Symo over http / JSON
+    Attributes:
+        host            The ip/domain of the Fronius device
+        useHTTPS        Use HTTPS instead of HTTP :  Froinus API V1 only supports HTTP
+        HTTPtimeout     HTTP timeout in seconds.  Used for both connect and read unless they are given separately
+        connectTimeout  Seconds to wait for the Datamanager to accept the TCP connection
+        readTimeout     Seconds to wait for the Datamanager to send its response
+        poolSize        Maximum number of pooled connections kept open to the Datamanager
+        keepAlive       Reuse connections between requests instead of opening a new one each time
+        parallelInit    Populate the initial data with several requests in flight at once instead of one after another
+        maxParallelRequests     How many requests parallelInit may have in flight.  Keep it small, the Datamanager is easily overloaded
+        lazy            Only check the API version on construction.  Each collection is fetched the first time a property needing it is read
+        pollingSchedule An AdaptivePollingSchedule.   When given,  properties and poll() refresh each collection on its own
+                        schedule rather than after the cache TTL of the collection
+        failureThreshold    Consecutive failed requests after which the host's circuit breaker opens
+        breakerCooldown     Seconds the circuit stays open before a probe request is let through
+        maxBreakerCooldown  The cooldown doubles each time a probe fails,  up to this many seconds
+        jsonDecoder     Callable decoding the raw bytes of a response.  Defaults to decodeJSON (orjson if installed)
+        cacheTTLs       Dict of collection to seconds it is served from the cache.  Defaults to COLLECTIONTTLS
+        metadataCache   A metadatacache.MetadataCache.   The API version, InverterInfo, LoggerInfo and ActiveDeviceInfo
+                        are loaded from it on start up instead of being fetched,  and saved to it whenever they are fetched
+        staleWhileRevalidate    A property whose collection has gone stale returns the value held straight away and the
+                                collection is refreshed in the background.   See read() for the age of a value
+        maxStaleness    Seconds past its TTL a collection may still be served stale.   Beyond that reads wait for the fetch
+        history         A history.MetricHistory.   The values of its metrics are appended to it each time their
+                        collection is stored
 
-        if 'DT' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.DT = json['Body']['Data'][inverterNumber]['DT']
-        else:
-            self.InverterInfo.DT = None
+        https://thomas-cokelaer.info/tutorials/sphinx/docstring_python.html
+    """
 
-        if 'ErrorCode' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.ErrorCode = json['Body']['Data'][inverterNumber]['ErrorCode']
-        else:
-            self.InverterInfo.ErrorCode = None
+    def __init__(self, host, useHTTPS=False, HTTPtimeout=10, connectTimeout=None, readTimeout=None, poolSize=4, keepAlive=True, parallelInit=False, maxParallelRequests=4, lazy=False, pollingSchedule=None, failureThreshold=3, breakerCooldown=5, maxBreakerCooldown=300, jsonDecoder=None, cacheTTLs=None, metadataCache=None, staleWhileRevalidate=False, maxStaleness=60, history=None):
+
+        #   Everything apart from the connection to the unit.   Shared with AsyncFronius.
+        self._initialiseSettings(host, useHTTPS=useHTTPS, HTTPtimeout=HTTPtimeout, connectTimeout=connectTimeout,
+                                 readTimeout=readTimeout, poolSize=poolSize, maxParallelRequests=maxParallelRequests,
+                                 pollingSchedule=pollingSchedule, failureThreshold=failureThreshold,
+                                 breakerCooldown=breakerCooldown, maxBreakerCooldown=maxBreakerCooldown,
+                                 jsonDecoder=jsonDecoder, cacheTTLs=cacheTTLs, metadataCache=metadataCache,
+                                 history=history)
+
+        #   _flights holds the requests currently in flight so that concurrent reads of stale values share one request.
+        self._flightlock = threading.Lock()
+        self._flights = {}
+
+        #   Stale values can be served while a single background thread fetches the collection again.
+        #   _revalidating holds the collections queued or being fetched.   Nothing is queued once closed.
+        self.staleWhileRevalidate = staleWhileRevalidate
+        self.maxStaleness = maxStaleness
+        self._revalidator = None
+        self._revalidating = set()
+        self._closed = False
+
+        #   Pooled HTTP session.   The Datamanager's embedded web server is slow to accept new connections so each
+        #   instance keeps its connections alive and reuses them rather than opening a new one for every collection.
+        self.keepAlive = keepAlive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=poolSize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if not keepAlive:
+            self.session.headers['Connection'] = 'close'
+
+        #   Populate the initial data in parallel.
+        self.parallelInit = parallelInit
+
+        #   Defer fetching every collection until a property that needs it is read.
+        self.lazy = lazy
 
-        if 'PVPower' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.PVPower = json['Body']['Data'][inverterNumber]['PVPower']
-        else:
-            self.InverterInfo.PVPower = None
 
-        if 'Show' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.Show = json['Body']['Data'][inverterNumber]['Show']
-        else:
-            self.InverterInfo.Show = None
+        #   The Version of the Fronius API as understood and returned by itself.  If it's not version 1 then we need to stop as this code only supports API V1.
+        #   Understanding is that API Version 0 is actually very old and quiote obsolete.   (The API PDF available from Fronius has the API dated at 06 August 2013.)
+        #   Woudl be interesting to understand which units out there are still on API V0 if any. I suspect they all upgrade to the latest version
+        #   With a metadata cache a restart takes all of it from disk without asking the unit.
+        if not self._loadMetadata():
+            self._fetch_APIVersion()
+        if self.APIVersion != 1:
+            raise ValueError('Wrong API Version.  Version {} not supported'.format(self.APIVersion))
 
-        if 'StatusCode' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.StatusCode = json['Body']['Data'][inverterNumber]['StatusCode']
-        else:
-            self.InverterInfo.StatusCode = None
+        #   In lazy mode nothing else is fetched here.   The properties fetch each collection on first use.
+        self.initialstarttime = datetime.datetime.utcnow().timestamp()
+        if self.lazy:
+            self.initialRunTime = None
+            return
+
+        #   Execute each of the data collection methods to populate the initial set of data on first run of class.
+        #   This can take several seconds.   With parallelInit the collections are fetched on a small thread pool
+        #   so the slow requests overlap rather than queue up behind each other.
+        wallclockstart = time.perf_counter()
 
-        if 'UniqueID' in json['Body']['Data'][inverterNumber]:
-            self.InverterInfo.UniqueID = json['Body']['Data'][inverterNumber]['UniqueID']
+        #   Anything already loaded from the metadata cache is skipped.
+        collections = [collection for collection in INITIALCOLLECTIONS if self._pollWait(collection) <= 0]
+        if self.parallelInit:
+            with ThreadPoolExecutor(max_workers=self.maxParallelRequests) as pool:
+                requesttimes = list(pool.map(self._timedRefresh, collections))
         else:
-            self.InverterInfo.UniqueID = None
+            requesttimes = [self._timedRefresh(collection) for collection in collections]
 
+        self.initialRunTime = InitialRunTime(time.perf_counter() - wallclockstart, sum(requesttimes))
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _getLoggerInfo(self):
+    def _loadMetadata(self, liveAPIVersion=None):
+        """
+        Take the API version and the other metadata collections from the metadata cache,  first fetching the API
+        version from the unit if the cache is to be validated against it.
+        :param liveAPIVersion:  GetAPIVersion response already fetched.  Fetched here if needed
+        :return:    True if the API version was loaded,  False if it still has to be fetched
         """
+        if liveAPIVersion is None and self.metadataCache is not None and self.metadataCache.validateAPIVersion:
+            liveAPIVersion = self._fetchDataFromAPI(self._collectionURL('APIVersion'))
+        return FroniusData._loadMetadata(self, liveAPIVersion)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _ensureCurrent(self, collection):
+        """
+        Refresh a collection if it has gone stale or has never been fetched.
+        :param collection:  Name of the collection about to be read from.  See _refreshCollection
         :return:
         """
-        url = "{protocol}://{host}/{baseurl}/GetLoggerInfo.cgi".format(protocol=self.protocol, host=self.host,baseurl=self.BaseURL)
-        json = self._GetJSONData(url)
+        self._readinfo.collection = collection
 
-        if 'CO2Factor' in json['Body']:
-            self.LoggerInfo.C02Factor = json['Body']['LoggerInfo']['CO2Factor']
-        else:
-            self.LoggerInfo.C02Factor = 0
+        ttl = None
+        if self.pollingSchedule is not None:
+            ttl = self.pollingSchedule.interval(self, collection)
+        if self.cache.lookup(collection, ttl):
+            return
 
-        if 'CO2Unit' in json['Body']:
-            self.LoggerInfo.CO2Unit = json['Body']['LoggerInfo']['CO2Unit']
-        else:
-            self.LoggerInfo.CO2Unit = 0
+        #   Serve the stale value and refresh behind the caller's back,  unless it is too old to be any use.
+        if self.staleWhileRevalidate:
+            age = self.cache.age(collection)
+            if ttl is None:
+                ttl = self.cache.ttl(collection)
+            if age is not None and age - ttl <= self.maxStaleness:
+                self._revalidate(collection)
+                return
 
-        if 'CashCurrency' in json['Body']:
-            self.LoggerInfo.CashCurrency = json['Body']['LoggerInfo']['CashCurrency']
-        else:
-            self.LoggerInfo.CashCurrency = 0
+        self._refreshCollection(collection)
 
-        if 'CashFactor' in json['Body']:
-            self.LoggerInfo.CashFactor = json['Body']['LoggerInfo']['CashFactor']
-        else:
-            self.LoggerInfo.CashFactor = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def _revalidate(self, collection):
+        """
+        Queue a background refresh of a collection,  unless one is already queued or running or the instance has been
+        closed.   The stale value is served either way.
+        :param collection:
+        :return:
+        """
+        with self._lock:
+            if self._closed or collection in self._revalidating:
+                return
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fronius-revalidate')
+            self._revalidator.submit(self._revalidateCollection, collection)
+            self._revalidating.add(collection)
 
-        if 'DefaultLanguage' in json['Body']:
-            self.LoggerInfo.DefaultLanguage = json['Body']['LoggerInfo']['DefaultLanguage']
+    #-------------------------------------------------------------------------------------------------------------------
+    def _revalidateCollection(self, collection):
+        """
+        Body of the background refresh.   Nobody is waiting on it so an exception is kept in revalidationErrors,
+        where read() reports it,  rather than raised.
+        :param collection:
+        :return:
+        """
+        try:
+            self._refreshCollection(collection)
+        except Exception as err:
+            with self._lock:
+                self.revalidationErrors[collection] = err
         else:
-           self.LoggerInfo.DefaultLanguage = 0
+            with self._lock:
+                self.revalidationErrors.pop(collection, None)
+        finally:
+            with self._lock:
+                self._revalidating.discard(collection)
 
-        if 'DeliveryFactor' in json['Body']:
-            self.LoggerInfo.DeliveryFactor = json['Body']['LoggerInfo']['DeliveryFactor']
-        else:
-            self.LoggerInfo.DeliveryFactor = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def pollDue(self, collections=None):
+        """
+        Refresh every collection that is due.
+        :param collections:     Defaults to REALTIMECOLLECTIONS
+        :return:    Seconds until the next collection is due
+        """
+        if collections is None:
+            collections = REALTIMECOLLECTIONS
 
-        if 'HWVersion' in json['Body']:
-            self.LoggerInfo.HWVersion = json['Body']['LoggerInfo']['HWVersion']
-        else:
-            self.LoggerInfo.HWVersion = 0
+        for collection in collections:
+            if self._pollWait(collection) <= 0:
+                self._refreshCollection(collection)
 
-        if 'PlatformID' in json['Body']:
-            self.LoggerInfo.PlatformID = json['Body']['LoggerInfo']['PlatformID']
-        else:
-            self.LoggerInfo.PlatformID = 0
+        return max(0, min(self._pollWait(collection) for collection in collections))
 
-        if 'SWVersion' in json['Body']:
-            self.LoggerInfo.SWVersion = json['Body']['LoggerInfo']['SWVersion']
-        else:
-            self.LoggerInfo.SWVersion = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def poll(self, collections=None, stopEvent=None):
+        """
+        Keep the collections current until stopEvent is set,  sleeping until the next one is due.
+        Run it on its own thread and read the properties from anywhere else.
+        :param collections:     Defaults to REALTIMECOLLECTIONS
+        :param stopEvent:       threading.Event.   Without one this runs forever
+        :return:
+        """
+        if stopEvent is None:
+            stopEvent = threading.Event()
+        while not stopEvent.is_set():
+            stopEvent.wait(self.pollDue(collections))
 
-        if 'TimezoneLocation' in json['Body']:
-            self.LoggerInfo.TimezoneLocation = json['Body']['LoggerInfo']['TimezoneLocation']
-        else:
-            self.LoggerInfo.TimezoneLocation = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def _refreshCollection(self, collection):
+        """
+        Fetch a single collection from the Fronius unit by name.
+        :param collection:  InverterInfo | LoggerInfo | LoggerLEDInfo | PowerFlowRealtimeData | MeterRealtimeData |
+                            ActiveDeviceInfo | or any DataCollection of GetInverterRealtimeData
+        :return:    False if the unit could not be reached,  otherwise the result of the parser
+        """
+        if collection == 'InverterInfo':
+            result = self._getInverterinfo()
+        elif collection == 'LoggerInfo':
+            result = self._getLoggerInfo()
+        elif collection == 'LoggerLEDInfo':
+            result = self._getLoggerLEDinfo()
+        elif collection == 'PowerFlowRealtimeData':
+            result = self._getPowerFlowRealtimeData()
+        elif collection == 'MeterRealtimeData':
+            result = self._GetMeterRealtimeData()
+        elif collection == 'ActiveDeviceInfo':
+            result = self._GetActiveDeviceInfo()
+        else:
+            result = self._GetInverterRealtimeData(self.scope, self.DeviceID, collection)
+
+        #   The parser marks the collection as fetched,  see _parseCollection.
+        return result
 
-        if 'TimezoneName' in json['Body']:
-            self.LoggerInfo.TimezoneName = json['Body']['LoggerInfo']['TimezoneName']
-        else:
-            self.LoggerInfo.TimezoneName = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def _timedRefresh(self, collection):
+        """
+        Fetch a single collection and time how long it took.
+        :param collection:  See _refreshCollection
+        :return:    Seconds taken by the request
+        """
+        starttime = time.perf_counter()
+        self._refreshCollection(collection)
+        return time.perf_counter() - starttime
 
-        if 'UTCOffset' in json['Body']:
-            self.LoggerInfo.UTCOffset = json['Body']['LoggerInfo']['UTCOffset']
-        else:
-            self.LoggerInfo.UTCOffset = 0
+    #-------------------------------------------------------------------------------------------------------------------
+    def _fetchDataFromAPI(self, url):
+        """
+        Performs the http query to Fronius unit.
+        Returns a json text strong
 
-        if 'UniqueIDs' in json['Body']:
-            self.LoggerInfo.UniqueID = json['Body']['LoggerInfo']['UniqueID']
-        else:
-            self.LoggerInfo.UniqueID = 0
+        :param url:    The Target URL of the Fronius system.  See STATIC definitions
+        :return:    Return the JSON text block containing queried data
+        """
+        json = None
 
+        #   While the circuit is open the unit is not even tried.   Callers keep the values they already hold.
+        if not self.breaker.allowRequest():
+            return None
+
+        #   Try to retrieve the WEB API response from the Fronius unit and handle common errors
+        #   Whatever goes wrong the request is recorded as a success or a failure.   A half open probe that was neither
+        #   would leave the host's breaker HalfOpen,  rejecting every request from then on.
+        recorded = False
+        try:
+            response = self.session.get(url, timeout = (self.connectTimeout, self.readTimeout))
+            self.breaker.recordResponse(response.status_code)
+            recorded = True
+
+        except requests.exceptions.ConnectTimeout:
+            print("Request Exception Timed Out")
+
+        except requests.exceptions.ReadTimeout:
+            print("Request Exception Read Timed Out")
+
+        except requests.exceptions.ConnectionError:
+            print("Connection Error")
+
+        #   Broken chunked encoding,  redirect loops and the like
+        except requests.exceptions.RequestException as err:
+            print("Request Exception {0}".format(err))
+
+        finally:
+            if not recorded:
+                self.breaker.recordFailure()
+
+        #   If the actual HTTP call works (no hard error exception)
+        #   then check if there's any soft errors returned from the Fronius API.
+        #   Handle any other response other then 200 and 201.
+        #   Generally none of the other errors should show up unless the Fronius Unit has ....
+        #   Done somethign inconsistent.
+
+        #TODO check the errors being raised and make sure they make sense.
+        if recorded:
+            json = self._decodeResponse(response.status_code, response.content, url)
+        return json
 
     #-------------------------------------------------------------------------------------------------------------------
-    def _getLoggerLEDinfo(self):
+    def close(self):
         """
+        Close the pooled connections to the Fronius unit.   Stale values are still served afterwards but no longer
+        refreshed in the background.
         :return:
         """
-        url = "{protocol}://{host}/{baseurl}/GetLoggerLEDInfo.cgi".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL)
-        json = self._GetJSONData(url)
+        with self._lock:
+            self._closed = True
+            if self._revalidator is not None:
+                self._revalidator.shutdown(wait=False)
+        self.session.close()
 
-        if self.UnitStatus.code == 0:
-            if 'PowerLED' in json['Body']['Data']:
-                self.InverterStatusLEDs.powerLED.Color = json['Body']['Data']['PowerLED']['Color']
-                self.InverterStatusLEDs.powerLED.State = json['Body']['Data']['PowerLED']['State']
-                self.InverterStatusLEDs.powerLED.lastupdated = datetime.datetime.utcnow().timestamp()
-            else:
-                self.InverterStatusLEDs.powerLED.Color = 0
-                self.InverterStatusLEDs.powerLED.State = 0
-                self.InverterStatusLEDs.powerLED.lastupdated = False
-
-            if 'SolarNetLED' in json['Body']['Data']:
-                self.InverterStatusLEDs.SolarNetLED.Color = json['Body']['Data']['SolarNetLED']['Color']
-                self.InverterStatusLEDs.SolarNetLED.State = json['Body']['Data']['SolarNetLED']['State']
-                self.InverterStatusLEDs.SolarNetLED.lastupdated = datetime.datetime.utcnow().timestamp()
-            else:
-                self.InverterStatusLEDs.SolarNetLED.Color = 0
-                self.InverterStatusLEDs.SolarNetLED.State = 0
-                self.InverterStatusLEDs.SolarNetLED.lastupdated = False
-
-            if 'SolarWebLED' in json['Body']['Data']:
-                self.InverterStatusLEDs.SolarWebLED.Color = json['Body']['Data']['SolarWebLED']['Color']
-                self.InverterStatusLEDs.SolarWebLED.State = json['Body']['Data']['SolarWebLED']['State']
-                self.InverterStatusLEDs.SolarWebLED.lastupdated = datetime.datetime.utcnow().timestamp()
-            else:
-                self.InverterStatusLEDs.SolarWebLED.Color = 0
-                self.InverterStatusLEDs.SolarWebLED.State = 0
-                self.InverterStatusLEDs.SolarWebLED.lastupdated = False
-
-            if 'WLANLED' in json['Body']['Data']:
-                self.InverterStatusLEDs.WLANLED.Color = json['Body']['Data']['WLANLED']['Color']
-                self.InverterStatusLEDs.WLANLED.State = json['Body']['Data']['WLANLED']['State']
-                self.InverterStatusLEDs.WLANLED.lastupdated = datetime.datetime.utcnow().timestamp()
-            else:
-                self.InverterStatusLEDs.WLANLED.Color = 0
-                self.InverterStatusLEDs.WLANLED.State = 0
-                self.InverterStatusLEDs.WLANLED.lastupdated = False
+    #-------------------------------------------------------------------------------------------------------------------
+    def _fetch_APIVersion(self):
+        """
+        The API Version JSON does not contain a standard status header etc like the other urls.   This has to be handled differently and seperatly.
+        :return:
+        """
 
-        else:
-            #   If error code returned then just populate the data with 0 and mark as not up to date
-            # TODO Proper Error Handling here.
-                self.InverterStatusLEDs.powerLED.Color = 0
-                self.InverterStatusLEDs.powerLED.State = 0
-                self.InverterStatusLEDs.powerLED.lastupdated = False
-                self.InverterStatusLEDs.SolarNetLED.Color = 0
-                self.InverterStatusLEDs.SolarNetLED.State = 0
-                self.InverterStatusLEDs.SolarNetLED.lastupdated = False
-                self.InverterStatusLEDs.SolarWebLED.Color = 0
-                self.InverterStatusLEDs.SolarWebLED.State = 0
-                self.InverterStatusLEDs.SolarWebLED.lastupdated = False
-                self.InverterStatusLEDs.WLANLED.Color = 0
-                self.InverterStatusLEDs.WLANLED.State = 0
-                self.InverterStatusLEDs.WLANLED.lastupdated = False
+        # TODO check the possible return and error cases here and plan for them.
+        # What happens when the expected results aren't returned?
 
+        url = self._collectionURL('APIVersion')
+        json = self._fetchDataFromAPI(url)
+        if json is None:
+            raise ValueError('[!] Unable to contact Fronius unit at {0}'.format(self.host))
+        self._parseAPIVersion(json)
+        if self.metadataCache is not None:
+            self.metadataCache.store(self.host, 'APIVersion', json)
+
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _GetJSONData(self,url):
+        """
+        Extract the JSON Body and Common Response Header from the API response and begin processing it.
+        :param url:
+        :return:    None if the unit could not be reached or its circuit breaker is open
+        """
+        json = self._fetchDataFromAPI(url)
+        if json is not None:
+            self._extractCRHData(json)
+        return json
 
 
+    #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
+    def _getInverterinfo(self):
+        """
+        Note:  At the moment this only supports the first (1) inverter in the system.   I need to obtain access to a ganged inverter array before I can properly test this code with multiple inverters.
+        :return:
+        """
+        url = self._collectionURL('InverterInfo')
+        json = self._GetJSONData(url)
+        if json is None:
+            return False
+        return self._parseCollection('InverterInfo', json, url)
+
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
+    def _getLoggerInfo(self):
+        """
+        :return:
+        """
+        url = self._collectionURL('LoggerInfo')
+        json = self._GetJSONData(url)
+        if json is None:
+            return False
+        return self._parseCollection('LoggerInfo', json, url)
+
 
+    #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
+    def _getLoggerLEDinfo(self):
+        """
+        :return:
+        """
+        url = self._collectionURL('LoggerLEDInfo')
+        json = self._GetJSONData(url)
+        if json is None:
+            return False
+        return self._parseCollection('LoggerLEDInfo', json, url)
 
 
     #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
     def _GetInverterRealtimeData(self, Scope = None , DeviceID = 0, DataCollection = None):
         """
         :param Scope:
@@ -1357,391 +2427,29 @@ class Fronius:
             DeviceID = 0
             DataCollection = 'CumulationInverterData'
 
-        url = "{protocol}://{host}/{baseurl}/GetInverterRealtimeData.cgi?Scope={Scope}&DeviceID={DeviceID}&DataCollection={DataCollection}".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope=Scope, DeviceID=DeviceID, DataCollection=DataCollection)
+        url = self._collectionURL(DataCollection, Scope, DeviceID)
         json = self._GetJSONData(url)
- 
-        if DataCollection == 'CommonInverterData' and self.UnitStatus.code == 0:
-            """
-            This gets busy:    If the inverter slows down for the day it will stop collecting data and thus stop reporting the data. 
-            Only fields with actual data in them will get returned.  Thus every field needs to be tested with a try.             
-            """
-            try:
-                if 'PAC' in  json['Body']['Data']:
-                    self.CommonInverterValues.PAC.Value = json['Body']['Data']['PAC']['Value']
-                    self.CommonInverterValues.PAC.Unit = json['Body']['Data']['PAC']['Unit']
-                    self.CommonInverterValues.PAC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.PAC.Value = 0
-                    self.CommonInverterValues.PAC.Unit = 0
-                    self.CommonInverterValues.PAC.lastupdated = None
-
-                if 'SAC' in  json['Body']['Data']:
-                    self.CommonInverterValues.SAC.Value = json['Body']['Data']['SAC']['Value']
-                    self.CommonInverterValues.SAC.Unit = json['Body']['Data']['SAC']['Unit']
-                    self.CommonInverterValues.SAC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.SAC.Value = 0
-                    self.CommonInverterValues.SAC.Unit = 0
-                    self.CommonInverterValues.SAC.lastupdated = None
-
-                if 'IAC' in  json['Body']['Data']:
-                    self.CommonInverterValues.IAC.Value = json['Body']['Data']['IAC']['Value']
-                    self.CommonInverterValues.IAC.Unit = json['Body']['Data']['IAC']['Unit']
-                    self.CommonInverterValues.IAC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.IAC.Value = 0
-                    self.CommonInverterValues.IAC.Unit = 0
-                    self.CommonInverterValues.IAC.lastupdated = None
-
-                if 'UAC' in  json['Body']['Data']:
-                    self.CommonInverterValues.VAC.Value = json['Body']['Data']['UAC']['Value']
-                    self.CommonInverterValues.VAC.Unit = json['Body']['Data']['UAC']['Unit']
-                    self.CommonInverterValues.VAC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.VAC.Value = 0
-                    self.CommonInverterValues.VAC.Unit = 0
-                    self.CommonInverterValues.VAC.lastupdated = None
-
-                if 'IDC' in  json['Body']['Data']:
-                    self.CommonInverterValues.IDC.Value = json['Body']['Data']['IDC']['Value']
-                    self.CommonInverterValues.IDC.Unit = json['Body']['Data']['IDC']['Unit']
-                    self.CommonInverterValues.IDC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.IDC.Value = 0
-                    self.CommonInverterValues.IDC.Unit = 0
-                    self.CommonInverterValues.IDC.lastupdated = None
-
-                if 'FAC' in  json['Body']['Data']:
-                    self.CommonInverterValues.FAC.Value = json['Body']['Data']['FAC']['Value']
-                    self.CommonInverterValues.FAC.Unit = json['Body']['Data']['FAC']['Unit']
-                    self.CommonInverterValues.FAC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.FAC.Value = 0
-                    self.CommonInverterValues.FAC.Unit = 0
-                    self.CommonInverterValues.FAC.lastupdated = None
-
-                if 'UDC' in  json['Body']['Data']:
-                    self.CommonInverterValues.VDC.Value = json['Body']['Data']['UDC']['Value']
-                    self.CommonInverterValues.VDC.Unit = json['Body']['Data']['UDC']['Unit']
-                    self.CommonInverterValues.VDC.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.VDC.Value = 0
-                    self.CommonInverterValues.VDC.Unit = 0
-                    self.CommonInverterValues.VDC.lastupdated = None
-
-                if 'DAY_ENERGY' in  json['Body']['Data']:
-                    self.CommonInverterValues.Day_Energy.Value = json['Body']['Data']['DAY_ENERGY']['Value']
-                    self.CommonInverterValues.Day_Energy.Unit = json['Body']['Data']['DAY_ENERGY']['Unit']
-                    self.CommonInverterValues.Day_Energy.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.Day_Energy.Value = 0
-                    self.CommonInverterValues.Day_Energy.Unit = 0
-                    self.CommonInverterValues.Day_Energy.lastupdated = None
-
-                if 'YEAR_ENERGY' in  json['Body']['Data']:
-                    self.CommonInverterValues.Year_Energy.Value = json['Body']['Data']['YEAR_ENERGY']['Value']
-                    self.CommonInverterValues.Year_Energy.Unit = json['Body']['Data']['YEAR_ENERGY']['Unit']
-                    self.CommonInverterValues.Year_Energy.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.Year_Energy.Value = 0
-                    self.CommonInverterValues.Year_Energy.Unit = 0
-                    self.CommonInverterValues.Year_Energy.lastupdated = None
-
-                if 'TOTAL_ENERGY' in  json['Body']['Data']:
-                    self.CommonInverterValues.Total_Energy.Value = json['Body']['Data']['TOTAL_ENERGY']['Value']
-                    self.CommonInverterValues.Total_Energy.Unit = json['Body']['Data']['TOTAL_ENERGY']['Unit']
-                    self.CommonInverterValues.Total_Energy.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.CommonInverterValues.Total_Energy.Value = 0
-                    self.CommonInverterValues.Total_Energy.Unit = 0
-                    self.CommonInverterValues.Total_Energy.lastupdated = None
-
-                if 'DeviceStatus' in  json['Body']['Data']:
-                    self.CommonInverterValues.DeviceStatus.ErrorCode = json['Body']['Data']['DeviceStatus']['ErrorCode']
-                    self.CommonInverterValues.DeviceStatus.LEDColor = json['Body']['Data']['DeviceStatus']['LEDColor']
-                    self.CommonInverterValues.DeviceStatus.LEDState = json['Body']['Data']['DeviceStatus']['LEDState']
-                    self.CommonInverterValues.DeviceStatus.MgmtTimerRemainingTime = json['Body']['Data']['DeviceStatus']['MgmtTimerRemainingTime']
-                    self.CommonInverterValues.DeviceStatus.StateToReset = json['Body']['Data']['DeviceStatus']['StateToReset']
-                    self.CommonInverterValues.DeviceStatus.StatusCode = json['Body']['Data']['DeviceStatus']['StatusCode']
-                    self.CommonInverterValues.DeviceStatus.lastupdated = datetime.datetime.utcnow().timestamp()
-
-            except KeyError:
-                raise ValueError('[{url}] Expected JSON KEY not available.  No Data Returned:'.format(url = url))
-            except:
-                raise ValueError('Something went wrong - _GetInverterRealtimeData')
-
-
-        elif DataCollection == '3PInverterData' and self.UnitStatus.code == 0:
-            try:
-                if 'IAC_L1' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.IAC_L1.Value = json['Body']['Data']['IAC_L1']['Value']
-                    self.ThreePhaseinverterValues.IAC_L1.Unit = json['Body']['Data']['IAC_L1']['Unit']
-                    self.ThreePhaseinverterValues.IAC_L1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.IAC_L1.Value = 0
-                    self.ThreePhaseinverterValues.IAC_L1.Unit = 0
-                    self.ThreePhaseinverterValues.IAC_L1.lastupdated = None
-
-                if 'IAC_L2' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.IAC_L2.Value = json['Body']['Data']['IAC_L2']['Value']
-                    self.ThreePhaseinverterValues.IAC_L2.Unit = json['Body']['Data']['IAC_L2']['Unit']
-                    self.ThreePhaseinverterValues.IAC_L2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.IAC_L2.Value = 0
-                    self.ThreePhaseinverterValues.IAC_L2.Unit = 0
-                    self.ThreePhaseinverterValues.IAC_L2.lastupdated = None
-
-                if 'IAC_L3' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.IAC_L3.Value = json['Body']['Data']['IAC_L3']['Value']
-                    self.ThreePhaseinverterValues.IAC_L3.Unit = json['Body']['Data']['IAC_L3']['Unit']
-                    self.ThreePhaseinverterValues.IAC_L3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.IAC_L3.Value = 0
-                    self.ThreePhaseinverterValues.IAC_L3.Unit = 0
-                    self.ThreePhaseinverterValues.IAC_L3.lastupdated = None
-
-                if 'UAC_L1' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.VAC_PH1.Value = json['Body']['Data']['UAC_L1']['Value']
-                    self.ThreePhaseinverterValues.VAC_PH1.Unit = json['Body']['Data']['UAC_L1']['Unit']
-                    self.ThreePhaseinverterValues.VAC_PH1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.VAC_PH1.Value = 0
-                    self.ThreePhaseinverterValues.VAC_PH1.Unit = 0
-                    self.ThreePhaseinverterValues.VAC_PH1.lastupdated = None
-
-                if 'UAC_L2' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.VAC_PH2.Value = json['Body']['Data']['UAC_L2']['Value']
-                    self.ThreePhaseinverterValues.VAC_PH2.Unit = json['Body']['Data']['UAC_L2']['Unit']
-                    self.ThreePhaseinverterValues.VAC_PH2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.VAC_PH2.Value = 0
-                    self.ThreePhaseinverterValues.VAC_PH2.Unit = 0
-                    self.ThreePhaseinverterValues.VAC_PH2.lastupdated = None
-
-                if 'UAC_L3' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.VAC_PH3.Value = json['Body']['Data']['UAC_L3']['Value']
-                    self.ThreePhaseinverterValues.VAC_PH3.Unit = json['Body']['Data']['UAC_L3']['Unit']
-                    self.ThreePhaseinverterValues.VAC_PH3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.VAC_PH3.Value = 0
-                    self.ThreePhaseinverterValues.VAC_PH3.Unit = 0
-                    self.ThreePhaseinverterValues.VAC_PH3.lastupdated = None
-
-                if 'T_Ambient' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.T_Ambient.Value = json['Body']['Data']['T_Ambient']['Value']
-                    self.ThreePhaseinverterValues.T_Ambient.Unit = json['Body']['Data']['T_Ambient']['Unit']
-                    self.ThreePhaseinverterValues.T_Ambient.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.T_Ambient.Value = 0
-                    self.ThreePhaseinverterValues.T_Ambient.Unit = 0
-                    self.ThreePhaseinverterValues.T_Ambient.lastupdated = None
-
-                if 'Rotation_Speed_Fan_FR' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Value = json['Body']['Data']['Rotation_Speed_Fan_FR']['Value']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Unit = json['Body']['Data']['Rotation_Speed_Fan_FR']['Unit']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Value = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.Unit = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FR.lastupdated = None
-
-                if 'Rotation_Speed_Fan_FL' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Value = json['Body']['Data']['Rotation_Speed_Fan_FL']['Value']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Unit = json['Body']['Data']['Rotation_Speed_Fan_FL']['Unit']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Value = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.Unit = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_FL.lastupdated = None
-
-                if 'Rotation_Speed_Fan_BR' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Value = json['Body']['Data']['Rotation_Speed_Fan_BR']['Value']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Unit = json['Body']['Data']['Rotation_Speed_Fan_BR']['Unit']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Value = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.Unit = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BR.lastupdated = None
-
-                if 'Rotation_Speed_Fan_BL' in  json['Body']['Data']:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Value = json['Body']['Data']['Rotation_Speed_Fan_BL']['Value']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Unit = json['Body']['Data']['Rotation_Speed_Fan_BL']['Unit']
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Value = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.Unit = 0
-                    self.ThreePhaseinverterValues.Rotation_Speed_Fan_BL.lastupdated = None
-            except KeyError:
-                raise ValueError('[{url}] Expected JSON KEY not available.  No Data Returned:'.format(url = url))
-            except:
-                raise ValueError('Something went wrong - _GetInverterRealtimeData')
-
-        elif DataCollection == 'MinMaxInverterData' and self.UnitStatus.code == 0:
-            #   TODO :  Need to obtain an inverter that returns MinMax data
-            #   The following section at least allows the code to run.  Only with access to an inverter that spits out minmax data
-            #   WilL I be able to properly test it and make it ACTUALLYT good code.
-            #   The following is VERY POSITYIVLY Ask permission Later programming.
-            #   Can't really fix this without access to an invertter that does min max data.
-            try:
-                print("trying")
-                self.MinMaxInverterDatavalues.Day_PMAX.Value = json['Body']['Data']['DAY_PMAX']['Value']
-                self.MinMaxInverterDatavalues.Day_PMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Day_VACMAX.Value = json['Body']['Data']['DAY_UACMAX']['Value']
-                self.MinMaxInverterDatavalues.Day_VACMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Day_VACMNIN.Value = json['Body']['Data']['DAY_UACMNIN']['Value']
-                self.MinMaxInverterDatavalues.Day_VACMNIN.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Day_VDCMax.Value = json['Body']['Data']['DAY_UDCMax']['Value']
-                self.MinMaxInverterDatavalues.Day_VDCMax.lastupdated = datetime.datetime.utcnow().timestamp()
-
-                self.MinMaxInverterDatavalues.Year_PMAX.Value = json['Body']['Data']['YEAR_PMAX']['Value']
-                self.MinMaxInverterDatavalues.Year_PMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Year_VACMAX.Value = json['Body']['Data']['YEAR_UACMAX']['Value']
-                self.MinMaxInverterDatavalues.Year_VACMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Year_VACMNIN.Value = json['Body']['Data']['YEAR_UACMNIN']['Value']
-                self.MinMaxInverterDatavalues.Year_VACMNIN.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Year_VDCMax.Value = json['Body']['Data']['YEAR_UDCMax']['Value']
-                self.MinMaxInverterDatavalues.Year_VDCMax.lastupdated = datetime.datetime.utcnow().timestamp()
-
-                self.MinMaxInverterDatavalues.Total_PMAX.Value = json['Body']['Data']['TOTAL_PMAX']['Value']
-                self.MinMaxInverterDatavalues.Total_PMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Total_VACMAX.Value = json['Body']['Data']['TOTAL_UACMAX']['Value']
-                self.MinMaxInverterDatavalues.Total_VACMAX.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Total_VACMNIN.Value = json['Body']['Data']['TOTAL_UACMNIN']['Value']
-                self.MinMaxInverterDatavalues.Total_VACMNIN.lastupdated = datetime.datetime.utcnow().timestamp()
-                self.MinMaxInverterDatavalues.Total_VDCMax.Value = json['Body']['Data']['TOTAL_UDCMax']['Value']
-                self.MinMaxInverterDatavalues.Total_VDCMax.lastupdated = datetime.datetime.utcnow().timestamp()
-
-            except:
-                #Hack to make things work for the moment.  Need to really work on this better.
-                #   Yes this is a broad exception string but.............
-                self.MinMaxInverterDatavalues.Day_PMAX.Value = 0
-                self.MinMaxInverterDatavalues.Day_PMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Day_VACMAX.Value = 0
-                self.MinMaxInverterDatavalues.Day_VACMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Day_VACMNIN.Value = 0
-                self.MinMaxInverterDatavalues.Day_VACMNIN.lastupdated = None
-                self.MinMaxInverterDatavalues.Day_VDCMax.Value = 0
-                self.MinMaxInverterDatavalues.Day_VDCMax.lastupdated = None
-
-                self.MinMaxInverterDatavalues.Year_PMAX.Value = 0
-                self.MinMaxInverterDatavalues.Year_PMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Year_VACMNIN.Value = 0
-                self.MinMaxInverterDatavalues.Year_VACMNIN.lastupdated = None
-                self.MinMaxInverterDatavalues.Year_VACMAX.Value = 0
-                self.MinMaxInverterDatavalues.Year_VACMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Year_VDCMax.Value = 0
-                self.MinMaxInverterDatavalues.Year_VDCMax.lastupdated = None
-                #
-                self.MinMaxInverterDatavalues.Total_PMAX.Value = 0
-                self.MinMaxInverterDatavalues.Total_PMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Total_VACMAX.Value = 0
-                self.MinMaxInverterDatavalues.Total_VACMAX.lastupdated = None
-                self.MinMaxInverterDatavalues.Total_VACMNIN.Value = 0
-                self.MinMaxInverterDatavalues.Total_VACMNIN.lastupdated = None
-                self.MinMaxInverterDatavalues.Total_VDCMax.Value = 0
-                self.MinMaxInverterDatavalues.Total_VDCMax.lastupdated = None
-
-        else:
-            self.MinMaxInverterDatavalues.Day_PMAX.Value = 0
-            self.MinMaxInverterDatavalues.Day_PMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Day_VACMAX.Value = 0
-            self.MinMaxInverterDatavalues.Day_VACMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Day_VACMNIN.Value = 0
-            self.MinMaxInverterDatavalues.Day_VACMNIN.lastupdated = None
-            self.MinMaxInverterDatavalues.Day_VDCMax.Value = 0
-            self.MinMaxInverterDatavalues.Day_VDCMax.lastupdated = None
-
-            self.MinMaxInverterDatavalues.Year_PMAX.Value = 0
-            self.MinMaxInverterDatavalues.Year_PMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Year_VACMNIN.Value = 0
-            self.MinMaxInverterDatavalues.Year_VACMNIN.lastupdated = None
-            self.MinMaxInverterDatavalues.Year_VACMAX.Value = 0
-            self.MinMaxInverterDatavalues.Year_VACMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Year_VDCMax.Value = 0
-            self.MinMaxInverterDatavalues.Year_VDCMax.lastupdated = None
-            #
-            self.MinMaxInverterDatavalues.Total_PMAX.Value = 0
-            self.MinMaxInverterDatavalues.Total_PMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Total_VACMAX.Value = 0
-            self.MinMaxInverterDatavalues.Total_VACMAX.lastupdated = None
-            self.MinMaxInverterDatavalues.Total_VACMNIN.Value = 0
-            self.MinMaxInverterDatavalues.Total_VACMNIN.lastupdated = None
-            self.MinMaxInverterDatavalues.Total_VDCMax.Value = 0
-            self.MinMaxInverterDatavalues.Total_VDCMax.lastupdated = None
-        return True
+        if json is None:
+            return False
+        return self._parseCollection(DataCollection, json, url)
 
 
     #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
     def _getPowerFlowRealtimeData(self):
         """
 
         :return:
         """
-        url = "{protocol}://{host}/{baseurl}/GetPowerFlowRealtimeData.fcgi".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL)
+        url = self._collectionURL('PowerFlowRealtimeData')
         json = self._GetJSONData(url)
+        if json is None:
+            return False
+        return self._parseCollection('PowerFlowRealtimeData', json, url)
 
-        if self.UnitStatus.code == 0:
-            if 'BatteryStandby' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.BatteryStandby = json['Body']['Data']['Site']['BatteryStandby']
-            else:
-                self.PowerFlowRealtimeSite.BatteryStandby = False
-
-            if 'E_Day' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Energy_Day = json['Body']['Data']['Site']['E_Day']
-            else:
-                self.PowerFlowRealtimeSite.Energy_Day = False
-
-            if 'E_Total' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Energy_Total = json['Body']['Data']['Site']['E_Total']
-            else:
-                self.PowerFlowRealtimeSite.Energy_Total = False
-
-            if 'E_Year' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Energy_Year = json['Body']['Data']['Site']['E_Year']
-            else:
-                self.PowerFlowRealtimeSite.Energy_Year = False
-
-            if 'Meter_Location' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Meter_Location = json['Body']['Data']['Site']['Meter_Location']
-            else:
-                self.PowerFlowRealtimeSite.Meter_Location = False
-
-            if 'Mode' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Mode = json['Body']['Data']['Site']['Mode']
-            else:
-                self.PowerFlowRealtimeSite.Mode = False
-
-            if 'P_Akku' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Power_Akku = json['Body']['Data']['Site']['P_Akku']
-            else:
-                self.PowerFlowRealtimeSite.Power_Akku = False
-
-            if 'P_Grid' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Power_Grid = json['Body']['Data']['Site']['P_Grid']
-            else:
-                self.PowerFlowRealtimeSite.Power_Grid = False
-
-            if 'P_Load' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Power_Load = json['Body']['Data']['Site']['P_Load']
-            else:
-                self.PowerFlowRealtimeSite.Power_Load = False
-
-            if 'P_PV' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Power_PV = json['Body']['Data']['Site']['P_PV']
-            else:
-                self.PowerFlowRealtimeSite.Power_PV = False
-
-            if 'rel_Autonomy' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Rel_Autonomy = json['Body']['Data']['Site']['rel_Autonomy']
-            else:
-                self.PowerFlowRealtimeSite.Rel_Autonomy = False
-
-            if 'rel_SelfConsumption' in json['Body']['Data']['Site']:
-                self.PowerFlowRealtimeSite.Rel_SelfConsumption  = json['Body']['Data']['Site']['rel_SelfConsumption']
-            else:
-                self.PowerFlowRealtimeSite.Rel_SelfConsumption = False
 
     #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
     def _GetMeterRealtimeData(self, Scope = None, DeviceID = None):
         """
 
@@ -1755,305 +2463,12 @@ class Fronius:
         if DeviceID is None:
             DeviceID = self.DeviceID
 
-        url = "{protocol}://{host}/{baseurl}/GetMeterRealtimeData.cgi?Scope={Scope}&DeviceID={DeviceID}".format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope=Scope, DeviceID=DeviceID)
+        url = self._collectionURL('MeterRealtimeData', Scope, DeviceID)
         json = self._GetJSONData(url)
+        if json is None:
+            return False
+        return self._parseCollection('MeterRealtimeData', json, url)
 
-        # print(self.UnitStatus.code)
-        #
-        # print(url)
-        # print(json)
-
-
-        #   Lots of Ifs here for checking if the data actually exists within the JSON.
-        #   Messy but Fronius have some inconsistencies on which pieces of data re returned at what times of operation.
-        #   Sometimes if a Piece of data isnt being produced by the uinit then it wont be supplied in the data.
-        #   Easiest just to create a giant mess of aa check for each piece expected.
-        if self.UnitStatus.code == 0:
-            try:
-                if 'Details' in json['Body']['Data']:
-                    if 'Manufacturer' in  json['Body']['Data']['Details']:
-                        self.MeterRealTimeData.Manufacturer.Value = json['Body']['Data']['Details']['Manufacturer']
-                        self.MeterRealTimeData.Manufacturer.lastupdated = datetime.datetime.utcnow().timestamp()
-                    else:
-                        self.MeterRealTimeData.Manufacturer.Value = 0
-                        self.MeterRealTimeData.Manufacturer.lastupdated = None
-
-                    if 'Model' in    json['Body']['Data']['Details']:
-                        self.MeterRealTimeData.Model.Value = json['Body']['Data']['Details']['Model']
-                        self.MeterRealTimeData.Model.lastupdated = datetime.datetime.utcnow().timestamp()
-                    else:
-                        self.MeterRealTimeData.Model.Value = 0
-                        self.MeterRealTimeData.Model.lastupdated = None
-
-                    if 'Serial' in json['Body']['Data']['Details']:
-                        self.MeterRealTimeData.Serial.Value = json['Body']['Data']['Details']['Serial']
-                        self.MeterRealTimeData.Serial.lastupdated = datetime.datetime.utcnow().timestamp()
-                    else:
-                        self.MeterRealTimeData.Serial.Value = 0
-                        self.MeterRealTimeData.Serial.lastupdated = None
-                else:
-                    self.MeterRealTimeData.Manufacturer.Value = 0
-                    self.MeterRealTimeData.Manufacturer.lastupdated = None
-                    self.MeterRealTimeData.Model.Value = 0
-                    self.MeterRealTimeData.Model.lastupdated = None
-                    self.MeterRealTimeData.Serial.Value = 0
-                    self.MeterRealTimeData.Serial.lastupdated = None
-
-                if 'Current_AC_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.Current_AC_Phase_1.Value = json['Body']['Data']['Current_AC_Phase_1']
-                    self.MeterRealTimeData.Current_AC_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Current_AC_Phase_1.Value = 0
-                    self.MeterRealTimeData.Current_AC_Phase_1.lastupdated = None
-
-                if 'Current_AC_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.Current_AC_Phase_2.Value = json['Body']['Data']['Current_AC_Phase_2']
-                    self.MeterRealTimeData.Current_AC_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Current_AC_Phase_2.Value = 0
-                    self.MeterRealTimeData.Current_AC_Phase_2.lastupdated = None
-
-                if 'Current_AC_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.Current_AC_Phase_3.Value = json['Body']['Data']['Current_AC_Phase_3']
-                    self.MeterRealTimeData.Current_AC_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Current_AC_Phase_3.Value = 0
-                    self.MeterRealTimeData.Current_AC_Phase_3.lastupdated = None
-
-                if 'Enable' in json['Body']['Data']:
-                    self.MeterRealTimeData.Enable.Value = json['Body']['Data']['Enable']
-                    self.MeterRealTimeData.Enable.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Enable.Value = 0
-                    self.MeterRealTimeData.Enable.lastupdated = None
-
-                if 'EnergyReactive_VArAC_Sum_Consumed' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.Value = json['Body']['Data']['EnergyReactive_VArAC_Sum_Consumed']
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.Value = 0
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Consumed.lastupdated = None
-
-                if 'EnergyReactive_VArAC_Sum_Produced' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.Value = json['Body']['Data']['EnergyReactive_VArAC_Sum_Produced']
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.Value = 0
-                    self.MeterRealTimeData.EnergyReactive_VArAC_Sum_Produced.lastupdated = None
-
-                if 'EnergyReal_WAC_Minus_Absolute' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.Value = json['Body']['Data']['EnergyReal_WAC_Minus_Absolute']
-                    self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.Value = 0
-                    self.MeterRealTimeData.EnergyReal_WAC_Minus_Absolute.lastupdated = None
-
-                if 'EnergyReal_WAC_Plus_Absolute' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.Value = json['Body']['Data']['EnergyReal_WAC_Plus_Absolute']
-                    self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.Value = 0
-                    self.MeterRealTimeData.EnergyReal_WAC_Plus_Absolute.lastupdated = None
-
-                if 'EnergyReal_WAC_Sum_Consumed' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.Value = json['Body']['Data']['EnergyReal_WAC_Sum_Consumed']
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.Value = 0
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Consumed.lastupdated = None
-
-                if 'EnergyReal_WAC_Sum_Produced' in json['Body']['Data']:
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.Value = json['Body']['Data']['EnergyReal_WAC_Sum_Produced']
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.Value = 0
-                    self.MeterRealTimeData.EnergyReal_WAC_Sum_Produced.lastupdated = None
-
-                if 'Frequency_Phase_Average' in json['Body']['Data']:
-                    self.MeterRealTimeData.Frequency_Phase_Average.Value = json['Body']['Data']['Frequency_Phase_Average']
-                    self.MeterRealTimeData.Frequency_Phase_Average.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Frequency_Phase_Average.Value = 0
-                    self.MeterRealTimeData.Frequency_Phase_Average.lastupdated = None
-
-                if 'Meter_Location_Current' in json['Body']['Data']:
-                    self.MeterRealTimeData.Meter_Location_Current.Value = json['Body']['Data']['Meter_Location_Current']
-                    self.MeterRealTimeData.Meter_Location_Current.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Meter_Location_Current.Value = 0
-                    self.MeterRealTimeData.Meter_Location_Current.lastupdated = None
-
-                if  'PowerApparent_S_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_1.Value = json['Body']['Data']['PowerApparent_S_Phase_1']
-                    self.MeterRealTimeData.PowerApparent_S_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_1.Value = 0
-                    self.MeterRealTimeData.PowerApparent_S_Phase_1.lastupdated = None
-
-                if  'PowerApparent_S_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_2.Value = json['Body']['Data']['PowerApparent_S_Phase_2']
-                    self.MeterRealTimeData.PowerApparent_S_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_2.Value = 0
-                    self.MeterRealTimeData.PowerApparent_S_Phase_2.lastupdated = None
-
-                if  'PowerApparent_S_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_3.Value = json['Body']['Data']['PowerApparent_S_Phase_3']
-                    self.MeterRealTimeData.PowerApparent_S_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerApparent_S_Phase_3.Value = 0
-                    self.MeterRealTimeData.PowerApparent_S_Phase_3.lastupdated = None
-
-                if 'PowerApparent_S_Sum' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerApparent_S_Sum.Value = json['Body']['Data']['PowerApparent_S_Sum']
-                    self.MeterRealTimeData.PowerApparent_S_Sum.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerApparent_S_Sum.Value = 0
-                    self.MeterRealTimeData.PowerApparent_S_Sum.lastupdated = None
-
-                if 'PowerFactor_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerFactor_Phase_1.Value = json['Body']['Data']['PowerFactor_Phase_1']
-                    self.MeterRealTimeData.PowerFactor_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerFactor_Phase_1.Value = 0
-                    self.MeterRealTimeData.PowerFactor_Phase_1.lastupdated = None
-
-                if 'PowerFactor_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerFactor_Phase_2.Value = json['Body']['Data']['PowerFactor_Phase_2']
-                    self.MeterRealTimeData.PowerFactor_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerFactor_Phase_2.Value = 0
-                    self.MeterRealTimeData.PowerFactor_Phase_2.lastupdated = None
-
-                if 'PowerFactor_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerFactor_Phase_3.Value = json['Body']['Data']['PowerFactor_Phase_3']
-                    self.MeterRealTimeData.PowerFactor_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerFactor_Phase_3.Value = 0
-                    self.MeterRealTimeData.PowerFactor_Phase_3.lastupdated = None
-
-                if 'PowerFactor_Sum' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerFactor_Sum.Value = json['Body']['Data']['PowerFactor_Sum']
-                    self.MeterRealTimeData.PowerFactor_Sum.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerFactor_Sum.Value = 0
-                    self.MeterRealTimeData.PowerFactor_Sum.lastupdated = None
-
-                if 'PowerReactive_Q_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_1.Value = json['Body']['Data']['PowerReactive_Q_Phase_1']
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_1.Value = 0
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_1.lastupdated = None
-
-                if 'PowerReactive_Q_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_2.Value = json['Body']['Data']['PowerReactive_Q_Phase_2']
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_2.Value = 0
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_2.lastupdated = None
-
-                if 'PowerReactive_Q_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_3.Value = json['Body']['Data']['PowerReactive_Q_Phase_3']
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_3.Value = 0
-                    self.MeterRealTimeData.PowerReactive_Q_Phase_3.lastupdated = None
-
-                if 'PowerReactive_Q_Sum' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReactive_Q_Sum.Value = json['Body']['Data']['PowerReactive_Q_Sum']
-                    self.MeterRealTimeData.PowerReactive_Q_Sum.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReactive_Q_Sum.Value = 0
-                    self.MeterRealTimeData.PowerReactive_Q_Sum.lastupdated = None
-
-                if 'PowerReal_P_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReal_P_Phase_1.Value = json['Body']['Data']['PowerReal_P_Phase_1']
-                    self.MeterRealTimeData.PowerReal_P_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReal_P_Phase_1.Value = 0
-                    self.MeterRealTimeData.PowerReal_P_Phase_1.lastupdated = None
-
-                if 'PowerReal_P_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReal_P_Phase_2.Value = json['Body']['Data']['PowerReal_P_Phase_2']
-                    self.MeterRealTimeData.PowerReal_P_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReal_P_Phase_2.Value = 0
-                    self.MeterRealTimeData.PowerReal_P_Phase_2.lastupdated = None
-
-                if 'PowerReal_P_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReal_P_Phase_3.Value = json['Body']['Data']['PowerReal_P_Phase_3']
-                    self.MeterRealTimeData.PowerReal_P_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReal_P_Phase_3.Value = 0
-                    self.MeterRealTimeData.PowerReal_P_Phase_3.lastupdated = None
-
-                if 'PowerReal_P_Sum' in json['Body']['Data']:
-                    self.MeterRealTimeData.PowerReal_P_Sum.Value = json['Body']['Data']['PowerReal_P_Sum']
-                    self.MeterRealTimeData.PowerReal_P_Sum.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.PowerReal_P_Sum.Value = 0
-                    self.MeterRealTimeData.PowerReal_P_Sum.lastupdated = None
-
-                if 'TimeStamp' in json['Body']['Data']:
-                    self.MeterRealTimeData.TimeStamp.Value = json['Body']['Data']['TimeStamp']
-                    self.MeterRealTimeData.TimeStamp.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.TimeStamp.Value = 0
-                    self.MeterRealTimeData.TimeStamp.lastupdated = None
-
-                if 'Visible' in json['Body']['Data']:
-                    self.MeterRealTimeData.Visible.Value = json['Body']['Data']['Visible']
-                    self.MeterRealTimeData.Visible.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Visible.Value = 0
-                    self.MeterRealTimeData.Visible.lastupdated = None
-
-                if 'Voltage_AC_PhaseToPhase_12' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.Value = json['Body']['Data']['Voltage_AC_PhaseToPhase_12']
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_12.lastupdated = None
-
-                if 'Voltage_AC_PhaseToPhase_23' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.Value = json['Body']['Data']['Voltage_AC_PhaseToPhase_23']
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_23.lastupdated = None
-
-                if 'Voltage_AC_PhaseToPhase_31' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.Value = json['Body']['Data']['Voltage_AC_PhaseToPhase_31']
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_PhaseToPhase_31.lastupdated = None
-
-                if 'Voltage_AC_Phase_1' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_Phase_1.Value = json['Body']['Data']['Voltage_AC_Phase_1']
-                    self.MeterRealTimeData.Voltage_AC_Phase_1.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_Phase_1.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_Phase_1.lastupdated = None
-
-                if 'Voltage_AC_Phase_2' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_Phase_2.Value = json['Body']['Data']['Voltage_AC_Phase_2']
-                    self.MeterRealTimeData.Voltage_AC_Phase_2.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_Phase_2.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_Phase_2.lastupdated = None
-
-                if 'Voltage_AC_Phase_3' in json['Body']['Data']:
-                    self.MeterRealTimeData.Voltage_AC_Phase_3.Value = json['Body']['Data']['Voltage_AC_Phase_3']
-                    self.MeterRealTimeData.Voltage_AC_Phase_3.lastupdated = datetime.datetime.utcnow().timestamp()
-                else:
-                    self.MeterRealTimeData.Voltage_AC_Phase_3.Value = 0
-                    self.MeterRealTimeData.Voltage_AC_Phase_3.lastupdated = None
-
-            except Exception as err:
-                print(err)
-                #Lets just ignore the error shall we,  and let it all fall apart
 
     #-------------------------------------------------------------------------------------------------------------------
     def _GetSensorRealtimeData(self, Scope=None, DeviceID=None, DataCollection=None):
@@ -2114,6 +2529,7 @@ class Fronius:
         # TODO
 
     #-------------------------------------------------------------------------------------------------------------------
+    @_singleflight
     def _GetActiveDeviceInfo(self, DeviceClass=None):
         """
         Collects a list of all devices connected to the system.
@@ -2122,14 +2538,11 @@ class Fronius:
         """
         #   TODO : this needs to be tested against a system with more than a single device on it to get some reasonable sense of the actual data returned.
 
-        if DeviceClass is None:
-            DeviceClass = "System"
-
-        url = "{protocol}://{host}{baseurl}GetActiveDeviceInfo.cgi?DeviceClass={DeviceClass}".format(
-            protocol=self.protocol, host=self.host, baseurl=self.BaseURL, DeviceClass=DeviceClass)
+        url = self._collectionURL('ActiveDeviceInfo', DeviceClass=DeviceClass)
         json = self._GetJSONData(url)
-
-        # TODO Process this data
+        if json is None:
+            return False
+        return self._parseCollection('ActiveDeviceInfo', json, url)
 
 
     #-------------------------------------------------------------------------------------------------------------------
@@ -2164,27 +2577,44 @@ class Fronius:
 
     #-------------------------------------------------------------------------------------------------------------------
     def _getGetArchiveData(self, Scope = None, SeriesType = 'Detail', HumanReadable = True, StartDate = None, EndDate = None, Channel = None, DeviceClass = None, DeviceID = '0'):
-        #TODO Not Implemented yet.  Needs lots of work.  Will come back to this once all the simpler methods are done.  This might be simpler then.
         """
-        :param Scope:
-        :param SeriesType:
-        :param HumanReadable:
-        :param StartDate:
-        :param EndDate:
-        :param Channel:
-        :param DeviceClass:
-        :param DeviceID:
-        :return:
+        Fetch the archive of one window of days.   The Datamanager answers at most archive.ARCHIVEMAXDAYS days per
+        request,  archive.ArchiveClient fetches longer ranges.
+        :param Scope:       System for every device,  Device for the one given by DeviceClass and DeviceID
+        :param SeriesType:  Detail or DailySum
+        :param HumanReadable:   Channels are named rather than numbered.   parseArchiveData needs the names
+        :param StartDate:   datetime.date.   Defaults to 15 days ago
+        :param EndDate:     datetime.date.   Defaults to today
+        :param Channel:     Channel name or list of channel names.   Each is a series of its own in the result.
+                            At least one is required
+        :param DeviceClass: Only sent with Scope Device
+        :param DeviceID:    Only sent with Scope Device
+        :return:    Dict of (channel, device) to archive.ArchiveSeries.   None if the unit could not be reached
         """
+        if isinstance(Channel, str):
+            Channel = [Channel]
+        if not Channel or not all(Channel):
+            raise ValueError('At least one Channel is required')
+        if Scope is None:
+            Scope = 'System'
         if StartDate is None:
             StartDate = datetime.date.today() - datetime.timedelta(days=15)
         if EndDate is None:
             EndDate = datetime.date.today()
 
-        url = ("{protocol}://{host}/{baseurl}/GetArchiveData.cgi?Scope={Scope}&SeriesType={SeriesType}&HumanReadable={HumanReadable}&StartDate={StartDate}&EndDate={EndDate}&Channel={Channel}&DeviceClass={DeviceClass}&DeviceID={DeviceID}"
-               .format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope = Scope, SeriesType=SeriesType,HumanReadable=HumanReadable, StartDate=StartDate, EndDate = EndDate, Channel=Channel, DeviceClass=DeviceClass, DeviceID=DeviceID))
+        url = ("{protocol}://{host}/{baseurl}/GetArchiveData.cgi?Scope={Scope}&SeriesType={SeriesType}&HumanReadable={HumanReadable}&StartDate={StartDate}&EndDate={EndDate}"
+               .format(protocol=self.protocol, host=self.host, baseurl=self.BaseURL, Scope = Scope, SeriesType=SeriesType,HumanReadable=HumanReadable, StartDate=StartDate.isoformat(), EndDate = EndDate.isoformat()))
+        #   Several channels are asked for by repeating the parameter
+        url += ''.join("&Channel={0}".format(channel) for channel in Channel)
+        if Scope == 'Device':
+            url += "&DeviceClass={DeviceClass}&DeviceId={DeviceID}".format(DeviceClass=DeviceClass, DeviceID='0' if DeviceID is None else DeviceID)
         json = self._GetJSONData(url)
-        return 'Not implemented'
+        if json is None:
+            return None
+        if not self._responseOkay(json):
+            status = json['Head']['Status']
+            raise ValueError('[{url}] Archive request failed.  Code {code}: {reason}'.format(url=url, code=status['Code'], reason=status.get('Reason')))
+        return parseArchiveData(json)
 
 
 
@@ -0,0 +1,247 @@
+"""
+    Fronius Solar Invertert communicatons - history of selected values
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    Fronius only holds the latest value of each field.   A MetricHistory given to Fronius(history=...) keeps the last
+    `capacity` values of a few of them,  each with the time it was reported.   Every metric has a ring buffer of two
+    fixed size arrays of doubles so the memory used depends on the capacity and not on how long the collector has been
+    running.   With NumPy installed the buffers can be read as arrays without copying them.
+"""
+
+from array import array
+from collections import namedtuple
+import threading
+
+#   NumPy is optional.   Only views() and arrays() need it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#   Where a metric is read from:  the collection and the field of its record
+Metric = namedtuple('Metric', ['collection', 'field'])
+
+#   Metrics kept when none are asked for,  by name
+HISTORYMETRICS = {'PAC': Metric('CommonInverterData', 'PAC'),
+                  'PowerReal_P_Sum': Metric('MeterRealtimeData', 'PowerReal_P_Sum'),
+                  'P_Grid': Metric('PowerFlowRealtimeData', 'Power_Grid'),
+                  'P_Load': Metric('PowerFlowRealtimeData', 'Power_Load'),
+                  'P_PV': Metric('PowerFlowRealtimeData', 'Power_PV')}
+
+#   A day of samples at the shortest TTL of the realtime collections
+HISTORYCAPACITY = 8640
+
+
+def _requireNumpy():
+    if numpy is None:
+        raise ImportError('NumPy is not installed.  Use samples() instead')
+
+
+class RingBuffer:
+    """
+    The last `capacity` samples of one metric.   Once it is full every new sample overwrites the oldest.
+    Attributes:
+        capacity    Samples held
+        timestamps  array('d') of the time of each sample (time.time() seconds)
+        values      array('d') of the value of each sample
+    The arrays are laid out as a ring:  the oldest sample is at start and they wrap around at the end.
+    """
+
+    def __init__(self, capacity=HISTORYCAPACITY):
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.  Got {0}'.format(capacity))
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self.count = 0
+        #   Where the next sample goes
+        self._next = 0
+
+    def __len__(self):
+        return self.count
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def start(self):
+        """
+        :return:    Index of the oldest sample
+        """
+        return self._next if self.count == self.capacity else 0
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def append(self, timestamp, value):
+        """
+        :param timestamp:
+        :param value:
+        :return:
+        """
+        index = self._next
+        self.timestamps[index] = timestamp
+        self.values[index] = value
+        index += 1
+        self._next = 0 if index == self.capacity else index
+        if self.count < self.capacity:
+            self.count += 1
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def latest(self):
+        """
+        :return:    (timestamp, value) of the newest sample,  or None if there are none
+        """
+        if not self.count:
+            return None
+        index = self._next - 1
+        return self.timestamps[index], self.values[index]
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _ranges(self):
+        """
+        :return:    The (start, end) slices of the arrays holding samples,  oldest first.   Two once it has wrapped
+        """
+        if self.count < self.capacity:
+            return ((0, self.count),)
+        if self._next == 0:
+            return ((0, self.capacity),)
+        return ((self._next, self.capacity), (0, self._next))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def samples(self):
+        """
+        :return:    List of (timestamp, value),  oldest first
+        """
+        samples = []
+        for start, end in self._ranges():
+            samples.extend(zip(self.timestamps[start:end], self.values[start:end]))
+        return samples
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def views(self):
+        """
+        NumPy views of the arrays.   Nothing is copied,  so the views change as samples are appended.
+        :return:    List of (timestamps, values) views,  oldest first.   Two of them once the ring has wrapped
+        """
+        _requireNumpy()
+        timestamps = numpy.frombuffer(self.timestamps, dtype=numpy.float64)
+        values = numpy.frombuffer(self.values, dtype=numpy.float64)
+        return [(timestamps[start:end], values[start:end]) for start, end in self._ranges()]
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def arrays(self):
+        """
+        :return:    (timestamps, values) NumPy arrays,  oldest first.   Only copied if the ring has wrapped
+        """
+        views = self.views()
+        if len(views) == 1:
+            return views[0]
+        return (numpy.concatenate([timestamps for timestamps, _ in views]),
+                numpy.concatenate([values for _, values in views]))
+
+
+class MetricHistory:
+    """
+    Ring buffers of the values of selected fields,  appended to each time their collection is stored.
+    A response with the same Head.Timestamp as the last one is not stored again and so adds no sample,  and neither
+    does a field the unit did not report (lastupdated None) or a value that is not a number.
+    Attributes:
+        capacity    Samples kept per metric
+        metrics     Dict of metric name to Metric
+        buffers     Dict of metric name to its RingBuffer
+        collections The collections the metrics are read from
+    """
+
+    def __init__(self, metrics=None, capacity=HISTORYCAPACITY):
+        """
+        :param metrics:     Dict of name to Metric,  or a list of names in HISTORYMETRICS.  Defaults to HISTORYMETRICS
+        :param capacity:    Samples kept per metric
+        """
+        if metrics is None:
+            metrics = HISTORYMETRICS
+        if not isinstance(metrics, dict):
+            unknown = [name for name in metrics if name not in HISTORYMETRICS]
+            if unknown:
+                raise ValueError('Unknown metrics {0}.  Known are {1}'.format(unknown, list(HISTORYMETRICS)))
+            metrics = {name: HISTORYMETRICS[name] for name in metrics}
+
+        self.capacity = capacity
+        self.metrics = dict(metrics)
+        self.buffers = {name: RingBuffer(capacity) for name in self.metrics}
+
+        #   Metrics by collection so storing a collection only looks at its own
+        self._bycollection = {}
+        for name, metric in self.metrics.items():
+            self._bycollection.setdefault(metric.collection, []).append((metric.field, self.buffers[name]))
+        self.collections = frozenset(self._bycollection)
+
+        #   Collections can be stored from several threads at once
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        return self.buffers[name]
+
+    def __contains__(self, name):
+        return name in self.buffers
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def record(self, collection, record):
+        """
+        Append the values of the metrics read from a collection that has just been stored.
+        :param collection:
+        :param record:      The collection's record
+        :return:
+        """
+        metrics = self._bycollection.get(collection)
+        if metrics is None:
+            return
+        #   Records of value cells carry the time of each value,  flat records one time for all of them
+        recordtime = getattr(record, 'lastupdated', None)
+        with self._lock:
+            for field, buffer in metrics:
+                value = getattr(record, field)
+                timestamp = recordtime
+                if hasattr(value, 'lastupdated'):
+                    timestamp = value.lastupdated
+                    value = value.Value
+                if timestamp is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                buffer.append(timestamp, value)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def samples(self, name):
+        """
+        :param name:
+        :return:    List of (timestamp, value) of the metric,  oldest first
+        """
+        with self._lock:
+            return self.buffers[name].samples()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def arrays(self, name):
+        """
+        :param name:
+        :return:    (timestamps, values) NumPy arrays of the metric,  oldest first.   See RingBuffer.arrays()
+        """
+        with self._lock:
+            return self.buffers[name].arrays()
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def views(self, name):
+        """
+        :param name:
+        :return:    Zero copy NumPy views of the metric.   See RingBuffer.views()
+        """
+        return self.buffers[name].views()
@@ -0,0 +1,218 @@
+"""
+    Fronius Solar Invertert communicatons - device metadata cache
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    Keeps the responses that describe a unit (API version, inverter, logger and connected devices) in a JSON file so a
+    restarting collector does not have to fetch them again.   One file can hold any number of hosts.
+"""
+
+from collections import namedtuple
+import json as jsonlib
+import os
+import tempfile
+import threading
+import time
+
+
+#   Bumped whenever the layout of the file changes.   Files of any other version are ignored.
+METADATAFORMAT = 1
+
+#   Responses kept in the cache.   APIVersion is not a collection but is stored the same way.
+METADATACOLLECTIONS = ['APIVersion', 'InverterInfo', 'LoggerInfo', 'ActiveDeviceInfo']
+
+#   What load() returns for a host.
+#   responses is a dict of collection to the decoded response,  age is seconds since the oldest of them was saved
+#   and UniqueID is the logger UniqueID the responses belong to (None until LoggerInfo has been stored).
+CachedMetadata = namedtuple('CachedMetadata', ['responses', 'age', 'UniqueID'])
+
+
+#   One lock per hosts file,  shared by every instance reading and rewriting the same file.
+_hostsfilelocks = {}
+_hostsfilelockslock = threading.Lock()
+
+
+def hostsFileLock(path):
+    """
+    The lock to hold while reading a hosts file and writing it back.
+    :param path:
+    :return:    threading.Lock
+    """
+    path = os.path.abspath(path)
+    with _hostsfilelockslock:
+        if path not in _hostsfilelocks:
+            _hostsfilelocks[path] = threading.Lock()
+        return _hostsfilelocks[path]
+
+
+def readHostsFile(path, fileformat):
+    """
+    Read a JSON file of entries by host,  as kept by MetadataCache and archive.ArchiveSync.
+    :param path:
+    :param fileformat:  Version of the layout expected.   Files of any other version are ignored
+    :return:    Dict of host to entry.   Empty if the file is missing,  unreadable or in another format
+    """
+    try:
+        with open(path, 'rb') as hostsfile:
+            contents = jsonlib.loads(hostsfile.read().decode('utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(contents, dict) or contents.get('format') != fileformat:
+        return {}
+    hosts = contents.get('hosts')
+    return hosts if isinstance(hosts, dict) else {}
+
+
+def writeHostsFile(path, fileformat, hosts):
+    """
+    Replace a file of entries by host.   The new contents are written to a temporary file of their own alongside and
+    moved into place so a reader never sees half a file,  however many threads and processes write at once.
+    :param path:
+    :param fileformat:  Version of the layout
+    :param hosts:       Dict of host to entry
+    :return:
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=os.path.basename(path) + '.',
+                                     suffix='.tmp', delete=False) as hostsfile:
+        temporary = hostsfile.name
+        try:
+            jsonlib.dump({'format': fileformat, 'hosts': hosts}, hostsfile)
+        except BaseException:
+            hostsfile.close()
+            os.remove(temporary)
+            raise
+    os.replace(temporary, path)
+
+
+class MetadataCache:
+    """
+    On-disk cache of the device metadata of each host.
+    Each host's entry holds the UniqueID of its logger.   If the unit behind a host is replaced the LoggerInfo response
+    carries a different UniqueID and everything stored for the old unit is thrown away.
+    Attributes:
+        path                The JSON file.   Created when the first response is stored
+        maxAge              Seconds a stored response is trusted for
+        validateAPIVersion  Check the stored APIVersion against the unit on start up.   Costs the one small
+                            GetAPIVersion request but catches a firmware update that moved the API
+    """
+
+    def __init__(self, path, maxAge=7 * 24 * 3600, validateAPIVersion=False):
+        self.path = path
+        self.maxAge = maxAge
+        self.validateAPIVersion = validateAPIVersion
+        #   Shared with every other MetadataCache of the same file
+        self._lock = hostsFileLock(path)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _read(self):
+        return readHostsFile(self.path, METADATAFORMAT)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _write(self, hosts):
+        writeHostsFile(self.path, METADATAFORMAT, hosts)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def load(self, host):
+        """
+        The stored metadata of a host.
+        :param host:
+        :return:    CachedMetadata,  or None if nothing usable is stored.   Expired responses are left out and without
+                    an APIVersion response nothing else can be used.
+        """
+        entry = self._read().get(host)
+        if not isinstance(entry, dict):
+            return None
+
+        now = time.time()
+        responses = {}
+        oldest = now
+        for collection, stored in entry.get('responses', {}).items():
+            try:
+                saved = float(stored['saved'])
+                response = stored['response']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if collection in METADATACOLLECTIONS and 0 <= now - saved <= self.maxAge:
+                responses[collection] = response
+                oldest = min(oldest, saved)
+
+        if 'APIVersion' not in responses:
+            return None
+        return CachedMetadata(responses, now - oldest, entry.get('UniqueID'))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def store(self, host, collection, response):
+        """
+        Save a response fetched from the unit.   Nothing is written if the stored Body is the same.
+        :param host:
+        :param collection:  One of METADATACOLLECTIONS
+        :param response:    The decoded response
+        :return:    True if the response came from a different unit (logger UniqueID) than the one stored for the host
+        """
+        uniqueid = None
+        if collection == 'LoggerInfo':
+            uniqueid = response.get('Body', {}).get('LoggerInfo', {}).get('UniqueID')
+
+        with self._lock:
+            hosts = self._read()
+            entry = hosts.get(host)
+            if not isinstance(entry, dict):
+                entry = {'UniqueID': None, 'responses': {}}
+
+            replaced = uniqueid is not None and entry.get('UniqueID') not in (None, uniqueid)
+            if replaced:
+                entry = {'UniqueID': None, 'responses': {}}
+            if uniqueid is not None:
+                entry['UniqueID'] = uniqueid
+
+            #   The Head changes with every response,  only the Body says whether anything has changed.
+            #   An unchanged response is still saved again once it is half way to expiring.
+            stored = entry['responses'].get(collection)
+            if not replaced and self._unchanged(stored, response):
+                return False
+
+            entry['responses'][collection] = {'saved': time.time(), 'response': response}
+            hosts[host] = entry
+            self._write(hosts)
+        return replaced
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _unchanged(self, stored, response):
+        """
+        :param stored:      What the file holds for the collection
+        :param response:    The response just fetched
+        :return:    True if there is no need to save the response again
+        """
+        if not isinstance(stored, dict) or not isinstance(stored.get('response'), dict):
+            return False
+        if time.time() - stored.get('saved', 0) > self.maxAge / 2:
+            return False
+        #   GetAPIVersion has no Head or Body,  the whole response is compared
+        return stored['response'].get('Body', stored['response']) == response.get('Body', response)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def discard(self, host):
+        """
+        Forget everything stored for a host.
+        :param host:
+        :return:
+        """
+        with self._lock:
+            hosts = self._read()
+            if hosts.pop(host, None) is not None:
+                self._write(hosts)
@@ -0,0 +1,379 @@
+"""
+    Fronius Solar Invertert communicatons - snapshots shared between processes
+    Copyright (C) 2018 David Crisp david.crisp@gmail.com
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+    Program Specifics:
+    One process polls the Datamanager and publishes each Snapshot into a block of shared memory.   Any number of other
+    processes read the values from the block with SharedFronius,  which has the same property names as Fronius but
+    never makes a request.
+
+    The block has a fixed layout:
+
+        header      magic,  format,  layout checksum,  sequence number and the time of the last publish
+        fetched     one double per SnapshotTimes field.  NaN where the collection has not been fetched
+        values      one SLOTSIZE slot per property of Snapshot:  a type tag,  a length and 32 bytes of value.
+                    Longer strings,  such as a long InverterCustomName,  are cut short
+
+    The sequence number is a seqlock.   The publisher makes it odd before it starts writing and even again when it has
+    finished.   A reader that finds it odd,  or finds it changed once it has copied the values,  has read a torn update
+    and reads again.   There must only ever be one publisher per block.
+"""
+
+from multiprocessing import shared_memory
+import math
+import re
+import struct
+import threading
+import time
+import zlib
+
+from frosolar import Snapshot, SnapshotTimes, SNAPSHOTPROPERTIES
+
+
+SHAREDMAGIC = b'FRSS'
+#   Bumped whenever the layout of the block changes.
+SHAREDFORMAT = 2
+
+#   magic, format, layout checksum, sequence, published
+HEADER = struct.Struct('<4sHxxIQd')
+#   tag, length of a string, then the value
+SLOT = struct.Struct('<BB6x32s')
+SLOTSIZE = SLOT.size
+SLOTVALUE = 8
+STRINGSIZE = SLOTSIZE - SLOTVALUE
+
+#   Type tags of the value slots
+TAGNONE = 0
+TAGFLOAT = 1
+TAGINT = 2
+TAGBOOL = 3
+TAGSTRING = 4
+
+FLOAT = struct.Struct('<d')
+INT = struct.Struct('<q')
+SEQUENCE = struct.Struct('<Q')
+SEQUENCEOFFSET = 12
+
+#   Properties held in the block,  in slot order.
+SHAREDPROPERTIES = [name for name in Snapshot._fields if name != 'fetched']
+FETCHEDOFFSET = HEADER.size
+VALUESOFFSET = FETCHEDOFFSET + FLOAT.size * len(SnapshotTimes._fields)
+SHAREDSIZE = VALUESOFFSET + SLOTSIZE * len(SHAREDPROPERTIES)
+
+#   Publisher and reader must agree on the properties and their order as well as the format.
+LAYOUTCHECKSUM = zlib.crc32(','.join(SnapshotTimes._fields + tuple(SHAREDPROPERTIES)).encode('ascii'))
+
+#   Reads attempted before a block that never settles is given up on.   A publisher that died half way through an
+#   update leaves the sequence number odd.
+MAXREADATTEMPTS = 10000
+
+#   Held while the resource tracker is kept from registering a block being attached to.
+_trackerlock = threading.Lock()
+
+
+def sharedName(host):
+    """
+    Default name of the shared memory block of a host.
+    :param host:    ip/domain of the Fronius device
+    :return:
+    """
+    return 'frosolar_' + re.sub(r'[^0-9A-Za-z]', '_', host)
+
+
+def _attach(name):
+    """
+    Open an existing block without the resource tracker taking ownership of it.   Before python 3.13 a process that
+    only attached to a block still unlinks it when it exits.   The block is kept from being registered at all rather
+    than unregistered afterwards:  processes started by the publisher share its tracker,  and unregistering there
+    would take the block away from the publisher too.
+    :param name:
+    :return:    SharedMemory
+    """
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    from multiprocessing import resource_tracker
+    with _trackerlock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+class SnapshotPublisher:
+    """
+    Writes the snapshots of one Fronius into shared memory.
+    Attributes:
+        fronius     The Fronius polled
+        name        Name of the shared memory block.   Defaults to sharedName(fronius.host)
+        collections Collections published.   Defaults to every collection in SNAPSHOTPROPERTIES
+        published   Number of snapshots published
+    """
+
+    def __init__(self, fronius, name=None, collections=None):
+        self.fronius = fronius
+        if name is None:
+            name = sharedName(fronius.host)
+        self.name = name
+        if collections is None:
+            collections = list(SNAPSHOTPROPERTIES)
+        self.collections = list(collections)
+        self.published = 0
+        self._lock = threading.Lock()
+
+        try:
+            with _trackerlock:
+                self.block = shared_memory.SharedMemory(name, create=True, size=SHAREDSIZE)
+        except FileExistsError:
+            #   Left behind by a publisher that did not close.   It is reused unless it is too small,  and from now on
+            #   belongs to this publisher.
+            self.block = shared_memory.SharedMemory(name)
+            if self.block.size < SHAREDSIZE:
+                self.block.close()
+                self.block.unlink()
+                self.block = shared_memory.SharedMemory(name, create=True, size=SHAREDSIZE)
+
+        #   Until the first publish every value reads as None,  whatever a reused block held before.
+        self.sequence = 0
+        HEADER.pack_into(self.block.buf, 0, SHAREDMAGIC, SHAREDFORMAT, LAYOUTCHECKSUM, self.sequence, 0.0)
+        for index in range(len(SnapshotTimes._fields)):
+            FLOAT.pack_into(self.block.buf, FETCHEDOFFSET + index * FLOAT.size, math.nan)
+        self.block.buf[VALUESOFFSET:SHAREDSIZE] = bytes(SHAREDSIZE - VALUESOFFSET)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def publish(self, snapshot=None):
+        """
+        Write a snapshot into the block.
+        :param snapshot:    Snapshot.  Defaults to fronius.snapshot() of the published collections
+        :return:    The snapshot published
+        """
+        if snapshot is None:
+            snapshot = self.fronius.snapshot(self.collections)
+
+        buf = self.block.buf
+        with self._lock:
+            self.sequence += 1
+            SEQUENCE.pack_into(buf, SEQUENCEOFFSET, self.sequence)
+
+            offset = FETCHEDOFFSET
+            for fetched in snapshot.fetched:
+                FLOAT.pack_into(buf, offset, math.nan if fetched is None else fetched)
+                offset += FLOAT.size
+
+            offset = VALUESOFFSET
+            for name in SHAREDPROPERTIES:
+                _packValue(buf, offset, getattr(snapshot, name))
+                offset += SLOTSIZE
+
+            FLOAT.pack_into(buf, SEQUENCEOFFSET + SEQUENCE.size, time.time())
+            self.sequence += 1
+            SEQUENCE.pack_into(buf, SEQUENCEOFFSET, self.sequence)
+            self.published += 1
+        return snapshot
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def run(self, stopEvent=None):
+        """
+        Keep the published collections current and publish after every refresh until stopEvent is set.
+        This is the main loop of the poller process.
+        :param stopEvent:   threading.Event.   Without one this runs forever
+        :return:
+        """
+        if stopEvent is None:
+            stopEvent = threading.Event()
+        while not stopEvent.is_set():
+            wait = self.fronius.pollDue(self.collections)
+            self.publish()
+            stopEvent.wait(wait)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def close(self, unlink=True):
+        """
+        Let go of the block.
+        :param unlink:  Remove the block as well.   Readers already attached keep their copy of it
+        :return:
+        """
+        self.block.close()
+        if unlink:
+            try:
+                self.block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _packValue(buf, offset, value):
+    """
+    Write one value into its slot.   Strings longer than the slot are cut short.
+    """
+    if value is None:
+        buf[offset] = TAGNONE
+    elif isinstance(value, bool):
+        buf[offset] = TAGBOOL
+        buf[offset + SLOTVALUE] = value
+    elif isinstance(value, int):
+        buf[offset] = TAGINT
+        INT.pack_into(buf, offset + SLOTVALUE, value)
+    elif isinstance(value, float):
+        buf[offset] = TAGFLOAT
+        FLOAT.pack_into(buf, offset + SLOTVALUE, value)
+    else:
+        encoded = str(value).encode('utf-8')[:STRINGSIZE]
+        buf[offset] = TAGSTRING
+        buf[offset + 1] = len(encoded)
+        buf[offset + SLOTVALUE:offset + SLOTVALUE + len(encoded)] = encoded
+
+
+def _unpackValue(slot):
+    """
+    Read one value back out of a copy of its slot.
+    """
+    tag, length, payload = SLOT.unpack(slot)
+    if tag == TAGFLOAT:
+        return FLOAT.unpack_from(payload)[0]
+    if tag == TAGINT:
+        return INT.unpack_from(payload)[0]
+    if tag == TAGBOOL:
+        return bool(payload[0])
+    if tag == TAGSTRING:
+        return payload[:length].decode('utf-8', 'ignore')
+    return None
+
+
+class SharedFronius:
+    """
+    Reads the values a SnapshotPublisher in another process has published.   No requests are made.
+    Every property of Snapshot can be read by the same name as on Fronius.   A value from a collection that has not
+    been published is None.
+    Attributes:
+        host    ip/domain of the Fronius device.   Only used for the default block name
+        name    Name of the shared memory block.   Defaults to sharedName(host)
+    """
+
+    def __init__(self, host=None, name=None):
+        if name is None:
+            if host is None:
+                raise ValueError('A host or the name of the shared memory block is needed')
+            name = sharedName(host)
+        self.host = host
+        self.name = name
+
+        try:
+            self.block = _attach(name)
+        except FileNotFoundError:
+            raise ValueError('Nothing has been published for {0}'.format(name))
+
+        magic, layoutformat, checksum, _, _ = HEADER.unpack_from(self.block.buf, 0)
+        if magic != SHAREDMAGIC or layoutformat != SHAREDFORMAT or checksum != LAYOUTCHECKSUM:
+            self.block.close()
+            raise ValueError('Shared memory block {0} was written by a different version'.format(name))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _consistent(self, start, end):
+        """
+        Copy bytes of the block that were all written by the same publish.
+        :param start:
+        :param end:
+        :return:    (bytes, sequence number)
+        """
+        buf = self.block.buf
+        for _ in range(MAXREADATTEMPTS):
+            before = SEQUENCE.unpack_from(buf, SEQUENCEOFFSET)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            copied = bytes(buf[start:end])
+            if SEQUENCE.unpack_from(buf, SEQUENCEOFFSET)[0] == before:
+                return copied, before
+        raise ValueError('Shared memory block {0} is not being updated consistently'.format(self.name))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def _value(self, name):
+        """
+        :param name:    Property name
+        :return:
+        """
+        offset = VALUESOFFSET + SHAREDSLOTS[name] * SLOTSIZE
+        slot, _ = self._consistent(offset, offset + SLOTSIZE)
+        return _unpackValue(slot)
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def snapshot(self):
+        """
+        Every published value from the same publish.
+        :return:    Snapshot
+        """
+        copied, _ = self._consistent(FETCHEDOFFSET, SHAREDSIZE)
+
+        fetched = []
+        for index in range(len(SnapshotTimes._fields)):
+            value = FLOAT.unpack_from(copied, index * FLOAT.size)[0]
+            fetched.append(None if math.isnan(value) else value)
+
+        values = []
+        offset = VALUESOFFSET - FETCHEDOFFSET
+        for _ in SHAREDPROPERTIES:
+            values.append(_unpackValue(copied[offset:offset + SLOTSIZE]))
+            offset += SLOTSIZE
+        return Snapshot(*values, fetched=SnapshotTimes(*fetched))
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def sequence(self):
+        """
+        Changes every time a snapshot is published.   Zero until the first one.
+        """
+        return self._consistent(0, 0)[1] // 2
+
+    #-------------------------------------------------------------------------------------------------------------------
+    @property
+    def published(self):
+        """
+        Wall clock time (time.time()) of the last publish.   None until the first one.
+        """
+        copied, sequence = self._consistent(SEQUENCEOFFSET + SEQUENCE.size, FETCHEDOFFSET)
+        if sequence == 0:
+            return None
+        return FLOAT.unpack(copied)[0]
+
+    #-------------------------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Detach from the block.   The block itself belongs to the publisher.
+        :return:
+        """
+        self.block.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+
+#   Slot of each property in the values area of the block.
+SHAREDSLOTS = {name: index for index, name in enumerate(SHAREDPROPERTIES)}
+
+
+def _sharedProperty(name):
+    return property(lambda self: self._value(name), doc='{0},  as last published'.format(name))
+
+
+for _name in SHAREDPROPERTIES:
+    setattr(SharedFronius, _name, _sharedProperty(_name))
@@ -0,0 +1,43 @@
+"""
+    Shared fixtures.   The tests run against the recorded responses in benchmarks/payloads,  served by the fake
+    Datamanager where a unit has to be talked to.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+BENCHMARKDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'benchmarks')
+if BENCHMARKDIR not in sys.path:
+    sys.path.insert(0, BENCHMARKDIR)
+
+from fakedatamanager import FakeDatamanager, loadPayloads, projectPath
+
+projectPath()
+from frosolar import Fronius
+
+
+@pytest.fixture(scope='session')
+def payloads():
+    """
+    :return:    Dict of payload name to the decoded recorded response
+    """
+    return {name: json.loads(content.decode('utf-8')) for name, content in loadPayloads().items()}
+
+
+@pytest.fixture
+def server():
+    with FakeDatamanager() as datamanager:
+        yield datamanager
+
+
+@pytest.fixture
+def fronius(server):
+    """
+    :return:    Fronius that has only fetched the API version.   Nothing else is fetched unless a property is read
+    """
+    unit = Fronius(server.host, lazy=True)
+    yield unit
+    unit.close()
@@ -0,0 +1,206 @@
+"""
+    Fetching and syncing archive data from the made up archive of the fake Datamanager.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import fakedatamanager
+from archive import ARCHIVEMAXCHANNELS, ARCHIVEMAXDAYS, ArchiveClient, ArchiveSync, archiveWindows, trimSeries
+
+CHANNELS = ['PowerReal_PAC_Sum', 'EnergyReal_WAC_Sum_Produced']
+START = datetime.date(2018, 5, 1)
+END = datetime.date(2018, 5, 20)
+DAY = datetime.timedelta(days=1)
+
+#   Samples the fake Datamanager reports for each channel of each day
+DAYSAMPLES = 86400 // fakedatamanager.ARCHIVEINTERVAL
+
+
+@pytest.fixture
+def client(fronius):
+    return ArchiveClient(fronius)
+
+
+@pytest.fixture
+def sync(client, tmp_path):
+    return ArchiveSync(client, str(tmp_path / 'sync.json'))
+
+
+def taken(series, into=None):
+    """
+    :return:    Dict of (channel, device) to the list of timestamps taken,  checking nothing is taken twice
+    """
+    if into is None:
+        into = {}
+    for part in series:
+        timestamps = into.setdefault((part.channel, part.device), [])
+        assert not timestamps or part.timestamps[0] > timestamps[-1]
+        timestamps.extend(part.timestamps)
+    return into
+
+
+def whole(client, channels, end):
+    return {key: list(series.timestamps) for key, series in client.fetch(channels, START, end).items()}
+
+
+def test_range_is_split_into_windows(client, server):
+    assert archiveWindows(START, START) == [(START, START)]
+    assert archiveWindows(START, START + DAY * 15) == [(START, START + DAY * 15)]
+    assert archiveWindows(START, START + DAY * 16) == [(START, START + DAY * 15), (START + DAY * 16,) * 2]
+    with pytest.raises(ValueError):
+        archiveWindows(START, START - DAY)
+
+    #   41 days are three requests,  none longer than the Datamanager answers
+    end = START + DAY * 40
+    fetched = client.fetch(CHANNELS, START, end)
+    assert server.archiveRequests == 3
+    assert server.archiveChannelDays == 41 * len(CHANNELS)
+    assert set(fetched) == {(channel, fakedatamanager.ARCHIVEDEVICE) for channel in CHANNELS}
+    for series in fetched.values():
+        assert len(series.timestamps) == len(series.values) == 41 * DAYSAMPLES
+        #   No gap and nothing twice where the windows meet
+        assert {b - a for a, b in zip(series.timestamps, series.timestamps[1:])} == {fakedatamanager.ARCHIVEINTERVAL}
+        assert series.values[0] == fakedatamanager.archiveValue(series.channel, series.timestamps[0])
+
+
+def test_channels_are_batched(client, server):
+    channels = ['Channel_{0}'.format(number) for number in range(ARCHIVEMAXCHANNELS + 2)]
+    fetched = client.fetch(channels, START, START + DAY * (ARCHIVEMAXDAYS - 1))
+    assert server.archiveRequests == 2
+    assert server.archiveChannelDays == len(channels) * ARCHIVEMAXDAYS
+    assert sorted(channel for channel, _ in fetched) == sorted(channels)
+    assert all(len(series.timestamps) == ARCHIVEMAXDAYS * DAYSAMPLES for series in fetched.values())
+
+    #   Two windows of two requests each
+    client.fetch(channels, START, START + DAY * ARCHIVEMAXDAYS)
+    assert server.archiveRequests == 2 + 4
+    with pytest.raises(ValueError):
+        client.fetch([''], START, END)
+
+
+def test_windows_are_handed_over_in_order(fronius, server, monkeypatch):
+    respond = fakedatamanager.archiveResponse
+    lock = threading.Lock()
+    inflight = [0, 0]
+
+    def archiveResponse(query, maxDays=fakedatamanager.ARCHIVEMAXDAYS):
+        with lock:
+            inflight[0] += 1
+            inflight[1] = max(inflight)
+        #   The first window is the slowest to answer
+        time.sleep(0.3 if query['StartDate'][0] == START.isoformat() else 0.1)
+        try:
+            return respond(query, maxDays)
+        finally:
+            with lock:
+                inflight[0] -= 1
+
+    monkeypatch.setattr(fakedatamanager, 'archiveResponse', archiveResponse)
+    client = ArchiveClient(fronius, maxParallelRequests=3)
+    end = START + DAY * (ARCHIVEMAXDAYS * 4 - 1)
+    starts = [response[0].timestamps[0] for response in client.iterResponses(CHANNELS[:1], START, end, prefetch=2)]
+    assert starts == sorted(starts) and len(starts) == 4
+    assert inflight[1] == 3
+
+    #   Without prefetch one request at a time
+    inflight[1] = 0
+    assert len(list(client.iterResponses(CHANNELS[:1], START, end, prefetch=0))) == 4
+    assert inflight[1] == 1
+
+    #   Stopping early only leaves the window fetched ahead
+    before = server.archiveRequests
+    stream = client.iterWindows(CHANNELS[:1], START, end, prefetch=1)
+    next(stream)
+    stream.close()
+    assert server.archiveRequests == before + 2
+
+
+def test_samples_repeated_at_window_edges_are_taken_once(client, server, monkeypatch):
+    expected = client.fetch(CHANNELS, START, END)
+    respond = fakedatamanager.archiveResponse
+
+    def archiveResponse(query, maxDays=fakedatamanager.ARCHIVEMAXDAYS):
+        #   Every window after the first also reports the last day of the window before it
+        start = datetime.date.fromisoformat(query['StartDate'][0])
+        if start > START:
+            query = dict(query, StartDate=[(start - DAY).isoformat()])
+        return respond(query, maxDays + 1)
+
+    monkeypatch.setattr(fakedatamanager, 'archiveResponse', archiveResponse)
+    before = server.archiveChannelDays
+    overlapped = client.fetch(CHANNELS, START, END)
+    assert server.archiveChannelDays - before == (20 + 1) * len(CHANNELS)
+    assert {key: (list(series.timestamps), list(series.values)) for key, series in overlapped.items()} == \
+           {key: (list(series.timestamps), list(series.values)) for key, series in expected.items()}
+
+    #   A window wholly taken already is trimmed to nothing and not handed over
+    series = expected[(CHANNELS[0], fakedatamanager.ARCHIVEDEVICE)]
+    assert trimSeries(series, None) is series
+    assert len(trimSeries(series, series.timestamps[-1]).timestamps) == 0
+    after = {(CHANNELS[0], fakedatamanager.ARCHIVEDEVICE): series.timestamps[DAYSAMPLES * 17 - 1]}
+    streamed = taken(client.iterWindows(CHANNELS[:1], START, END, after=after))
+    assert streamed == {(CHANNELS[0], fakedatamanager.ARCHIVEDEVICE): list(series.timestamps[DAYSAMPLES * 17:])}
+
+
+def test_resume_after_a_partial_consume(client, sync):
+    stream = sync.sync(CHANNELS, StartDate=START, EndDate=END)
+    first = [next(stream) for _ in range(3)]
+    stream.close()
+    #   The first request's two series were finished with,  the third was handed over but not finished
+    assert sync.marks() == {(series.channel, series.device): series.timestamps[-1] for series in first[:2]}
+
+    got = taken(first[:2])
+    taken(sync.sync(CHANNELS, StartDate=START, EndDate=END), got)
+    assert got == whole(client, CHANNELS, END)
+
+
+def test_marks_are_saved_once_per_request(sync, monkeypatch):
+    writes = []
+    write = sync._write
+    monkeypatch.setattr(sync, '_write', lambda hosts: (writes.append(1), write(hosts)))
+    assert len(list(sync.sync(CHANNELS, StartDate=START, EndDate=END))) == 4
+    assert len(writes) == 2
+
+
+def test_lock_is_shared_per_file(client, sync, tmp_path):
+    assert ArchiveSync(client, str(tmp_path / 'sync.json'))._lock is sync._lock
+    assert ArchiveSync(client, str(tmp_path / 'other.json'))._lock is not sync._lock
+
+
+def test_days_are_the_inverters(sync, fronius):
+    #   Half past midnight at the inverter (UTC+10) is still the day before in UTC
+    midnight = datetime.datetime(2018, 5, 20, 0, 30, tzinfo=fakedatamanager.ARCHIVETIMEZONE).timestamp()
+    assert fronius.UTCOffset == 36000
+    assert sync._localDate(midnight) == datetime.date(2018, 5, 20)
+
+
+def test_new_device_is_synced_from_the_start(client, sync, monkeypatch):
+    respond = fakedatamanager.archiveResponse
+    meter = []
+
+    def archiveResponse(query, maxDays=fakedatamanager.ARCHIVEMAXDAYS):
+        body, channeldays = respond(query, maxDays)
+        if meter:
+            response = json.loads(body)
+            data = response['Body']['Data']
+            if data:
+                data['meter/0'] = dict(data[fakedatamanager.ARCHIVEDEVICE])
+            body = json.dumps(response).encode('utf-8')
+        return body, channeldays
+
+    monkeypatch.setattr(fakedatamanager, 'archiveResponse', archiveResponse)
+    got = taken(sync.sync(CHANNELS[:1], StartDate=START, EndDate=END))
+    meter.append(True)
+    end = datetime.date(2018, 6, 10)
+    taken(sync.sync(CHANNELS[:1], StartDate=START, EndDate=end), got)
+
+    expected = whole(client, CHANNELS[:1], end)
+    assert set(expected) == {(CHANNELS[0], fakedatamanager.ARCHIVEDEVICE), (CHANNELS[0], 'meter/0')}
+    assert got == expected
+    assert os.path.exists(sync.path)
@@ -0,0 +1,118 @@
+"""
+    AsyncFronius against the fake Datamanager,  compared with what Fronius stores from the same responses.
+"""
+
+import asyncio
+
+import pytest
+
+from asyncfrosolar import AsyncFronius, AsyncHTTPTransport
+from frosolar import CircuitBreaker, Fronius
+
+COLLECTIONS = ['CommonInverterData', '3PInverterData', 'MeterRealtimeData']
+
+
+def refreshed(host, collections):
+    """
+    :return:    The AsyncFronius after an awaited refresh() of the collections
+    """
+    async def run():
+        async with AsyncFronius(host) as unit:
+            await unit.refresh(collections)
+            return unit
+    return asyncio.run(run())
+
+
+def test_refresh_matches_fronius(server):
+    unit = refreshed(server.host, COLLECTIONS)
+    expected = Fronius(server.host, lazy=True)
+    for collection in COLLECTIONS:
+        expected._refreshCollection(collection)
+        assert unit.collectionValues(collection) == expected.collectionValues(collection), collection
+    expected.close()
+
+
+def test_properties_return_the_refreshed_values(server):
+    unit = refreshed(server.host, COLLECTIONS)
+    assert unit.ACPower == 2385
+    assert unit.PowerReal_P_Sum == -1371.54
+    assert unit.LoggerUniqueID == '240.109876'
+
+
+def test_read_reports_the_age(server):
+    unit = refreshed(server.host, COLLECTIONS)
+    aged = unit.read('ACPower')
+    assert aged.value == 2385
+    assert aged.age is not None and not aged.stale
+
+
+def test_same_settings_as_fronius(server):
+    unit = refreshed(server.host, [])
+    blocking = Fronius(server.host, lazy=True)
+    fetching = {'session', 'keepAlive', 'parallelInit', 'lazy', 'initialstarttime', '_flightlock', '_flights',
+                'staleWhileRevalidate', 'maxStaleness', '_revalidator', '_revalidating', '_closed'}
+    assert set(vars(blocking)) - set(vars(unit)) == fetching
+    blocking.close()
+
+
+def test_blocking_requests_are_not_inherited():
+    unit = AsyncFronius('unused')
+    assert not isinstance(unit, Fronius)
+    for name in ('pollDue', 'poll', '_refreshCollection', '_fetchDataFromAPI', '_getInverterinfo', 'session'):
+        assert not hasattr(unit, name), name
+    assert unit.ACPower is None
+
+
+def test_unreachable_unit():
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncFronius('127.0.0.1:1', connectTimeout=1).connect())
+
+
+def test_malformed_response_resolves_the_probe():
+    class Transport:
+        async def get(self, url):
+            raise ValueError('Malformed status line')
+
+    unit = AsyncFronius('malformed')
+    unit.breaker = CircuitBreaker(failureThreshold=1, cooldown=0)
+    unit.breaker.recordFailure()
+    unit.transport = Transport()
+    with pytest.raises(ValueError):
+        asyncio.run(unit._fetchDataFromAPIAsync('http://malformed/'))
+    assert unit.breaker.state == 'Open'
+
+
+def test_error_response_is_not_cached(server):
+    server.payloads['GetInverterRealtimeData_CommonInverterData'] = \
+        b'{"Head": {"Status": {"Code": 8, "Reason": "Busy"}, "Timestamp": "now"}, "Body": {"Data": {}}}'
+    unit = refreshed(server.host, ['CommonInverterData', 'MeterRealtimeData'])
+    assert unit.cache.age('CommonInverterData') is None
+    assert unit.cache.age('MeterRealtimeData') is not None
+
+
+def test_unanswered_idle_connection_is_retried_on_a_new_one(server):
+    class Writer:
+        closed = False
+
+        def write(self, data):
+            pass
+
+        async def drain(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    async def run():
+        transport = AsyncHTTPTransport(connectTimeout=1, readTimeout=0.2)
+        host, port = server.server_address
+        stale = [(asyncio.StreamReader(), Writer()), (asyncio.StreamReader(), Writer())]
+        transport._idle[(host, port, False)] = list(stale)
+        status, body = await transport.get('http://{0}/solar_api/GetAPIVersion.cgi'.format(server.host))
+        await transport.close()
+        return status, stale
+
+    status, stale = asyncio.run(run())
+    assert status == 200
+    assert server.connections == 1
+    assert all(writer.closed for reader, writer in stale)
@@ -0,0 +1,79 @@
+"""
+    The circuit breaker of a host that stops answering.
+"""
+
+import time
+
+import pytest
+
+from fakedatamanager import FakeDatamanager
+from frosolar import CircuitBreaker, Fronius, circuitBreaker
+
+COOLDOWN = 0.2
+
+
+@pytest.fixture
+def stopped():
+    """
+    :return:    Fronius that has read ACPower from a fake Datamanager that has since stopped.   Connections are not
+                kept alive,  the fake Datamanager goes on serving those it has accepted
+    """
+    with FakeDatamanager() as server:
+        unit = Fronius(server.host, keepAlive=False, lazy=True, connectTimeout=1, failureThreshold=2,
+                       breakerCooldown=COOLDOWN, maxBreakerCooldown=COOLDOWN * 3)
+        assert unit.ACPower == 2385
+    yield unit
+    unit.close()
+
+
+def stale(unit):
+    unit.cache.invalidate('CommonInverterData')
+    return unit.ACPower
+
+
+def test_breaker_opens_and_probes(stopped):
+    breaker = stopped.breaker
+    assert [stale(stopped) for _ in range(2)] == [2385, 2385]
+    assert (breaker.state, breaker.failures) == ('Open', 2)
+
+    #   Open:  nothing is sent,  the last value is still served
+    assert stale(stopped) == 2385
+    assert breaker.rejected == 1
+
+    #   After the cooldown one probe goes through.   It fails and the cooldown doubles.
+    time.sleep(COOLDOWN)
+    assert stale(stopped) == 2385
+    assert (breaker.state, breaker.currentCooldown, breaker.rejected) == ('Open', COOLDOWN * 2, 1)
+    stale(stopped)
+    assert breaker.rejected == 2
+
+    #   It doubles up to maxCooldown
+    time.sleep(COOLDOWN * 2)
+    stale(stopped)
+    assert breaker.currentCooldown == COOLDOWN * 3
+
+
+def test_probe_success_closes_the_circuit():
+    breaker = CircuitBreaker(failureThreshold=1, cooldown=0, maxCooldown=10)
+    breaker.recordFailure()
+    assert breaker.state == 'Open'
+    assert breaker.allowRequest()
+    assert breaker.state == 'HalfOpen'
+    breaker.recordResponse(200)
+    assert (breaker.state, breaker.failures, breaker.currentCooldown) == ('Closed', 0, 0)
+
+
+def test_server_error_counts_as_a_failure():
+    breaker = CircuitBreaker(failureThreshold=2)
+    breaker.recordResponse(503)
+    breaker.recordResponse(404)
+    breaker.recordResponse(500)
+    assert (breaker.state, breaker.failures) == ('Closed', 1)
+
+
+def test_breakers_are_shared_per_host_and_settings():
+    assert circuitBreaker('10.0.3.250') is circuitBreaker('10.0.3.250')
+    assert circuitBreaker('10.0.3.250') is not circuitBreaker('10.0.3.251')
+    other = circuitBreaker('10.0.3.250', failureThreshold=1, cooldown=30)
+    assert other is not circuitBreaker('10.0.3.250')
+    assert (other.failureThreshold, other.cooldown) == (1, 30)
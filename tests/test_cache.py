@@ -0,0 +1,61 @@
+"""
+    Serving collections from the cache until their TTL runs out.
+"""
+
+import pytest
+
+from frosolar import CollectionCache, Fronius
+
+ERROR = b'{"Head": {"Status": {"Code": 8, "Reason": "Busy"}, "Timestamp": "now"}, "Body": {"Data": {}}}'
+
+
+@pytest.fixture
+def unit(server):
+    fronius = Fronius(server.host, lazy=True, cacheTTLs={'CommonInverterData': 10})
+    yield fronius
+    fronius.close()
+
+
+def test_hits_and_misses_are_counted(server, unit):
+    requests = server.requests
+    assert [unit.ACPower for _ in range(3)] == [2385] * 3
+    assert unit.Day_Energy is not None
+    assert server.requests == requests + 1
+
+    stats = unit.cache.stats()['CommonInverterData']
+    assert (stats.hits, stats.misses, stats.ttl) == (3, 1, 10)
+    assert stats.age is not None
+
+
+def test_expired_collection_is_fetched_again(server, unit):
+    unit.ACPower
+    requests = server.requests
+    unit.cache.stored('CommonInverterData', 9)
+    unit.ACPower
+    assert server.requests == requests
+    unit.cache.stored('CommonInverterData', 11)
+    unit.ACPower
+    assert server.requests == requests + 1
+    assert unit.cache.age('CommonInverterData') < 10
+
+
+def test_invalidate():
+    cache = CollectionCache({'InverterInfo': 60})
+    cache.stored('InverterInfo')
+    cache.stored('LoggerInfo')
+    assert cache.lookup('InverterInfo')
+    cache.invalidate('InverterInfo')
+    assert not cache.lookup('InverterInfo')
+    assert cache.lookup('LoggerInfo')
+    cache.invalidate()
+    assert cache.fetched == {}
+
+
+def test_error_response_is_not_cached(server, unit):
+    server.payloads['GetInverterRealtimeData_CommonInverterData'] = ERROR
+    requests = server.requests
+    unit.ACPower
+    unit.ACPower
+    assert server.requests == requests + 2
+    assert unit.cache.age('CommonInverterData') is None
+    assert unit.UnitStatus.code == 8
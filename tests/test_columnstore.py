@@ -0,0 +1,91 @@
+"""
+    Appending to and reading back the monthly column files.
+"""
+
+import calendar
+import os
+
+import pytest
+
+from columnstore import ITEMSIZE, ColumnStore
+
+HOST = '10.0.3.250'
+CHANNEL = 'PowerReal_PAC_Sum'
+DEVICE = 'inverter/1'
+
+#   The last hour of January 2018 and the first of February,  one sample a minute
+FEBRUARY = calendar.timegm((2018, 2, 1, 0, 0, 0))
+TIMESTAMPS = [float(FEBRUARY + minute * 60) for minute in range(-60, 60)]
+VALUES = [float(minute) for minute in range(120)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    columns = ColumnStore(str(tmp_path))
+    yield columns
+    columns.close()
+
+
+def columnFile(store, partition, suffix):
+    return os.path.join(store._columnPath(HOST, CHANNEL, DEVICE), partition + suffix)
+
+
+def test_samples_are_stored_once(store):
+    assert store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS[:80], VALUES[:80]) == 80
+    assert store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS[:80], VALUES[:80]) == 0
+    assert store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS, VALUES) == 40
+    timestamps, values = store.read(HOST, CHANNEL, DEVICE)
+    assert (list(timestamps), list(values)) == (TIMESTAMPS, VALUES)
+
+
+def test_samples_are_split_by_month(store):
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS, VALUES)
+    assert store.partitions(HOST, CHANNEL, DEVICE) == ['2018-01', '2018-02']
+    assert os.path.getsize(columnFile(store, '2018-01', '.ts')) == 60 * ITEMSIZE
+    assert [len(timestamps) for timestamps, values in store.segments(HOST, CHANNEL, DEVICE)] == [60, 60]
+
+
+def test_range_reads(store):
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS, VALUES)
+    timestamps, values = store.read(HOST, CHANNEL, DEVICE, TIMESTAMPS[50], TIMESTAMPS[70])
+    assert (list(timestamps), list(values)) == (TIMESTAMPS[50:70], VALUES[50:70])
+
+    segments = store.segments(HOST, CHANNEL, DEVICE, FEBRUARY, TIMESTAMPS[-1] + 1)
+    assert len(segments) == 1
+    assert list(segments[0][0]) == TIMESTAMPS[60:]
+    assert store.segments(HOST, CHANNEL, DEVICE, TIMESTAMPS[-1] + 1) == []
+    assert list(store.read(HOST, CHANNEL, DEVICE, end=TIMESTAMPS[0] + 1)[1]) == VALUES[:1]
+
+
+def test_reads_see_later_appends(store):
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS[60:80], VALUES[60:80])
+    assert len(store.read(HOST, CHANNEL, DEVICE)[0]) == 20
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS[80:], VALUES[80:])
+    assert list(store.read(HOST, CHANNEL, DEVICE)[1]) == VALUES[60:]
+    assert len(store._maps) == 2
+    store.close()
+    assert store._maps == {}
+
+
+def test_interrupted_append_is_cut_back(tmp_path, store):
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS, VALUES)
+    with open(columnFile(store, '2018-02', '.ts'), 'ab') as column:
+        column.write(b'\0' * (ITEMSIZE + 3))
+
+    reopened = ColumnStore(str(tmp_path))
+    assert reopened.append(HOST, CHANNEL, DEVICE, [TIMESTAMPS[-1] + 60], [120.0]) == 1
+    timestamps, values = reopened.read(HOST, CHANNEL, DEVICE)
+    assert (list(timestamps), list(values)) == (TIMESTAMPS + [TIMESTAMPS[-1] + 60], VALUES + [120.0])
+    reopened.close()
+
+
+def test_empty_last_month_is_passed_over(tmp_path, store):
+    store.append(HOST, CHANNEL, DEVICE, TIMESTAMPS[:60], VALUES[:60])
+    with open(columnFile(store, '2018-02', '.ts'), 'wb') as column:
+        column.write(b'\0' * 5)
+    open(columnFile(store, '2018-02', '.val'), 'wb').close()
+
+    reopened = ColumnStore(str(tmp_path))
+    assert reopened.append(HOST, CHANNEL, DEVICE, TIMESTAMPS, VALUES) == 60
+    assert list(reopened.read(HOST, CHANNEL, DEVICE)[0]) == TIMESTAMPS
+    reopened.close()
@@ -0,0 +1,113 @@
+"""
+    Sweeping a fleet of fake Datamanagers with some hosts that never answer.
+"""
+
+import socket
+import threading
+from contextlib import ExitStack
+
+import pytest
+
+import fakedatamanager
+from fakedatamanager import FakeDatamanager
+from fleet import FLEETCOLLECTIONS, FroniusFleet, fleetArray
+
+#   Nothing listens on port 1,  so connecting is refused straight away.
+REFUSEDHOST = '127.0.0.1:1'
+
+#   Seconds a host that accepts but never answers is waited on
+READTIMEOUT = 1.0
+
+
+@pytest.fixture
+def silent():
+    """
+    :return:    Host that accepts connections but never answers them
+    """
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(16)
+    yield '{0}:{1}'.format(*listener.getsockname())
+    listener.close()
+
+
+@pytest.fixture
+def inflight(monkeypatch):
+    """
+    Track the requests being answered at once by every fake Datamanager.
+    :return:    Dict with the most answered at once across all of them under 'all' and for each one under its host
+    """
+    lock = threading.Lock()
+    current = {}
+    most = {}
+    handle = fakedatamanager.FakeDatamanagerHandler.do_GET
+
+    def count(keys, step):
+        with lock:
+            for key in keys:
+                current[key] = current.get(key, 0) + step
+                most[key] = max(most.get(key, 0), current[key])
+
+    def do_GET(handler):
+        keys = ('all', handler.server.host)
+        count(keys, 1)
+        try:
+            handle(handler)
+        finally:
+            count(keys, -1)
+
+    monkeypatch.setattr(fakedatamanager.FakeDatamanagerHandler, 'do_GET', do_GET)
+    return most
+
+
+def test_caps_are_kept(inflight, silent):
+    with ExitStack() as stack:
+        servers = [stack.enter_context(FakeDatamanager(responseDelay=0.2)) for _ in range(4)]
+        hosts = [silent, REFUSEDHOST] + [server.host for server in servers]
+        fleet = FroniusFleet(hosts, maxConcurrency=3, perHostConcurrency=2, readTimeout=READTIMEOUT)
+        try:
+            results = fleet.sweep()
+        finally:
+            fleet.close()
+
+    assert set(results) == set(hosts)
+    for server in servers:
+        assert sorted(results[server.host].values) == sorted(FLEETCOLLECTIONS)
+        assert results[server.host].errors == {}
+    assert set(results[REFUSEDHOST].errors) == set(results[silent].errors) == {'connect'}
+    #   The silent host held one of the three requests until it timed out,  the rest of the sweep used all three
+    assert max(inflight[server.host] for server in servers) == 2
+    assert inflight['all'] == 3
+
+
+def test_dead_hosts_do_not_hold_up_the_others(silent):
+    with ExitStack() as stack:
+        servers = [stack.enter_context(FakeDatamanager(responseDelay=0.01)) for _ in range(3)]
+        hosts = [silent, REFUSEDHOST] + [server.host for server in servers]
+        fleet = FroniusFleet(hosts, maxConcurrency=2, perHostConcurrency=2, readTimeout=READTIMEOUT)
+        try:
+            first = list(fleet.iterSweep())
+            #   Once connected a second sweep goes straight to the collections
+            again = fleet.sweep()
+        finally:
+            fleet.close()
+
+    #   The reachable hosts share the one request the silent host leaves free and still finish long before it
+    assert first[-1].host == silent
+    assert {result.host for result in first[:-1]} == set(hosts[1:])
+    assert all(result.elapsed < READTIMEOUT / 2 for result in first[:-1])
+    for server in servers:
+        assert again[server.host].elapsed < READTIMEOUT / 2
+        assert sorted(again[server.host].values) == sorted(FLEETCOLLECTIONS)
+    assert again[silent].elapsed >= READTIMEOUT * 0.9
+
+
+def test_long_host_names_are_kept_whole(fronius):
+    numpy = pytest.importorskip('numpy')
+    assert fronius.ACPower == 2385
+    hosts = ['inverter-{0}.'.format(number) + 'site.example.com' * 6 for number in (1, 2)]
+    fleet = fleetArray([(hosts[0], fronius), (hosts[1], None)], ['CommonInverterData'])
+    assert list(fleet['host']) == hosts
+    assert fleet['PAC'][0] == 2385
+    assert numpy.isnan(fleet[1]['PAC']) and numpy.isnan(fleet[1]['fetched_CommonInverterData'])
+    assert len(fleetArray([])) == 0
@@ -0,0 +1,176 @@
+"""
+    Storing the recorded responses of each collection through the table driven extractors.
+"""
+
+import copy
+
+import pytest
+
+from frosolar import (COLLECTIONFIELDS, COLLECTIONRECORDS, EXTRACTORS, INVERTERNUMBER, FieldMap, compileExtractor,
+                      _Record)
+
+#   Recorded payload of each collection
+PAYLOADCOLLECTIONS = {'GetInverterInfo': 'InverterInfo',
+                      'GetLoggerInfo': 'LoggerInfo',
+                      'GetLoggerLEDInfo': 'LoggerLEDInfo',
+                      'GetPowerFlowRealtimeData': 'PowerFlowRealtimeData',
+                      'GetMeterRealtimeData': 'MeterRealtimeData',
+                      'GetInverterRealtimeData_CommonInverterData': 'CommonInverterData',
+                      'GetInverterRealtimeData_3PInverterData': '3PInverterData',
+                      'GetInverterRealtimeData_MinMaxInverterData': 'MinMaxInverterData'}
+
+
+def collectionData(collection, response):
+    """
+    :return:    The part of a response the fields of a collection are read from
+    """
+    data = response
+    for key in COLLECTIONFIELDS[collection].path:
+        data = data['1' if key is INVERTERNUMBER else key]
+    return data
+
+
+def reported(data, key):
+    """
+    :return:    The value under a FieldMap key,  following a tuple of keys down
+    """
+    for part in key if isinstance(key, tuple) else (key,):
+        data = data[part]
+    return data
+
+
+def isReported(data, key):
+    try:
+        reported(data, key)
+    except (KeyError, TypeError):
+        return False
+    return True
+
+
+@pytest.mark.parametrize('payload, collection', sorted(PAYLOADCOLLECTIONS.items()))
+def test_every_reported_value_is_stored(fronius, payloads, payload, collection):
+    response = payloads[payload]
+    assert fronius._parseCollection(collection, response, payload) is True
+
+    record = getattr(fronius, COLLECTIONRECORDS[collection])
+    data = collectionData(collection, response)
+    stored = 0
+    for fieldmap in COLLECTIONFIELDS[collection].fields:
+        if not isReported(data, fieldmap.key):
+            continue
+        value = reported(data, fieldmap.key)
+        held = getattr(record, fieldmap.field)
+        if fieldmap.kind == 'value':
+            assert held == value, fieldmap
+        elif fieldmap.kind == 'cell':
+            assert (held.Value, held.lastupdated is not None) == (value, True), fieldmap
+        elif fieldmap.kind == 'unit':
+            assert (held.Value, held.Unit, held.lastupdated is not None) == (value['Value'], value['Unit'], True), \
+                fieldmap
+        else:
+            assert {name: getattr(held, name) for name in fieldmap.subfields} == \
+                   {name: value[name] for name in fieldmap.subfields}, fieldmap
+        stored += 1
+    assert stored
+
+
+@pytest.mark.parametrize('payload, collection', sorted(PAYLOADCOLLECTIONS.items()))
+def test_every_value_in_the_response_has_a_field(payloads, payload, collection):
+    data = collectionData(collection, payloads[payload])
+    mapped = {fieldmap.key[0] if isinstance(fieldmap.key, tuple) else fieldmap.key
+              for fieldmap in COLLECTIONFIELDS[collection].fields}
+    assert set(data) - mapped == set()
+
+
+def test_logger_info_is_read_from_body_logger_info(fronius, payloads):
+    fronius._parseCollection('LoggerInfo', payloads['GetLoggerInfo'], 'GetLoggerInfo')
+    assert fronius.LoggerInfo.UniqueID == '240.109876'
+    assert fronius.LoggerInfo.C02Factor == pytest.approx(0.53)
+    assert fronius.LoggerInfo.TimezoneName == 'AEST'
+    assert fronius.LoggerInfo.lastupdated is not None
+
+
+def test_minmax_keys_match_the_response(fronius, payloads):
+    fronius._parseCollection('MinMaxInverterData', payloads['GetInverterRealtimeData_MinMaxInverterData'], 'MinMax')
+    values = fronius.collectionValues('MinMaxInverterData')
+    assert values['Day_VACMNIN'] == 236.2
+    assert values['Day_VDCMax'] == 622.8
+    assert values['Year_VACMNIN'] == 228.8
+    assert values['Year_VDCMax'] == 687.1
+    assert values['Total_VACMNIN'] == 221.3
+    assert values['Total_VDCMax'] == 701.5
+
+
+def test_renamed_and_nested_fields(fronius, payloads):
+    fronius._parseCollection('PowerFlowRealtimeData', payloads['GetPowerFlowRealtimeData'], 'PowerFlow')
+    fronius._parseCollection('MeterRealtimeData', payloads['GetMeterRealtimeData'], 'Meter')
+    fronius._parseCollection('CommonInverterData', payloads['GetInverterRealtimeData_CommonInverterData'], 'Common')
+    assert fronius.PowerFlowRealtimeSite.Power_Grid == -1371.54
+    assert fronius.PowerFlowRealtimeSite.Rel_SelfConsumption == 42.49
+    assert fronius.MeterRealTimeData.Manufacturer.Value == 'Fronius'
+    assert fronius.MeterRealTimeData.Serial.Value == '16220052'
+    assert fronius.CommonInverterValues.VAC.Value == 241.2
+    assert fronius.CommonInverterValues.DeviceStatus.StatusCode == 7
+
+
+def test_missing_values_are_reset_to_their_defaults(fronius, payloads):
+    response = copy.deepcopy(payloads['GetInverterRealtimeData_3PInverterData'])
+    fronius._parseCollection('3PInverterData', response, '3P')
+    del response['Body']['Data']['T_Ambient']
+    response['Head']['Timestamp'] = 'later'
+    fronius._parseCollection('3PInverterData', response, '3P')
+    assert fronius.ThreePhaseinverterValues.T_Ambient.Value == 0
+    assert fronius.ThreePhaseinverterValues.T_Ambient.lastupdated is None
+    assert fronius.ThreePhaseinverterValues.IAC_L1.Value == 3.31
+
+
+@pytest.mark.parametrize('collection, payload, kept', [
+    ('LoggerLEDInfo', 'GetLoggerLEDInfo', False),
+    ('CommonInverterData', 'GetInverterRealtimeData_CommonInverterData', True)])
+def test_error_response(fronius, payloads, collection, payload, kept):
+    fronius._parseCollection(collection, payloads[payload], payload)
+    before = fronius.collectionValues(collection)
+    error = {'Head': {'Status': {'Code': 8, 'Reason': 'Busy'}, 'Timestamp': 'later'}, 'Body': {'Data': {}}}
+    fronius._parseCollection(collection, error, payload)
+    after = fronius.collectionValues(collection)
+    assert (after == before) is kept
+
+
+def test_unchanged_timestamp_skips_the_parse(fronius, payloads):
+    response = payloads['GetInverterRealtimeData_CommonInverterData']
+    fronius._parseCollection('CommonInverterData', response, 'Common')
+    fronius.CommonInverterValues.PAC.Value = None
+    fronius._parseCollection('CommonInverterData', response, 'Common')
+    assert fronius.skippedParses == 1
+    assert fronius.CommonInverterValues.PAC.Value is None
+
+
+def test_missing_collection_data_raises(fronius):
+    response = {'Head': {'Status': {'Code': 0}, 'Timestamp': 'now'}, 'Body': {}}
+    with pytest.raises(ValueError):
+        fronius._parseCollection('CommonInverterData', response, 'Common')
+
+
+def test_every_collection_has_an_extractor(fronius):
+    assert set(EXTRACTORS) == set(COLLECTIONFIELDS)
+    for collection, collectionmap in COLLECTIONFIELDS.items():
+        fields = set(getattr(fronius, COLLECTIONRECORDS[collection])._fields)
+        assert {fieldmap.field for fieldmap in collectionmap.fields} <= fields
+
+
+def test_compiled_extractor():
+    class Record(_Record):
+        __slots__ = _fields = ('plain', 'inner')
+
+    extract = compileExtractor([FieldMap('a', 'plain', 'value', 'none'),
+                                FieldMap(('outer', 'b'), 'inner', 'value', -1)])
+    record = Record()
+    extract(record, {'a': 1, 'outer': {'b': 2}}, 0)
+    assert (record.plain, record.inner) == (1, 2)
+    extract(record, {}, 0)
+    assert (record.plain, record.inner) == ('none', -1)
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        compileExtractor([FieldMap('a', 'a', 'other')])
@@ -0,0 +1,79 @@
+"""
+    Ring buffers of the values each collection reported.
+"""
+
+import pytest
+
+from frosolar import Fronius
+from history import MetricHistory, RingBuffer
+
+
+def filled(capacity, count):
+    buffer = RingBuffer(capacity)
+    for number in range(count):
+        buffer.append(float(number), number * 10.0)
+    return buffer
+
+
+def expected(first, last):
+    return [(float(number), number * 10.0) for number in range(first, last)]
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_before_it_is_full():
+    buffer = filled(4, 3)
+    assert (len(buffer), buffer.start) == (3, 0)
+    assert buffer.samples() == expected(0, 3)
+    assert buffer.latest() == (2.0, 20.0)
+    assert RingBuffer(4).latest() is None
+    assert RingBuffer(4).samples() == []
+
+
+@pytest.mark.parametrize('count', [4, 5, 7, 8, 11])
+def test_oldest_samples_are_overwritten(count):
+    buffer = filled(4, count)
+    assert len(buffer) == 4
+    assert buffer.samples() == expected(count - 4, count)
+    assert buffer.latest() == expected(count - 1, count)[0]
+    assert buffer.timestamps[buffer.start] == count - 4
+
+
+def test_views_follow_the_ring():
+    numpy = pytest.importorskip('numpy')
+    buffer = filled(4, 6)
+    views = buffer.views()
+    assert [list(timestamps) for timestamps, _ in views] == [[2.0, 3.0], [4.0, 5.0]]
+    timestamps, values = buffer.arrays()
+    assert list(timestamps) == [2.0, 3.0, 4.0, 5.0] and list(values) == [20.0, 30.0, 40.0, 50.0]
+
+    #   Nothing is copied,  the views see the next sample overwrite the oldest
+    buffer.append(6.0, 60.0)
+    assert views[0][0][0] == 6.0
+    assert numpy.shares_memory(buffer.views()[0][0], views[0][0])
+
+    #   Full with the oldest at the start is one piece and is not copied
+    buffer.append(7.0, 70.0)
+    assert buffer.start == 0 and len(buffer.views()) == 1
+    assert numpy.shares_memory(buffer.arrays()[0], views[0][0])
+
+
+def test_history_of_a_unit(server):
+    history = MetricHistory(['PAC', 'P_Grid'], capacity=3)
+    unit = Fronius(server.host, lazy=True, history=history, cacheTTLs={'CommonInverterData': 0})
+    try:
+        requests = server.requests
+        assert unit.ACPower == 2385
+        #   The same Head.Timestamp again holds the same values and adds no sample
+        assert unit.ACPower == 2385
+        assert server.requests == requests + 2
+        assert [value for _, value in history.samples('PAC')] == [2385]
+        assert history.samples('P_Grid') == []
+        assert 'PAC' in history and 'P_Load' not in history
+    finally:
+        unit.close()
+    with pytest.raises(ValueError):
+        MetricHistory(['Unknown'])
@@ -0,0 +1,86 @@
+"""
+    Keeping the responses that describe a unit on disk.
+"""
+
+import copy
+import os
+import threading
+
+import pytest
+
+from metadatacache import METADATAFORMAT, MetadataCache, readHostsFile, writeHostsFile
+
+HOST = '10.0.3.250'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetadataCache(str(tmp_path / 'metadata.json'))
+
+
+def loggerInfo(payloads, uniqueid):
+    response = copy.deepcopy(payloads['GetLoggerInfo'])
+    response['Body']['LoggerInfo']['UniqueID'] = uniqueid
+    return response
+
+
+def test_stored_responses_are_loaded(cache, payloads):
+    assert cache.load(HOST) is None
+    assert cache.store(HOST, 'APIVersion', payloads['GetAPIVersion']) is False
+    assert cache.store(HOST, 'LoggerInfo', payloads['GetLoggerInfo']) is False
+
+    metadata = MetadataCache(cache.path).load(HOST)
+    assert metadata.responses == {'APIVersion': payloads['GetAPIVersion'], 'LoggerInfo': payloads['GetLoggerInfo']}
+    assert metadata.UniqueID == '240.109876'
+    assert 0 <= metadata.age < 5
+    assert cache.load('10.0.3.251') is None
+
+
+def test_expired_responses_are_left_out(cache, payloads):
+    cache.store(HOST, 'APIVersion', payloads['GetAPIVersion'])
+    cache.store(HOST, 'InverterInfo', payloads['GetInverterInfo'])
+    hosts = readHostsFile(cache.path, METADATAFORMAT)
+    hosts[HOST]['responses']['InverterInfo']['saved'] -= cache.maxAge + 1
+    writeHostsFile(cache.path, METADATAFORMAT, hosts)
+    assert set(cache.load(HOST).responses) == {'APIVersion'}
+
+    hosts[HOST]['responses']['APIVersion']['saved'] -= cache.maxAge + 1
+    writeHostsFile(cache.path, METADATAFORMAT, hosts)
+    assert cache.load(HOST) is None
+
+
+def test_replaced_unit_throws_the_old_metadata_away(cache, payloads):
+    cache.store(HOST, 'APIVersion', payloads['GetAPIVersion'])
+    cache.store(HOST, 'InverterInfo', payloads['GetInverterInfo'])
+    cache.store(HOST, 'LoggerInfo', loggerInfo(payloads, '240.109876'))
+    assert cache.store(HOST, 'LoggerInfo', loggerInfo(payloads, '240.555555')) is True
+    assert cache.load(HOST) is None
+    assert readHostsFile(cache.path, METADATAFORMAT)[HOST]['UniqueID'] == '240.555555'
+
+
+def test_unchanged_response_is_not_written_again(cache, payloads):
+    cache.store(HOST, 'APIVersion', payloads['GetAPIVersion'])
+    saved = os.stat(cache.path).st_mtime_ns
+    os.utime(cache.path, ns=(0, 0))
+    cache.store(HOST, 'APIVersion', payloads['GetAPIVersion'])
+    assert os.stat(cache.path).st_mtime_ns == 0 != saved
+
+
+def test_writes_from_many_threads(cache, payloads):
+    hosts = ['10.0.3.{0}'.format(number) for number in range(16)]
+    errors = []
+
+    def store(host):
+        try:
+            MetadataCache(cache.path).store(host, 'APIVersion', payloads['GetAPIVersion'])
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=store, args=(host,)) for host in hosts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert set(readHostsFile(cache.path, METADATAFORMAT)) == set(hosts)
+    assert os.listdir(os.path.dirname(cache.path)) == ['metadata.json']
@@ -0,0 +1,82 @@
+"""
+    Polling intervals that follow what the inverter is doing.
+"""
+
+import copy
+import json
+import time
+
+import pytest
+
+from frosolar import DAYPOLLINTERVALS, AdaptivePollingSchedule, Fronius
+
+COMMON = 'GetInverterRealtimeData_CommonInverterData'
+
+#   Hours that are always day and always night,  whatever the time the tests run
+ALWAYSDAY = {'dayStart': 0, 'dayEnd': 24}
+ALWAYSNIGHT = {'dayStart': 0, 'dayEnd': 0}
+
+
+@pytest.fixture
+def unit(server):
+    fronius = Fronius(server.host, lazy=True, pollingSchedule=AdaptivePollingSchedule(**ALWAYSDAY))
+    yield fronius
+    fronius.close()
+
+
+def serve(server, payloads, change):
+    """
+    Serve CommonInverterData changed by a function of the decoded response.
+    """
+    response = copy.deepcopy(payloads[COMMON])
+    change(response['Body']['Data'])
+    server.payloads[COMMON] = json.dumps(response).encode('utf-8')
+
+
+def intervals(schedule, unit):
+    return {collection: schedule.interval(unit, collection)
+            for collection in ('CommonInverterData', 'MinMaxInverterData', 'LoggerLEDInfo', 'MeterRealtimeData',
+                               'InverterInfo')}
+
+
+def test_day(unit):
+    assert unit.ACPower == 2385
+    schedule = unit.pollingSchedule
+    assert schedule.state(unit) == 'Day'
+    assert intervals(schedule, unit) == {'CommonInverterData': 10, 'MinMaxInverterData': 300, 'LoggerLEDInfo': 60,
+                                         'MeterRealtimeData': 5, 'InverterInfo': 3600}
+    assert schedule.interval(unit, 'Unknown') == schedule.defaultInterval
+    assert unit._collectionTTL('CommonInverterData') == DAYPOLLINTERVALS['CommonInverterData']
+
+
+@pytest.mark.parametrize('change', [lambda data: data['DeviceStatus'].update(StatusCode=8),
+                                    lambda data: data.pop('PAC')], ids=['StatusCode', 'NoPAC'])
+def test_standby(server, payloads, unit, change):
+    serve(server, payloads, change)
+    unit.ACPower
+    schedule = unit.pollingSchedule
+    assert schedule.state(unit) == 'Standby'
+    assert intervals(schedule, unit) == {'CommonInverterData': 60, 'MinMaxInverterData': 900, 'LoggerLEDInfo': 360,
+                                         'MeterRealtimeData': 5, 'InverterInfo': 3600}
+    assert unit._collectionTTL('CommonInverterData') == 60
+
+
+def test_night(unit):
+    schedule = AdaptivePollingSchedule(**ALWAYSNIGHT)
+    assert schedule.state(unit) == 'Night'
+    #   Backed off up to maxInterval.   A collection polled less often than that by day is left alone
+    assert intervals(schedule, unit) == {'CommonInverterData': 300, 'MinMaxInverterData': 900, 'LoggerLEDInfo': 900,
+                                         'MeterRealtimeData': 5, 'InverterInfo': 3600}
+    slow = AdaptivePollingSchedule(dayIntervals={'CommonInverterData': 1200}, **ALWAYSNIGHT)
+    assert slow.interval(unit, 'CommonInverterData') == 1200
+
+
+def test_nothing_fetched_yet_is_day(unit, server):
+    requests = server.requests
+    assert unit.pollingSchedule.state(unit) == 'Day'
+    assert server.requests == requests
+
+
+def test_hour_is_the_inverters(unit):
+    assert unit.UTCOffset == 36000
+    assert unit.pollingSchedule.localHour(unit) == time.gmtime(time.time() + 36000).tm_hour
@@ -0,0 +1,107 @@
+"""
+    Serving stale values while the collection is fetched again in the background.
+"""
+
+import copy
+import json
+import time
+
+import pytest
+
+from frosolar import Fronius
+
+COMMON = 'GetInverterRealtimeData_CommonInverterData'
+
+
+@pytest.fixture
+def unit(server):
+    """
+    :return:    Fronius serving stale values,  with CommonInverterData already fetched
+    """
+    fronius = Fronius(server.host, lazy=True, staleWhileRevalidate=True, maxStaleness=60)
+    assert fronius.ACPower == 2385
+    yield fronius
+    fronius.close()
+
+
+def serve(server, payloads, power=None, body=None):
+    """
+    Change what the fake Datamanager answers for CommonInverterData.
+    """
+    response = copy.deepcopy(payloads[COMMON])
+    if power is not None:
+        response['Body']['Data']['PAC']['Value'] = power
+    if body is not None:
+        response['Body'] = body
+    response['Head']['Timestamp'] = 'later'
+    server.payloads[COMMON] = json.dumps(response).encode('utf-8')
+
+
+def age(unit, seconds):
+    """
+    Make CommonInverterData look as if it was fetched that many seconds past its TTL.
+    """
+    unit.cache.stored('CommonInverterData', unit.cache.ttl('CommonInverterData') + seconds)
+
+
+def settle(unit):
+    """
+    Wait for the background refreshes to finish.
+    """
+    deadline = time.monotonic() + 5
+    while unit._revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not unit._revalidating
+
+
+def test_stale_value_is_served_then_refreshed(server, payloads, unit):
+    serve(server, payloads, power=1000)
+    age(unit, 5)
+    stale = unit.read('ACPower')
+    assert (stale.value, stale.stale) == (2385, True)
+    settle(unit)
+    fresh = unit.read('ACPower')
+    assert (fresh.value, fresh.stale, fresh.error) == (1000, False, None)
+
+
+def test_single_background_refresh(server, payloads, unit):
+    serve(server, payloads, power=1000)
+    server.responseDelay = 0.3
+    age(unit, 5)
+    requests = server.requests
+    assert [unit.ACPower for _ in range(10)] == [2385] * 10
+    settle(unit)
+    assert server.requests == requests + 1
+    assert unit.ACPower == 1000
+
+
+def test_too_stale_waits_for_the_fetch(server, payloads, unit):
+    serve(server, payloads, power=1000)
+    age(unit, unit.maxStaleness + 5)
+    assert unit.ACPower == 1000
+    assert not unit._revalidating
+
+
+def test_background_error_is_reported_by_read(server, payloads, unit):
+    serve(server, payloads, body={})
+    age(unit, 5)
+    unit.ACPower
+    settle(unit)
+    aged = unit.read('ACPower')
+    assert (aged.value, aged.stale) == (2385, True)
+    assert isinstance(aged.error, ValueError)
+
+    serve(server, payloads, power=1000)
+    unit.ACPower
+    settle(unit)
+    assert unit.read('ACPower').error is None
+
+
+def test_nothing_is_revalidated_after_close(server, payloads, unit):
+    serve(server, payloads, power=1000)
+    unit.close()
+    age(unit, 5)
+    requests = server.requests
+    assert unit.ACPower == 2385
+    assert not unit._revalidating
+    assert server.requests == requests
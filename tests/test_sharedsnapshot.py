@@ -0,0 +1,119 @@
+"""
+    Publishing snapshots into shared memory and reading them from other processes.
+"""
+
+import itertools
+import multiprocessing
+import os
+
+import pytest
+
+import sharedsnapshot
+from frosolar import Snapshot, SnapshotTimes
+from sharedsnapshot import SEQUENCE, SEQUENCEOFFSET, SHAREDPROPERTIES, SharedFronius, SnapshotPublisher
+
+#   Block names are unique to each test run
+_names = itertools.count()
+
+#   Snapshots published by publishMany()
+PUBLISHES = 2000
+
+
+def blockName():
+    return 'frosolar_test_{0}_{1}'.format(os.getpid(), next(_names))
+
+
+def numbered(number):
+    """
+    :return:    Snapshot with every value and fetched time set to the same number
+    """
+    return Snapshot(**dict.fromkeys(SHAREDPROPERTIES, float(number)),
+                    fetched=SnapshotTimes(*[float(number)] * len(SnapshotTimes._fields)))
+
+
+def publishMany(name, created, attached):
+    """
+    Body of the publishing process.   Starts once the reader has attached and removes the block when done.
+    """
+    publisher = SnapshotPublisher(None, name)
+    created.set()
+    attached.wait(30)
+    for number in range(1, PUBLISHES + 1):
+        publisher.publish(numbered(number))
+    publisher.close()
+
+
+@pytest.fixture
+def publisher():
+    published = SnapshotPublisher(None, blockName())
+    yield published
+    published.close()
+
+
+def test_nothing_published_reads_as_none(publisher):
+    with SharedFronius(name=publisher.name) as shared:
+        assert shared.snapshot() == Snapshot(**dict.fromkeys(SHAREDPROPERTIES),
+                                             fetched=SnapshotTimes(*[None] * len(SnapshotTimes._fields)))
+        assert (shared.sequence, shared.published, shared.ACPower) == (0, None, None)
+
+
+def test_every_property_is_published(fronius, publisher):
+    published = publisher.publish(fronius.snapshot())
+    with SharedFronius(name=publisher.name) as shared:
+        assert shared.snapshot() == published
+        assert shared.sequence == 1
+        assert shared.ACPower == 2385
+        assert shared.DeviceStatusCode == 7
+        assert shared.InverterCustomName == 'Symo Hybrid'
+        assert shared.LoggerUniqueID == '240.109876'
+        assert shared.UTCOffset == 36000
+        assert shared.PowerLEDColor == 'green'
+        assert shared.published is not None
+    for name in SHAREDPROPERTIES:
+        assert getattr(fronius, name) == getattr(published, name), name
+
+
+def test_reads_are_never_torn():
+    name = blockName()
+    context = multiprocessing.get_context('spawn')
+    created = context.Event()
+    attached = context.Event()
+    process = context.Process(target=publishMany, args=(name, created, attached))
+    process.start()
+    try:
+        assert created.wait(30)
+        with SharedFronius(name=name) as shared:
+            attached.set()
+            seen = set()
+            while process.is_alive():
+                snapshot = shared.snapshot()
+                values = set(snapshot[:-1]) | set(snapshot.fetched)
+                assert len(values) == 1, snapshot
+                seen |= values
+            assert shared.snapshot().ACPower == PUBLISHES
+    finally:
+        attached.set()
+        process.join()
+    assert process.exitcode == 0
+    assert len(seen) > 1
+
+
+def test_update_that_never_finishes(publisher, monkeypatch):
+    publisher.publish(numbered(1))
+    monkeypatch.setattr(sharedsnapshot, 'MAXREADATTEMPTS', 50)
+    with SharedFronius(name=publisher.name) as shared:
+        SEQUENCE.pack_into(publisher.block.buf, SEQUENCEOFFSET, 3)
+        with pytest.raises(ValueError):
+            shared.snapshot()
+        with pytest.raises(ValueError):
+            shared.ACPower
+        SEQUENCE.pack_into(publisher.block.buf, SEQUENCEOFFSET, 4)
+        assert shared.ACPower == 1.0
+
+
+def test_block_of_another_layout_is_refused(publisher):
+    publisher.block.buf[4] = 0
+    with pytest.raises(ValueError):
+        SharedFronius(name=publisher.name)
+    with pytest.raises(ValueError):
+        SharedFronius(name=blockName())
@@ -0,0 +1,60 @@
+"""
+    Concurrent reads of stale values sharing one request.
+"""
+
+import threading
+
+from fakedatamanager import FakeDatamanager
+from frosolar import Fronius
+
+THREADS = 16
+
+
+def readTogether(unit, names):
+    """
+    Read properties from THREADS threads at once,  each thread reading one of the names in turn.
+    :return:    List of (name, value or the exception raised)
+    """
+    barrier = threading.Barrier(THREADS)
+    results = []
+
+    def reader(name):
+        barrier.wait()
+        try:
+            results.append((name, getattr(unit, name)))
+        except Exception as err:
+            results.append((name, err))
+
+    workers = [threading.Thread(target=reader, args=(names[index % len(names)],)) for index in range(THREADS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_one_request_per_collection():
+    with FakeDatamanager(responseDelay=0.2) as server:
+        unit = Fronius(server.host, lazy=True, poolSize=THREADS)
+        before = server.requests
+        results = readTogether(unit, ['ACPower', 'ACVoltage', 'PowerReal_P_Sum'])
+        assert server.requests == before + 2
+        assert {name: value for name, value in results} == {'ACPower': 2385, 'ACVoltage': 241.2,
+                                                            'PowerReal_P_Sum': -1371.54}
+        assert unit._flights == {}
+        unit.close()
+
+
+def test_leader_error_reaches_every_waiter():
+    with FakeDatamanager(responseDelay=0.2) as server:
+        server.payloads['GetInverterRealtimeData_CommonInverterData'] = \
+            b'{"Head": {"Status": {"Code": 0}, "Timestamp": "now"}, "Body": {}}'
+        unit = Fronius(server.host, lazy=True, poolSize=THREADS)
+        before = server.requests
+        results = readTogether(unit, ['ACPower'])
+        assert server.requests == before + 1
+        assert len(results) == THREADS
+        assert all(isinstance(value, ValueError) for _, value in results)
+        assert len({id(value) for _, value in results}) == 1
+        assert unit._flights == {}
+        unit.close()
@@ -0,0 +1,78 @@
+"""
+    Every value of the collections taken at one moment.
+"""
+
+import copy
+import json
+import time
+
+import pytest
+
+from frosolar import SNAPSHOTPROPERTIES, Fronius, Snapshot
+
+COMMON = 'GetInverterRealtimeData_CommonInverterData'
+REALTIME = ['CommonInverterData', '3PInverterData', 'MeterRealtimeData', 'PowerFlowRealtimeData']
+
+
+@pytest.fixture
+def expired(server):
+    """
+    :return:    Fronius whose collections are stale as soon as they are fetched
+    """
+    fronius = Fronius(server.host, lazy=True, cacheTTLs=dict.fromkeys(SNAPSHOTPROPERTIES, 0))
+    yield fronius
+    fronius.close()
+
+
+def test_one_request_per_collection(server, expired):
+    #   Property by property every read fetches again
+    requests = server.requests
+    values = [getattr(expired, name) for name in SNAPSHOTPROPERTIES['CommonInverterData']]
+    assert server.requests == requests + len(values)
+
+    requests = server.requests
+    snapshot = expired.snapshot(REALTIME)
+    assert server.requests == requests + len(REALTIME)
+    assert [getattr(snapshot, name) for name in SNAPSHOTPROPERTIES['CommonInverterData']] == values
+    assert (snapshot.ACPower, snapshot.ACVoltsPH1, snapshot.PowerReal_P_Sum, snapshot.Power_PV) == \
+           (2385, 241.8, -1371.54, 2385)
+
+
+def test_values_are_from_one_response(server, payloads, expired):
+    before = expired.snapshot(['CommonInverterData'])
+    response = copy.deepcopy(payloads[COMMON])
+    data = response['Body']['Data']
+    data['PAC']['Value'] = 1000
+    data['UAC']['Value'] = 230.5
+    data['DeviceStatus']['StatusCode'] = 8
+    #   A response with the Head.Timestamp of the last one would not be stored again
+    response['Head']['Timestamp'] = '2018-06-12T14:31:27+10:00'
+    server.payloads[COMMON] = json.dumps(response).encode('utf-8')
+
+    after = expired.snapshot(['CommonInverterData'])
+    assert (before.ACPower, before.ACVoltage, before.DeviceStatusCode) == (2385, 241.2, 7)
+    assert (after.ACPower, after.ACVoltage, after.DeviceStatusCode) == (1000, 230.5, 8)
+    assert after.Day_Energy == before.Day_Energy
+    assert after.fetched.CommonInverterValues >= before.fetched.CommonInverterValues
+
+
+def test_collections_not_asked_for_are_none(fronius):
+    start = time.time()
+    snapshot = fronius.snapshot(['CommonInverterData'])
+    assert start - 1 <= snapshot.fetched.CommonInverterValues <= time.time()
+    assert snapshot.fetched.MeterRealTimeData is None
+    assert all(getattr(snapshot, name) is None for name in SNAPSHOTPROPERTIES['MeterRealtimeData'])
+    assert snapshot.ACPower == 2385
+
+
+def test_snapshot_is_immutable(fronius):
+    snapshot = fronius.snapshot(['CommonInverterData'])
+    assert isinstance(snapshot, Snapshot)
+    with pytest.raises(AttributeError):
+        snapshot.ACPower = 0
+    assert not hasattr(snapshot, '__dict__')
+
+
+def test_unknown_collection(fronius):
+    with pytest.raises(ValueError):
+        fronius.snapshot(['ActiveDeviceInfo'])